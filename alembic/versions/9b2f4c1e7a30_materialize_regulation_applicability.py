@@ -0,0 +1,159 @@
+"""Materialize regulation applicability
+
+Revision ID: 9b2f4c1e7a30
+Revises: 6d611d61d27a
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2f4c1e7a30'
+down_revision: Union[str, Sequence[str], None] = '6d611d61d27a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Model family hierarchy: every designation code an aircraft model answers to
+    op.create_table('aircraft_model_families',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('code', sa.String(100), nullable=False),
+        sa.Column('aircraft_model_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('level', sa.String(10), nullable=False),
+        sa.ForeignKeyConstraint(['aircraft_model_id'], ['aircraft_models.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_aircraft_model_families_code', 'aircraft_model_families', ['code', 'aircraft_model_id'], unique=True)
+    op.create_index('idx_aircraft_model_families_model', 'aircraft_model_families', ['aircraft_model_id'], unique=False)
+
+    # Denormalized authority on the join table for (aircraft_model_id, authority_id) lookups
+    op.add_column('regulation_models', sa.Column('authority_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('fk_regulation_models_authority', 'regulation_models', 'authorities', ['authority_id'], ['id'])
+    op.create_index('idx_regulation_models_model_authority', 'regulation_models', ['aircraft_model_id', 'authority_id', 'regulation_id'], unique=False)
+
+    _backfill()
+
+
+# Alias groups as of this revision (first entry canonical); frozen here rather than imported
+ALIAS_GROUPS = (
+    ("KC-390", "C-390", "C-390-MILLENNIUM", "KC-390-MILLENNIUM"),
+    ("PHENOM-300E", "PHENOM-300"),
+    ("PHENOM-100EX", "PHENOM-100"),
+    ("PRAETOR-500", "LEGACY-450"),
+    ("PRAETOR-600", "LEGACY-500"),
+    ("A-29", "SUPER-TUCANO", "EMB-314"),
+    ("EMB-203", "IPANEMA"),
+    ("737", "B737", "BOEING-737"),
+    ("737-800", "B737-800"),
+    ("A320", "AIRBUS-A320"),
+    ("E170", "ERJ-170"),
+    ("E175", "ERJ-175"),
+    ("E190", "ERJ-190"),
+    ("E195", "ERJ-195"),
+)
+
+
+def _backfill() -> None:
+    """Populate the family table and regulation_models from the JSON applicability lists.
+
+    Mirrors ``designation_codes`` and ``materialize_applicability`` as of this
+    revision: variant and family codes per aircraft model, exact-or-family
+    matching with case and separators ignored, aliases resolved to the first
+    group member backed by aircraft models, and an empty list applying to all.
+    """
+    # Variant code first, so a code that is both keeps the 'variant' level
+    op.execute("""
+        WITH codes AS (
+            SELECT id, upper(trim(model)) AS m, upper(trim(coalesce(variant, ''))) AS v
+            FROM aircraft_models
+        ), designations AS (
+            SELECT id,
+                CASE WHEN v = '' THEN m
+                     WHEN left(v, length(m)) = m THEN v
+                     WHEN right(m, length(v) + 1) = '-' || v THEN m
+                     ELSE m || '-' || v END AS variant_code,
+                CASE WHEN v = '' THEN substring(m FROM '^([A-Z]*[0-9]+[A-Z]*)-(E[0-9]|[0-9]{3})$')
+                     WHEN left(v, length(m)) = m THEN nullif(m, v)
+                     WHEN right(m, length(v) + 1) = '-' || v THEN left(m, length(m) - length(v) - 1)
+                     ELSE m END AS family_code
+            FROM codes
+        ), all_codes AS (
+            SELECT variant_code AS code, id, 'variant' AS level, 0 AS priority FROM designations
+            UNION ALL
+            SELECT family_code, id, 'family', 1 FROM designations WHERE family_code IS NOT NULL
+        )
+        INSERT INTO aircraft_model_families (id, code, aircraft_model_id, level)
+        SELECT gen_random_uuid(), code, id, level
+        FROM (
+            SELECT DISTINCT ON (code, id) code, id, level
+            FROM all_codes
+            WHERE code <> ''
+            ORDER BY code, id, priority
+        ) unique_codes
+    """)
+
+    aliases = ", ".join(
+        f"({group_id}, {position}, '{alias}')"
+        for group_id, group in enumerate(ALIAS_GROUPS)
+        for position, alias in enumerate(group)
+    )
+    op.execute("DELETE FROM regulation_models")
+    op.execute(f"""
+        WITH alias_groups (group_id, position, code) AS (
+            VALUES {aliases}
+        ), family_keys AS (
+            SELECT DISTINCT regexp_replace(code, '[^A-Z0-9]', '', 'g') AS key, aircraft_model_id
+            FROM aircraft_model_families
+        ), entries AS (
+            SELECT r.id AS regulation_id, regexp_replace(upper(raw.entry), '[^A-Z0-9]', '', 'g') AS key
+            FROM regulations r
+            CROSS JOIN LATERAL (
+                SELECT json_array_elements_text(r.content::json -> 'applicable_models') AS entry
+                WHERE json_typeof(r.content::json -> 'applicable_models') = 'array'
+                UNION ALL
+                SELECT unnest(string_to_array(r.content::json ->> 'applicable_models', ','))
+                WHERE json_typeof(r.content::json -> 'applicable_models') = 'string'
+            ) raw
+            WHERE trim(raw.entry) <> ''
+        ), alias_keys AS (
+            SELECT group_id, position, regexp_replace(code, '[^A-Z0-9]', '', 'g') AS key FROM alias_groups
+        ), candidates AS (
+            SELECT e.regulation_id, e.key AS entry, e.key, -1 AS priority FROM entries e
+            UNION ALL
+            SELECT e.regulation_id, e.key, member.key, member.position
+            FROM entries e
+            JOIN alias_keys own ON own.key = e.key
+            JOIN alias_keys member ON member.group_id = own.group_id
+        ), resolved AS (
+            SELECT DISTINCT ON (c.regulation_id, c.entry) c.regulation_id, c.key
+            FROM candidates c
+            WHERE EXISTS (SELECT 1 FROM family_keys f WHERE f.key = c.key)
+            ORDER BY c.regulation_id, c.entry, c.priority
+        )
+        INSERT INTO regulation_models (regulation_id, aircraft_model_id, authority_id)
+        SELECT DISTINCT r.id, f.aircraft_model_id, r.authority_id
+        FROM regulations r
+        JOIN resolved ON resolved.regulation_id = r.id
+        JOIN family_keys f ON f.key = resolved.key
+        UNION
+        SELECT r.id, f.aircraft_model_id, r.authority_id
+        FROM regulations r
+        CROSS JOIN (SELECT DISTINCT aircraft_model_id FROM aircraft_model_families) f
+        WHERE NOT EXISTS (SELECT 1 FROM entries e WHERE e.regulation_id = r.id)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_regulation_models_model_authority', table_name='regulation_models')
+    op.drop_constraint('fk_regulation_models_authority', 'regulation_models', type_='foreignkey')
+    op.drop_column('regulation_models', 'authority_id')
+    op.drop_index('idx_aircraft_model_families_model', table_name='aircraft_model_families')
+    op.drop_index('idx_aircraft_model_families_code', table_name='aircraft_model_families')
+    op.drop_table('aircraft_model_families')
@@ -0,0 +1,82 @@
+"""Partitioned compliance history
+
+Revision ID: c4d81a9e2f17
+Revises: 9b2f4c1e7a30
+Create Date: 2026-10-19 11:02:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d81a9e2f17'
+down_revision: Union[str, Sequence[str], None] = '9b2f4c1e7a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Parent table; monthly children are attached on first write by ComplianceHistoryRepository
+    op.execute("""
+        CREATE TABLE compliance_check_history (
+            id UUID NOT NULL,
+            aircraft_model_id UUID NOT NULL,
+            regulation_id UUID NOT NULL,
+            check_date TIMESTAMP NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            compliance_percentage DOUBLE PRECISION,
+            checked_by VARCHAR(100),
+            details JSON,
+            PRIMARY KEY (id, check_date)
+        ) PARTITION BY RANGE (check_date)
+    """)
+    op.create_index('idx_compliance_check_history_model_date', 'compliance_check_history', ['aircraft_model_id', 'check_date'], unique=False)
+
+    # Seed history with the checks recorded so far
+    op.execute("""
+        DO $$
+        DECLARE month_start DATE;
+        BEGIN
+            FOR month_start IN
+                SELECT DISTINCT date_trunc('month', check_date)::date FROM compliance_checks
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF compliance_check_history FOR VALUES FROM (%L) TO (%L)',
+                    'compliance_check_history_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM'),
+                    month_start, (month_start + INTERVAL '1 month')::date
+                );
+            END LOOP;
+        END $$;
+    """)
+    op.execute("""
+        INSERT INTO compliance_check_history
+            (id, aircraft_model_id, regulation_id, check_date, status, compliance_percentage, checked_by, details)
+        SELECT id, aircraft_model_id, regulation_id, check_date, status, compliance_percentage, checked_by, details
+        FROM compliance_checks
+    """)
+
+    op.create_table('compliance_check_daily',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('aircraft_model_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('check_count', sa.Integer(), nullable=False),
+        sa.Column('percentage_sum', sa.Float(), nullable=False),
+        sa.Column('percentage_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_compliance_check_daily_model_day', 'compliance_check_daily', ['aircraft_model_id', 'day'], unique=False)
+    op.create_index('idx_compliance_check_daily_day', 'compliance_check_daily', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_compliance_check_daily_day', table_name='compliance_check_daily')
+    op.drop_index('idx_compliance_check_daily_model_day', table_name='compliance_check_daily')
+    op.drop_table('compliance_check_daily')
+    # Dropping the parent drops every monthly partition
+    op.execute("DROP TABLE compliance_check_history")
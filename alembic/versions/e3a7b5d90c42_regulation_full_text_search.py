@@ -0,0 +1,37 @@
+"""Regulation full-text search
+
+Revision ID: e3a7b5d90c42
+Revises: c4d81a9e2f17
+Create Date: 2026-10-19 14:26:08.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7b5d90c42'
+down_revision: Union[str, Sequence[str], None] = 'c4d81a9e2f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated column: PostgreSQL keeps it in sync on every insert/update, no trigger needed
+    op.execute("""
+        ALTER TABLE regulations ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(reference, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(title, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(content::text, '')), 'D')
+        ) STORED
+    """)
+    op.execute("CREATE INDEX idx_regulations_search_vector ON regulations USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX idx_regulations_search_vector")
+    op.execute("ALTER TABLE regulations DROP COLUMN search_vector")
@@ -0,0 +1,17 @@
+"""
+Reproducible benchmark suite for the compliance API.
+
+Seeds a synthetic database of configurable size, drives the real ASGI
+application in-process with httpx according to a load profile, reports
+throughput and p50/p95/p99 latency per endpoint as JSON, and compares the
+run against a stored baseline to flag regressions.
+
+Usage:
+    python -m benchmarks [--aircraft 200] [--regulations 2000] [--authorities 5]
+                         [--profile benchmarks/profiles/default.json]
+                         [--output results.json] [--baseline benchmarks/baseline.json]
+                         [--save-baseline] [--tolerance 0.25]
+
+The same profile drives a deployed instance through Locust
+(``tests/performance/locustfile.py``).
+"""
@@ -0,0 +1,136 @@
+"""
+Command line entry point: ``python -m benchmarks --help``.
+
+Settings are read once when ``src.config`` is imported, so the database URL and
+the feature switches are put in the environment before anything under ``src``
+is imported.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.baseline import compare, load_baseline, save_baseline
+from benchmarks.profile import DEFAULT_PROFILE, LoadProfile
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _configure_environment(database_path: str, args: argparse.Namespace) -> None:
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{database_path}"
+    os.environ["DATABASE_CREATE_TABLES"] = "true"
+    os.environ["CACHE_ENABLED"] = "true" if args.cache else "false"
+    os.environ["RATE_LIMIT_ENABLED"] = "false"  # one client would hit its own bucket limit
+    os.environ["AI_CACHE_WARM_ON_STARTUP"] = "false"
+    os.environ["AI_PRELOAD_MODELS"] = "false"
+    os.environ["LOG_LEVEL"] = args.log_level  # keeps stdout clean for the JSON results
+
+
+async def _run(args: argparse.Namespace, profile: LoadProfile) -> dict:
+    from benchmarks.dataset import DatasetSpec, seed_dataset
+    from benchmarks.runner import run_load
+    from src.database import AsyncSessionLocal, create_tables
+    from src.main import app
+
+    spec = DatasetSpec(aircraft=args.aircraft, regulations=args.regulations, authorities=args.authorities,
+                       fleet=args.fleet, history=args.history, seed=args.seed)
+    started = time.perf_counter()
+    await create_tables()
+    async with AsyncSessionLocal() as session:
+        rows = await seed_dataset(session, spec)
+    seed_seconds = time.perf_counter() - started
+
+    async with app.router.lifespan_context(app):
+        result = await run_load(app, profile, requests=args.requests, concurrency=args.concurrency)
+
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "cache_enabled": args.cache,
+        },
+        "dataset": {**spec.to_dict(), "rows": rows, "seed_seconds": round(seed_seconds, 3)},
+        **result,
+    }
+
+
+def _print_summary(result: dict) -> None:
+    print(f"📊 {result['profile']}: {result['overall']['requests']} requests, "
+          f"concurrency {result['concurrency']}, {result['overall']['throughput_rps']:.0f} req/s", file=sys.stderr)
+    print(f"{'endpoint':<28} {'requests':>8} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}", file=sys.stderr)
+    for name, stats in [*result["endpoints"].items(), ("overall", result["overall"])]:
+        print(f"{name:<28} {stats['requests']:>8} {stats['errors']:>6} "
+              f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}", file=sys.stderr)
+
+
+def _check_baseline(result: dict, args: argparse.Namespace) -> int:
+    if not os.path.exists(args.baseline):
+        print(f"⚠️  no baseline at {args.baseline}; record one with --save-baseline", file=sys.stderr)
+        return 0
+    baseline = load_baseline(args.baseline)
+    dataset_keys = ("aircraft", "regulations", "authorities", "fleet", "history", "seed")
+    if baseline.get("profile") != result["profile"] or any(
+        baseline.get("dataset", {}).get(key) != result["dataset"][key] for key in dataset_keys
+    ):
+        print("⚠️  baseline was recorded with a different profile or dataset", file=sys.stderr)
+
+    regressions = compare(result, baseline, tolerance=args.tolerance)
+    if not regressions:
+        print(f"✓ no regressions against {args.baseline} (tolerance {args.tolerance:.0%})", file=sys.stderr)
+        return 0
+    for regression in regressions:
+        print(f"✗ {regression}", file=sys.stderr)
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the compliance API in-process")
+    parser.add_argument("--aircraft", type=int, default=200, help="Aircraft model rows to seed")
+    parser.add_argument("--regulations", type=int, default=2000, help="Regulation rows to seed")
+    parser.add_argument("--authorities", type=int, default=5, help="Authority rows to seed")
+    parser.add_argument("--fleet", type=int, default=0, help="Aircraft tails to seed")
+    parser.add_argument("--history", type=int, default=0, help="Compliance check history rows to seed")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset random seed")
+    parser.add_argument("--profile", default=str(DEFAULT_PROFILE), help="Load profile JSON file")
+    parser.add_argument("--requests", type=int, help="Measured requests (overrides the profile)")
+    parser.add_argument("--concurrency", type=int, help="Requests in flight (overrides the profile)")
+    parser.add_argument("--cache", action="store_true", help="Enable the report cache (local tier; Redis if reachable)")
+    parser.add_argument("--output", help="Write the JSON results here instead of stdout")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 when the run regresses against the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative change before a regression")
+    parser.add_argument("--log-level", default="ERROR", help="Application log level during the run")
+    args = parser.parse_args()
+
+    profile = LoadProfile.load(args.profile)
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as directory:
+        _configure_environment(os.path.join(directory, "benchmark.db"), args)
+        result = asyncio.run(_run(args, profile))
+
+    _print_summary(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2, sort_keys=True)
+            stream.write("\n")
+    else:
+        print(json.dumps(result, indent=2, sort_keys=True))
+
+    exit_code = _check_baseline(result, args) if args.compare else 0
+    if args.save_baseline:
+        save_baseline(args.baseline, result)
+        print(f"💾 baseline saved to {args.baseline}", file=sys.stderr)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
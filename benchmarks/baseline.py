@@ -0,0 +1,101 @@
+"""
+Regression check of a benchmark run against a stored baseline.
+
+Latency percentiles regress when they grow by more than the tolerance and by
+more than a small absolute floor, so sub-millisecond jitter is ignored; a
+percentile is only compared once enough requests back it. Throughput
+regresses when it drops by more than the tolerance, and any rise in the error
+rate is a regression. Endpoints missing from either run are skipped, so
+adding an endpoint to a profile does not fail the comparison.
+
+Baselines are machine-specific: record one on the hardware that runs the
+comparison, e.g. in CI, with ``python -m benchmarks --save-baseline``.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+# Percentile -> fewest samples (in both runs) for it to be more than a single outlier
+LATENCY_METRICS = {"p50_ms": 1, "p95_ms": 20, "p99_ms": 100}
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than the baseline allows."""
+
+    endpoint: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change; positive means higher than the baseline."""
+        if not self.baseline:
+            return float("inf") if self.current else 0.0
+        return (self.current - self.baseline) / self.baseline
+
+    def __str__(self) -> str:
+        return f"{self.endpoint} {self.metric}: {self.baseline:g} -> {self.current:g} ({self.change:+.0%})"
+
+
+def _error_rate(stats: Dict[str, Any]) -> float:
+    return stats["errors"] / stats["requests"] if stats.get("requests") else 0.0
+
+
+def _compare_stats(endpoint: str, current: Dict[str, Any], baseline: Dict[str, Any],
+                   tolerance: float, min_delta_ms: float) -> List[Regression]:
+    regressions = []
+    samples = min(current.get("requests", 0), baseline.get("requests", 0))
+    for metric, min_samples in LATENCY_METRICS.items():
+        if samples < min_samples:
+            continue
+        before, after = baseline.get(metric, 0.0), current.get(metric, 0.0)
+        if after > before * (1 + tolerance) and after - before > min_delta_ms:
+            regressions.append(Regression(endpoint, metric, before, after))
+
+    before, after = baseline.get("throughput_rps", 0.0), current.get("throughput_rps", 0.0)
+    if after < before * (1 - tolerance):
+        regressions.append(Regression(endpoint, "throughput_rps", before, after))
+
+    before, after = _error_rate(baseline), _error_rate(current)
+    if after > before:
+        regressions.append(Regression(endpoint, "error_rate", round(before, 4), round(after, 4)))
+    return regressions
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float = 0.25, min_delta_ms: float = 1.0) -> List[Regression]:
+    """Regressions of ``current`` against ``baseline``.
+
+    Args:
+        current: Result of ``run_load`` (or a saved results file)
+        baseline: Earlier result to compare against
+        tolerance: Allowed relative change, e.g. 0.25 for 25%
+        min_delta_ms: Latency increases below this many milliseconds are ignored
+
+    Returns:
+        Overall regressions first, then per endpoint in name order
+    """
+    regressions = _compare_stats("overall", current["overall"], baseline["overall"], tolerance, min_delta_ms)
+    for endpoint in sorted(current.get("endpoints", {})):
+        if endpoint in baseline.get("endpoints", {}):
+            regressions.extend(_compare_stats(
+                endpoint, current["endpoints"][endpoint], baseline["endpoints"][endpoint],
+                tolerance, min_delta_ms,
+            ))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """Read a stored baseline results file."""
+    with open(path, encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def save_baseline(path: str, result: Dict[str, Any]) -> None:
+    """Store ``result`` as the baseline for later runs."""
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(result, stream, indent=2, sort_keys=True)
+        stream.write("\n")
@@ -0,0 +1,368 @@
+"""
+Synthetic compliance data for benchmarks and scale tests.
+
+Builds authorities, aircraft models and regulations (the catalog), aircraft
+tails (the fleet) and compliance check history from seeded random generators,
+so a given ``DatasetSpec`` always yields the same rows, and writes them with
+chunked bulk inserts. The real designations and authorities the API accepts
+(E175/E190/E195 variants, 737, A320; FAA, ANAC, EASA) are always part of the
+catalog, so every endpoint in a load profile resolves against it; synthetic
+families and authorities make up the requested size.
+
+Fleet and history rows are generated lazily, chunk by chunk, so a catalog of
+50k regulations with 100k tails and millions of history rows is written in
+bounded memory. Dates are relative to ``DatasetSpec.as_of``.
+"""
+
+import random
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.db_models_sqlite import Aircraft, AircraftModel, Authority, Regulation
+from src.repositories.compliance_history import ComplianceHistoryRepository
+from src.services.applicability_service import designation_codes, materialize_applicability
+from src.services.content_version import content_version
+from src.services.model_resolver import model_resolver
+
+
+_INSERT_CHUNK = 1000
+_HISTORY_CHUNK = 10000
+
+# (code, name, ISO 3166-1 alpha-3); the first three back the USA/BRAZIL/EUROPE checks
+REAL_AUTHORITIES = [
+    ("FAA", "Federal Aviation Administration", "USA"),
+    ("ANAC", "Agência Nacional de Aviação Civil", "BRA"),
+    ("EASA", "European Union Aviation Safety Agency", "EUR"),
+    ("TCCA", "Transport Canada Civil Aviation", "CAN"),
+    ("UKCAA", "UK Civil Aviation Authority", "GBR"),
+    ("CASA", "Civil Aviation Safety Authority", "AUS"),
+    ("DGCA", "Directorate General of Civil Aviation", "IND"),
+    ("JCAB", "Japan Civil Aviation Bureau", "JPN"),
+]
+
+# (manufacturer, model, variant, category, max_seats)
+REAL_MODELS = [
+    ("Embraer", "E175", None, "Regional Jet", 88),
+    ("Embraer", "E175", "E175-E1", "Regional Jet", 88),
+    ("Embraer", "E175", "E175-E2", "Regional Jet", 90),
+    ("Embraer", "E190", None, "Regional Jet", 114),
+    ("Embraer", "E190", "E190-E1", "Regional Jet", 114),
+    ("Embraer", "E190", "E190-E2", "Regional Jet", 114),
+    ("Embraer", "E195", None, "Regional Jet", 132),
+    ("Embraer", "E195", "E195-E1", "Regional Jet", 124),
+    ("Embraer", "E195", "E195-E2", "Regional Jet", 146),
+    ("Boeing", "737", None, "Narrow Body", 189),
+    ("Airbus", "A320", None, "Narrow Body", 180),
+]
+
+CATEGORIES = ["Airworthiness Directive", "Systems", "Certification", "Operations", "Maintenance", "Noise"]
+
+# (operator, registration prefix); "N" prefixes use the US numeric format
+OPERATORS = [
+    ("Republic Airways", "N"), ("SkyWest Airlines", "N"), ("Envoy Air", "N"),
+    ("Azul Linhas Aéreas", "PR-"), ("LATAM Brasil", "PS-"), ("KLM Cityhopper", "PH-"),
+    ("Lufthansa CityLine", "D-"), ("BA CityFlyer", "G-"), ("Air Canada Express", "C-"),
+    ("Qantas Link", "VH-"),
+]
+
+# status -> relative frequency in the generated history
+HISTORY_STATUSES = {"compliant": 0.80, "pending": 0.10, "non_compliant": 0.08, "not_applicable": 0.02}
+
+_SUBJECTS = [
+    "wing spar", "fuel quantity indication", "landing gear actuator", "cabin pressurization",
+    "engine fan blade", "flight control computer", "cargo fire suppression", "emergency lighting",
+    "bird strike protection", "ice detection", "autopilot disengagement", "oxygen mask deployment",
+]
+_ACTIONS = ["inspection", "replacement", "modification", "functional test", "software update", "placard revision"]
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Size and seed of a synthetic dataset.
+
+    Attributes:
+        aircraft: Aircraft model rows, real designations first
+        regulations: Regulation rows spread across the authorities
+        authorities: Authority rows, real authorities first
+        fleet: Aircraft tails (``aircraft`` table)
+        history: Compliance check history rows
+        history_days: Days of history before ``as_of``
+        seed: Random seed; equal specs produce identical data
+        as_of: Reference date for delivery, inspection and check dates
+    """
+
+    aircraft: int = 200
+    regulations: int = 2000
+    authorities: int = 5
+    fleet: int = 0
+    history: int = 0
+    history_days: int = 365
+    seed: int = 42
+    as_of: date = field(default_factory=date.today)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "as_of": self.as_of.isoformat()}
+
+
+def _letters(value: int, width: int) -> str:
+    """Fixed-width base-26 letters of ``value`` (``0`` -> ``AAAA``)."""
+    chars = []
+    for _ in range(width):
+        value, remainder = divmod(value, 26)
+        chars.append(_LETTERS[remainder])
+    return "".join(reversed(chars))
+
+
+def registration(prefix: str, index: int, width: int = 4) -> str:
+    """Registration mark for the ``index``-th tail; distinct indexes give distinct marks.
+
+    Args:
+        prefix: Nationality prefix; ``"N"`` produces US marks such as ``N123AB``
+        index: Tail number within the fleet
+        width: Letters after the prefix, enough for ``26 ** width`` tails
+    """
+    if prefix == "N":
+        return f"N{100 + index % 900}{_letters(index // 900, width - 2)}"
+    return f"{prefix}{_letters(index, width)}"
+
+
+def build_authorities(spec: DatasetSpec) -> List[Dict[str, Any]]:
+    """Authority rows for ``spec``."""
+    rows = []
+    for index in range(max(spec.authorities, 3)):
+        if index < len(REAL_AUTHORITIES):
+            code, name, country = REAL_AUTHORITIES[index]
+        else:
+            code, name, country = f"SYN{index:03d}", f"Synthetic Aviation Authority {index}", None
+        rows.append({
+            "id": f"auth-{index:04d}",
+            "code": code,
+            "name": name,
+            "country": country,
+            "website": f"https://{code.lower()}.example.org",
+        })
+    return rows
+
+
+def build_aircraft_models(spec: DatasetSpec) -> List[Dict[str, Any]]:
+    """Aircraft model rows for ``spec``: the real catalog, then synthetic E1/E2 families."""
+    rng = random.Random(f"{spec.seed}:aircraft")
+    rows = []
+    for index in range(max(spec.aircraft, len(REAL_MODELS))):
+        if index < len(REAL_MODELS):
+            manufacturer, model, variant, category, seats = REAL_MODELS[index]
+        else:
+            synthetic = index - len(REAL_MODELS)
+            model = f"SX{100 + synthetic // 3}"
+            variant = (None, f"{model}-E1", f"{model}-E2")[synthetic % 3]
+            manufacturer, category, seats = "Synthetic Aerospace", "Regional Jet", rng.randrange(50, 220)
+        rows.append({
+            "id": f"model-{index:06d}",
+            "manufacturer": manufacturer,
+            "model": model,
+            "variant": variant,
+            "type_certificate": f"TC-{rng.randrange(10000, 99999)}",
+            "category": category,
+            "max_seats": seats,
+            "max_weight_kg": float(seats * rng.randrange(450, 600)),
+        })
+    return rows
+
+
+def build_regulations(spec: DatasetSpec, authorities: List[Dict[str, Any]],
+                      aircraft_models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Regulation rows for ``spec`` with applicability drawn from ``aircraft_models``.
+
+    About one regulation in a hundred has no applicability list and so applies
+    to every model; the rest name one to three family or variant designations.
+    """
+    rng = random.Random(f"{spec.seed}:regulations")
+    designations = sorted({row["variant"] or row["model"] for row in aircraft_models}
+                          | {row["model"] for row in aircraft_models})
+    epoch = datetime(2015, 1, 1)
+    rows = []
+    for index in range(spec.regulations):
+        authority = authorities[index % len(authorities)]
+        category = rng.choice(CATEGORIES)
+        subject, action = rng.choice(_SUBJECTS), rng.choice(_ACTIONS)
+        applicable = [] if rng.random() < 0.01 else rng.sample(designations, rng.randint(1, 3))
+        prefix = "AD" if category == "Airworthiness Directive" else category[:3].upper()
+        rows.append({
+            "id": f"reg-{index:07d}",
+            "authority_id": authority["id"],
+            "reference": f"{authority['code']}-{prefix}-{index:07d}",
+            "title": f"{subject.capitalize()} {action}",
+            "description": (
+                f"Requires {action} of the {subject} on affected aircraft. "
+                f"Compliance is due within {rng.choice([30, 90, 180, 365])} days "
+                f"or {rng.choice([500, 1000, 3000, 6000])} flight hours, whichever occurs first."
+            ),
+            "category": category,
+            "subcategory": action.capitalize(),
+            "status": "active",
+            "effective_date": epoch + timedelta(days=rng.randrange(0, 3650)),
+            "content": {"applicable_models": applicable, "model_specific": bool(applicable)},
+        })
+    return rows
+
+
+def iter_fleet(spec: DatasetSpec, aircraft_models: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """``spec.fleet`` aircraft tails flying the catalog's designations.
+
+    Seven tails in ten fly a real designation. Each tail has a delivery date up
+    to 20 years before ``as_of``, flight hours from roughly 2,800 hours a year
+    of utilization, and a last inspection within the past 14 months, so a
+    share of the fleet is overdue for its annual inspection.
+    """
+    rng = random.Random(f"{spec.seed}:fleet")
+    real_types = [row["variant"] or row["model"] for row in aircraft_models[:len(REAL_MODELS)]]
+    all_types = [row["variant"] or row["model"] for row in aircraft_models]
+    width = 4 if spec.fleet <= 26 ** 4 else 5
+    as_of = datetime.combine(spec.as_of, time())
+
+    for index in range(spec.fleet):
+        operator, prefix = rng.choice(OPERATORS)
+        aircraft_type = rng.choice(real_types if rng.random() < 0.7 else all_types)
+        years_in_service = rng.uniform(0.1, 20.0)
+        delivered = as_of - timedelta(days=years_in_service * 365.25)
+        last_inspection = as_of - timedelta(days=rng.uniform(0, 420), seconds=rng.randrange(86400))
+        yield {
+            "id": f"tail-{index:08d}",
+            "name": f"{operator} {aircraft_type}",
+            "aircraft_type": aircraft_type,
+            "registration": registration(prefix, index, width),
+            "current_hours": round(years_in_service * max(rng.gauss(2800, 600), 300), 1),
+            "last_inspection": last_inspection,
+            "created_at": delivered,
+            "updated_at": last_inspection,
+        }
+
+
+def applicable_regulation_ids(aircraft_models: List[Dict[str, Any]],
+                              regulations: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Regulation ids applying to each aircraft model, using exact-or-family matching."""
+    universal, by_code = [], defaultdict(list)
+    for regulation in regulations:
+        entries = regulation["content"]["applicable_models"]
+        if not entries:
+            universal.append(regulation["id"])
+        for entry in entries:
+            by_code[entry.upper()].append(regulation["id"])
+
+    applicable = {}
+    for row in aircraft_models:
+        codes = {code for code in designation_codes(row["model"], row["variant"]) if code}
+        applicable[row["id"]] = universal + sorted({rid for code in codes for rid in by_code.get(code, ())})
+    return applicable
+
+
+def iter_history(spec: DatasetSpec, aircraft_models: List[Dict[str, Any]],
+                 regulations: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """``spec.history`` compliance checks spread over ``history_days`` before ``as_of``.
+
+    Each check pairs an aircraft model with a regulation that applies to it;
+    statuses follow ``HISTORY_STATUSES``.
+    """
+    rng = random.Random(f"{spec.seed}:history")
+    applicable = applicable_regulation_ids(aircraft_models, regulations)
+    model_ids = [model_id for model_id, regulation_ids in applicable.items() if regulation_ids]
+    if not model_ids:
+        return
+    statuses, cum_weights = list(HISTORY_STATUSES), list(accumulate(HISTORY_STATUSES.values()))
+    inspectors = [f"inspector-{number:03d}" for number in range(250)]
+    as_of = datetime.combine(spec.as_of, time())
+    window_seconds = spec.history_days * 86400
+
+    for index in range(spec.history):
+        model_id = rng.choice(model_ids)
+        status = rng.choices(statuses, cum_weights=cum_weights)[0]
+        if status == "compliant":
+            percentage = round(95.0 + 5.0 * rng.random(), 1)
+        elif status == "non_compliant":
+            percentage = round(40.0 + 50.0 * rng.random(), 1)
+        else:
+            percentage = None
+        yield {
+            "id": f"check-{index:010d}",
+            "aircraft_model_id": model_id,
+            "regulation_id": rng.choice(applicable[model_id]),
+            "check_date": as_of - timedelta(seconds=1 + int(rng.random() * window_seconds)),
+            "status": status,
+            "compliance_percentage": percentage,
+            "checked_by": rng.choice(inspectors),
+        }
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def _bulk_insert(session: AsyncSession, table, rows: Iterable[Dict[str, Any]]) -> int:
+    written = 0
+    for chunk in _chunks(rows, _INSERT_CHUNK):
+        await session.execute(insert(table), chunk)
+        written += len(chunk)
+    return written
+
+
+async def _prepare_bulk_load(session: AsyncSession) -> None:
+    """Give SQLite a 256 MB page cache so index inserts stay in memory."""
+    if session.bind.dialect.name == "sqlite":
+        await session.execute(text("PRAGMA cache_size = -262144"))
+
+
+async def seed_dataset(
+    session: AsyncSession,
+    spec: DatasetSpec,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """Write the catalog, fleet and compliance history for ``spec`` into an empty schema.
+
+    Args:
+        session: Session on a database whose tables exist and are empty; committed on success
+        spec: Dataset size, seed and reference date
+        progress: Called with ``(table, rows_written)`` after each table or history chunk
+
+    Returns:
+        Row counts per table
+    """
+    report = progress or (lambda table, rows: None)
+    await _prepare_bulk_load(session)
+
+    authorities = build_authorities(spec)
+    aircraft_models = build_aircraft_models(spec)
+    regulations = build_regulations(spec, authorities, aircraft_models)
+    counts = {}
+    # Core inserts skip the ORM bulk-insert bookkeeping, which costs more than SQLite itself here
+    for table, model, rows in (
+        ("authorities", Authority, authorities),
+        ("aircraft_models", AircraftModel, aircraft_models),
+        ("regulations", Regulation, regulations),
+        ("aircraft", Aircraft, iter_fleet(spec, aircraft_models)),
+    ):
+        counts[table] = await _bulk_insert(session, model.__table__, rows)
+        report(table, counts[table])
+
+    # Commits the catalog and fleet
+    counts["regulation_models"] = await materialize_applicability(session)
+    report("regulation_models", counts["regulation_models"])
+
+    history_repo = ComplianceHistoryRepository(session)
+    counts["compliance_check_history"] = 0
+    for chunk in _chunks(iter_history(spec, aircraft_models, regulations), _HISTORY_CHUNK):
+        counts["compliance_check_history"] += await history_repo.record_checks(chunk, commit=False)
+        report("compliance_check_history", counts["compliance_check_history"])
+    await session.commit()
+
+    content_version.bump()
+    model_resolver.invalidate()
+    return counts
@@ -0,0 +1,76 @@
+"""
+Write a synthetic large-fleet dataset into a fresh database for scale testing.
+
+Usage:
+    python -m benchmarks.generate --database-url sqlite+aiosqlite:///./scale.db \\
+        --fleet 100000 --regulations 50000 --history 500000 [--aircraft 300] [--seed 42]
+
+The same ``--seed`` and ``--as-of`` always produce the same rows. Point the
+API at the result with ``DATABASE_URL``; for PostgreSQL, apply the Alembic
+migrations first and pass ``--no-create-tables``.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.dataset import DatasetSpec, seed_dataset
+from src.database import Base
+
+
+async def generate(database_url: str, spec: DatasetSpec, create_tables: bool = True) -> dict:
+    """Create the schema (optionally) and seed ``spec`` into ``database_url``.
+
+    Returns:
+        Row counts per table and the elapsed seconds
+    """
+    engine = create_async_engine(database_url)
+    started = time.perf_counter()
+
+    def progress(table: str, rows: int) -> None:
+        print(f"\r  {table}: {rows:,} rows ({time.perf_counter() - started:.1f}s)", end="", file=sys.stderr)
+        if table != "compliance_check_history" or rows >= spec.history:
+            print(file=sys.stderr)
+
+    try:
+        if create_tables:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+            counts = await seed_dataset(session, spec, progress=progress)
+    finally:
+        await engine.dispose()
+    return {"rows": counts, "elapsed_seconds": round(time.perf_counter() - started, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate", description="Generate a synthetic large-fleet dataset")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./scale.db", help="Target database (must be empty)")
+    parser.add_argument("--fleet", type=int, default=100_000, help="Aircraft tails")
+    parser.add_argument("--regulations", type=int, default=50_000, help="Regulations")
+    parser.add_argument("--history", type=int, default=500_000, help="Compliance check history rows")
+    parser.add_argument("--history-days", type=int, default=365, help="Days of history")
+    parser.add_argument("--aircraft", type=int, default=300, help="Aircraft model rows")
+    parser.add_argument("--authorities", type=int, default=8, help="Authorities")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(), help="Reference date (YYYY-MM-DD)")
+    parser.add_argument("--no-create-tables", action="store_true", help="Schema already exists (e.g. Alembic)")
+    args = parser.parse_args()
+
+    spec = DatasetSpec(
+        aircraft=args.aircraft, regulations=args.regulations, authorities=args.authorities,
+        fleet=args.fleet, history=args.history, history_days=args.history_days,
+        seed=args.seed, as_of=args.as_of,
+    )
+    print(f"🛫 generating {json.dumps(spec.to_dict())}", file=sys.stderr)
+    result = asyncio.run(generate(args.database_url, spec, create_tables=not args.no_create_tables))
+    print(json.dumps({"dataset": spec.to_dict(), **result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
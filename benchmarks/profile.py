@@ -0,0 +1,138 @@
+"""
+Load profiles for the benchmark suite.
+
+A profile is a JSON file naming the endpoints to exercise, their relative
+weights and the values their path and query placeholders are drawn from::
+
+    {
+      "name": "default",
+      "concurrency": 8,
+      "requests": 2000,
+      "warmup_requests": 100,
+      "headers": {"Accept-Encoding": "gzip"},
+      "variables": {"model": ["E175", "E190-E2"], "country": ["USA", "BRAZIL"]},
+      "endpoints": [
+        {"name": "compliance_check", "path": "/compliance/check/{model}/{country}", "weight": 10},
+        {"name": "fulltext", "path": "/compliance/regulations/fulltext", "params": {"q": "{term}"}}
+      ]
+    }
+
+The request sequence is drawn from a seeded generator, so two runs of the same
+profile issue the same requests in the same order.
+"""
+
+import json
+import random
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_PROFILE = Path(__file__).parent / "profiles" / "default.json"
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True)
+class EndpointSpec:
+    """One endpoint of a load profile."""
+
+    name: str
+    path: str
+    method: str = "GET"
+    weight: float = 1.0
+    params: Dict[str, str] = field(default_factory=dict)
+    expected_status: Tuple[int, ...] = (200,)
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """A concrete request drawn from an endpoint template."""
+
+    endpoint: str
+    method: str
+    url: str
+    params: Dict[str, str]
+    expected_status: Tuple[int, ...]
+
+
+@dataclass
+class LoadProfile:
+    """Endpoints, weights and pacing of a benchmark run."""
+
+    name: str
+    endpoints: List[EndpointSpec]
+    variables: Dict[str, List[str]] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    concurrency: int = 8
+    requests: int = 2000
+    warmup_requests: int = 100
+    seed: int = 42
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadProfile":
+        """Build a profile from its JSON form.
+
+        Raises:
+            ValueError: If the profile has no endpoints or uses an undefined placeholder
+        """
+        endpoints = [
+            EndpointSpec(
+                name=entry["name"],
+                path=entry["path"],
+                method=entry.get("method", "GET").upper(),
+                weight=float(entry.get("weight", 1.0)),
+                params=dict(entry.get("params", {})),
+                expected_status=tuple(entry.get("expected_status", (200,))),
+            )
+            for entry in data.get("endpoints", [])
+        ]
+        if not endpoints:
+            raise ValueError("load profile defines no endpoints")
+
+        variables = {name: list(values) for name, values in data.get("variables", {}).items()}
+        for endpoint in endpoints:
+            for template in (endpoint.path, *endpoint.params.values()):
+                missing = set(_PLACEHOLDER.findall(template)) - variables.keys()
+                if missing:
+                    raise ValueError(f"endpoint {endpoint.name!r} uses undefined variables: {sorted(missing)}")
+
+        return cls(
+            name=data.get("name", "custom"),
+            endpoints=endpoints,
+            variables=variables,
+            headers=dict(data.get("headers", {})),
+            concurrency=int(data.get("concurrency", 8)),
+            requests=int(data.get("requests", 2000)),
+            warmup_requests=int(data.get("warmup_requests", 100)),
+            seed=int(data.get("seed", 42)),
+        )
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "LoadProfile":
+        """Read a profile file; the bundled default profile when ``path`` is omitted."""
+        with open(path or DEFAULT_PROFILE, encoding="utf-8") as stream:
+            return cls.from_dict(json.load(stream))
+
+    def plan(self, rng: random.Random) -> RequestPlan:
+        """Draw one request: an endpoint by weight, then a value for each placeholder."""
+        endpoint = rng.choices(self.endpoints, weights=[e.weight for e in self.endpoints])[0]
+        values = {name: rng.choice(choices) for name, choices in self.variables.items()}
+
+        def fill(template: str) -> str:
+            return _PLACEHOLDER.sub(lambda match: values[match.group(1)], template)
+
+        return RequestPlan(
+            endpoint=endpoint.name,
+            method=endpoint.method,
+            url=fill(endpoint.path),
+            params={key: fill(value) for key, value in endpoint.params.items()},
+            expected_status=endpoint.expected_status,
+        )
+
+    def request_plans(self, count: int, seed: Optional[int] = None) -> Iterator[RequestPlan]:
+        """Deterministic sequence of ``count`` requests."""
+        rng = random.Random(self.seed if seed is None else seed)
+        for _ in range(count):
+            yield self.plan(rng)
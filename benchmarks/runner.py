@@ -0,0 +1,130 @@
+"""
+In-process load driver.
+
+Sends a profile's request sequence to an ASGI application through
+``httpx.ASGITransport``, so every request crosses the full middleware stack
+and routing without a socket in between, and summarizes latency per endpoint.
+"""
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from benchmarks.profile import LoadProfile, RequestPlan
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """Linearly interpolated percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def latency_summary(latencies_ms: List[float], errors: int, elapsed_seconds: float) -> Dict[str, Any]:
+    """Request count, error count, throughput and latency percentiles of one sample set."""
+    samples = sorted(latencies_ms)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+        "mean_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 0.50), 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+        "max_ms": round(samples[-1], 3) if samples else 0.0,
+    }
+
+
+class _Recorder:
+    """Latencies, errors and status codes per endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.status_codes: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, plan: RequestPlan, status: Optional[int], latency_ms: float) -> None:
+        self.latencies[plan.endpoint].append(latency_ms)
+        self.status_codes[plan.endpoint][str(status) if status is not None else "exception"] += 1
+        if status not in plan.expected_status:
+            self.errors[plan.endpoint] += 1
+
+
+async def _send(client: httpx.AsyncClient, plan: RequestPlan) -> Optional[int]:
+    try:
+        response = await client.request(plan.method, plan.url, params=plan.params or None)
+        await response.aread()
+        return response.status_code
+    except httpx.HTTPError:
+        return None
+
+
+async def _drive(client: httpx.AsyncClient, plans: List[RequestPlan], concurrency: int,
+                 recorder: Optional[_Recorder]) -> None:
+    queue = iter(plans)
+
+    async def worker():
+        for plan in queue:
+            started = time.perf_counter()
+            status = await _send(client, plan)
+            if recorder is not None:
+                recorder.record(plan, status, (time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+
+async def run_load(
+    app,
+    profile: LoadProfile,
+    requests: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Drive ``app`` with ``profile`` and summarize the measured requests.
+
+    Warm-up requests (``profile.warmup_requests``, drawn from a separate seed)
+    fill caches and connection pools first and are not measured.
+
+    Args:
+        app: ASGI application; its lifespan must already be running
+        profile: Endpoints, weights and placeholder values
+        requests: Measured requests; ``profile.requests`` when omitted
+        concurrency: Requests in flight at once; ``profile.concurrency`` when omitted
+
+    Returns:
+        Overall and per-endpoint throughput, error counts and latency percentiles
+    """
+    requests = profile.requests if requests is None else requests
+    concurrency = profile.concurrency if concurrency is None else concurrency
+    transport = httpx.ASGITransport(app=app)
+    recorder = _Recorder()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark",
+                                 headers=profile.headers, timeout=60.0) as client:
+        warmup = list(profile.request_plans(profile.warmup_requests, seed=profile.seed + 1))
+        await _drive(client, warmup, concurrency, recorder=None)
+
+        plans = list(profile.request_plans(requests))
+        started = time.perf_counter()
+        await _drive(client, plans, concurrency, recorder)
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for samples in recorder.latencies.values() for latency in samples]
+    return {
+        "profile": profile.name,
+        "concurrency": concurrency,
+        "duration_seconds": round(elapsed, 3),
+        "overall": latency_summary(all_latencies, sum(recorder.errors.values()), elapsed),
+        "endpoints": {
+            endpoint: {
+                **latency_summary(samples, recorder.errors[endpoint], elapsed),
+                "status_codes": dict(recorder.status_codes[endpoint]),
+            }
+            for endpoint, samples in sorted(recorder.latencies.items())
+        },
+    }
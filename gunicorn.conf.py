@@ -0,0 +1,44 @@
+"""
+Gunicorn configuration for running the API with several uvicorn workers.
+
+    gunicorn src.main:app -c gunicorn.conf.py
+
+Workers share ``PROMETHEUS_MULTIPROC_DIR``: prometheus_client writes each
+worker's samples to memory-mapped files there, and the JSON metrics API keeps
+per-worker snapshots beside them, so ``/metrics`` and ``/metrics/`` return
+figures merged across all workers whichever one answers the scrape. The
+directory is wiped when the master starts; a tmpfs such as ``/dev/shm`` keeps
+it off disk.
+"""
+
+import multiprocessing
+import os
+import shutil
+
+# Must be in the environment before any worker imports prometheus_client
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/dev/shm/projetoaviacao-metrics")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count(), 4)))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+
+
+def on_starting(server):
+    """Start every run with an empty metrics directory."""
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop the exited worker's live gauges; its counters stay in the totals."""
+    from prometheus_client import multiprocess
+
+    from src.middleware.performance import MultiprocessMetricsStore
+
+    multiprocess.mark_process_dead(worker.pid)
+    MultiprocessMetricsStore(os.environ["PROMETHEUS_MULTIPROC_DIR"]).retire(worker.pid)
@@ -5,6 +5,7 @@ Script to add new aircraft models E175 and E-Jets E2 series.
 import asyncio
 from src.db.session import AsyncSessionLocal
 from src.repositories import AircraftModelRepository
+from src.services.applicability_service import materialize_applicability
 
 
 async def add_new_aircraft_models():
@@ -76,6 +77,8 @@ async def add_new_aircraft_models():
                 print(f"✗ Error adding {aircraft['manufacturer']} {aircraft['model']} ({aircraft['variant']}): {e}")
         
         await session.commit()
+        rows = await materialize_applicability(session)
+        print(f"✓ Applicability materialized ({rows} regulation/model links)")
         print("✅ New aircraft models added successfully!")
 
 
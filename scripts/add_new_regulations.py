@@ -5,6 +5,7 @@ Script to add specific regulations for new aircraft models E175 and E-Jets E2.
 import asyncio
 from src.db.session import AsyncSessionLocal
 from src.repositories import AuthorityRepository, RegulationRepository
+from src.services.applicability_service import materialize_applicability
 
 
 async def add_new_regulations():
@@ -114,6 +115,8 @@ async def add_new_regulations():
                 print(f"✗ Error adding regulation {reg_data['reference']}: {e}")
         
         await session.commit()
+        rows = await materialize_applicability(session)
+        print(f"✓ Applicability materialized ({rows} regulation/model links)")
         print("✅ New regulations added successfully!")
 
 
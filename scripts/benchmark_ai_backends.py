@@ -0,0 +1,115 @@
+"""
+Script to compare latency and memory of the torch and ONNX AI backends.
+
+Each backend runs in its own subprocess so resident memory reflects only the
+libraries and weights that backend loads. Export the ONNX models first with
+``python -m scripts.export_onnx_models``.
+
+Usage:
+    python -m scripts.benchmark_ai_backends [--iterations 50] [--batch-size 8]
+    python -m scripts.benchmark_ai_backends --backend onnx   # single backend, JSON output
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import psutil
+
+
+TEXTS = [
+    "Aircraft: Embraer E190 seeking certification with FAA",
+    "Regional jet with EASA certification for European operations",
+    "Military aircraft for civilian operations under ANAC rules",
+    "Business jet with multiple international certifications",
+]
+
+
+def _rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _load(backend: str):
+    from src.services.aviation_ai_service import CLASSIFIER_MODEL_ID, SIMILARITY_MODEL_ID
+
+    if backend == "onnx":
+        from src.services.onnx_backend import OnnxSentenceEncoder, OnnxTextClassifier
+        return OnnxTextClassifier.from_model_id(CLASSIFIER_MODEL_ID), OnnxSentenceEncoder.from_model_id(SIMILARITY_MODEL_ID)
+
+    from sentence_transformers import SentenceTransformer
+    from transformers import pipeline
+    classifier = pipeline("text-classification", model=CLASSIFIER_MODEL_ID, return_all_scores=True)
+    return classifier, SentenceTransformer(SIMILARITY_MODEL_ID)
+
+
+def run_backend(backend: str, iterations: int, batch_size: int) -> dict:
+    """Load one backend in this process and time batched classifier and encoder calls."""
+    baseline_rss = _rss_mb()
+    started = time.perf_counter()
+    classifier, encoder = _load(backend)
+    load_seconds = time.perf_counter() - started
+
+    batch = (TEXTS * (batch_size // len(TEXTS) + 1))[:batch_size]
+    classifier(batch)
+    encoder.encode(batch)  # warm-up
+
+    timings = {"classifier": [], "encoder": []}
+    for _ in range(iterations):
+        started = time.perf_counter()
+        classifier(batch)
+        timings["classifier"].append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        encoder.encode(batch)
+        timings["encoder"].append((time.perf_counter() - started) * 1000)
+
+    result = {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        "rss_mb": round(_rss_mb(), 1),
+        "rss_delta_mb": round(_rss_mb() - baseline_rss, 1),
+    }
+    for name, values in timings.items():
+        values.sort()
+        result[f"{name}_p50_ms"] = round(statistics.median(values), 2)
+        result[f"{name}_p95_ms"] = round(values[int(len(values) * 0.95) - 1], 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AI inference backends")
+    parser.add_argument("--backend", choices=["torch", "onnx", "all"], default="all")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.backend != "all":
+        print(json.dumps(run_backend(args.backend, args.iterations, args.batch_size)))
+        return
+
+    results = []
+    for backend in ("torch", "onnx"):
+        print(f"⏱  Benchmarking {backend}...")
+        completed = subprocess.run(
+            [sys.executable, "-m", "scripts.benchmark_ai_backends", "--backend", backend,
+             "--iterations", str(args.iterations), "--batch-size", str(args.batch_size)],
+            capture_output=True, text=True, env=os.environ.copy(),
+        )
+        if completed.returncode != 0:
+            print(f"✗ {backend} failed:\n{completed.stderr.strip()}")
+            continue
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    if not results:
+        return
+    columns = list(results[0])
+    print(" | ".join(f"{column:>16}" for column in columns))
+    for result in results:
+        print(" | ".join(f"{str(result[column]):>16}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Script to measure per-request serialization cost of a compliance report.
+
+Compares the ``response_model`` paths FastAPI takes when an endpoint returns a
+``ComplianceReport`` (validate, then encode and ``json.dumps`` or, on recent
+FastAPI, dump straight to bytes) with the serialized fast path: a cache miss
+renders the report once with pydantic-core and a hit reuses the stored bytes.
+
+Usage:
+    python -m scripts.benchmark_serialization [--iterations 2000] [--checks 40]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.models.compliance import ComplianceCheck, ComplianceReport
+from src.services.cache_service import cache_service
+from src.services.enhanced_compliance_service import report_cache_key, report_status, serialize_report
+
+
+def build_report(checks: int) -> ComplianceReport:
+    """Report shaped like a real E175 check against FAA rules."""
+    return ComplianceReport(
+        aircraft_model="E175",
+        country="USA",
+        overall_status="PARTIAL_COMPLIANCE",
+        total_checks=checks,
+        compliant_checks=checks - 2,
+        non_compliant_checks=2,
+        critical_issues=1,
+        checks=[
+            ComplianceCheck(
+                regulation_reference=f"14 CFR 25.{index}",
+                regulation_title=f"Airworthiness standard {index} for transport category airplanes",
+                status="COMPLIANT" if index % 7 else "PARTIAL_COMPLIANCE",
+                severity="MAJOR" if index % 5 else "CRITICAL",
+                findings=["Documentation reviewed", "Test evidence on file"],
+                recommendations=["Keep certification records current"],
+            )
+            for index in range(checks)
+        ],
+        recommendations=["Schedule FAA validation meeting", "Review noise certification data"],
+    )
+
+
+def _time_us(fn, iterations: int) -> float:
+    fn()  # warm-up
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compliance report serialization")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--checks", type=int, default=40)
+    args = parser.parse_args()
+
+    report = build_report(args.checks)
+    field = create_model_field(name="Response_check_compliance", type_=ComplianceReport, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def response_model_path():
+        content = loop.run_until_complete(serialize_response(field=field, response_content=report))
+        return JSONResponse(content).body
+
+    def response_model_bytes_path():
+        return loop.run_until_complete(serialize_response(field=field, response_content=report, dump_json=True))
+
+    cache_key = report_cache_key(report.aircraft_model, report.country)
+
+    async def cached_body():
+        body = await cache_service.get_bytes(cache_key)
+        report_status(body)
+        return body
+
+    loop.run_until_complete(cache_service.set_bytes(cache_key, serialize_report(report), 60))
+
+    results = {
+        "response_model + json.dumps": _time_us(response_model_path, args.iterations),
+        "response_model (dump_json)": _time_us(response_model_bytes_path, args.iterations),
+        "serialize_report (miss)": _time_us(lambda: serialize_report(report), args.iterations),
+        "cached bytes (hit)": _time_us(lambda: loop.run_until_complete(cached_body()), args.iterations),
+    }
+    loop.close()
+
+    baseline = results["response_model + json.dumps"]
+    print(f"ComplianceReport with {args.checks} checks, {len(serialize_report(report))} bytes")
+    for name, micros in results.items():
+        print(f"{name:>30} | {micros:9.1f} µs | {baseline / micros:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
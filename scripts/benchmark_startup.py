@@ -0,0 +1,133 @@
+"""
+Script to measure application cold start and guard it in CI.
+
+Every sample runs in a fresh interpreter, so nothing is already imported or
+cached in memory. A sample records the time to import ``src.main`` and, with
+``--lifespan``, the time to run the application's startup hooks; it also
+lists which heavy optional packages the import (and the startup hooks, with
+``--lifespan``) pulled in.
+
+Usage:
+    python -m scripts.benchmark_startup [--runs 5] [--lifespan]
+    python -m scripts.benchmark_startup --profile [--top 25]   # import-time profile
+    python -m scripts.benchmark_startup --check-startup [--lifespan]  # exit 1 on regression
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Median cold import budget; CI runners are slower than a laptop
+STARTUP_BUDGET_MS = 2000
+
+# Must stay out of the import path: loaded on first use, in a worker or a background thread
+HEAVY_MODULES = (
+    "torch", "transformers", "sentence_transformers", "scipy", "sklearn",
+    "onnxruntime", "numpy", "redis", "psutil",
+)
+
+
+def _child_sample(lifespan: bool) -> dict:
+    """Import the app (and optionally run its startup) in this process."""
+    started = time.perf_counter()
+    from src.main import app
+    import_ms = (time.perf_counter() - started) * 1000
+    heavy = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    sample = {"import_ms": round(import_ms, 1), "heavy_modules": heavy}
+    if lifespan:
+        async def run_startup():
+            started = time.perf_counter()
+            async with app.router.lifespan_context(app):
+                return (time.perf_counter() - started) * 1000
+        sample["startup_ms"] = round(asyncio.run(run_startup()), 1)
+        # Startup hooks must not pull heavy modules in either (AI warm-up, caches, backfills)
+        sample["heavy_modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+    return sample
+
+
+def _run(args: list) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=os.environ.copy(),
+    )
+
+
+def sample_cold_start(runs: int, lifespan: bool) -> list:
+    """Collect ``runs`` samples, each from a new interpreter."""
+    samples = []
+    for _ in range(runs):
+        command = ["-m", "scripts.benchmark_startup", "--child"] + (["--lifespan"] if lifespan else [])
+        completed = _run(command)
+        if completed.returncode != 0:
+            raise RuntimeError(f"startup sample failed:\n{completed.stderr.strip()}")
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def import_profile(top: int) -> list:
+    """``(cumulative_ms, self_ms, module)`` for the slowest imports of ``src.main``."""
+    completed = _run(["-X", "importtime", "-c", "import src.main"])
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, module.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark application cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--lifespan", action="store_true", help="Also time the startup hooks (needs a database)")
+    parser.add_argument("--profile", action="store_true", help="Print the slowest imports instead")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--check-startup", action="store_true", help="Fail if over budget or heavy modules load")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child_sample(args.lifespan)))
+        return
+
+    if args.profile:
+        print(f"{'cumulative ms':>14} | {'self ms':>8} | module")
+        for cumulative_ms, self_ms, module in import_profile(args.top):
+            print(f"{cumulative_ms:14.1f} | {self_ms:8.1f} | {module}")
+        return
+
+    samples = sample_cold_start(args.runs, args.lifespan)
+    import_ms = statistics.median(sample["import_ms"] for sample in samples)
+    print(f"⏱  import src.main: median {import_ms:.0f} ms over {len(samples)} runs "
+          f"(min {min(s['import_ms'] for s in samples):.0f}, max {max(s['import_ms'] for s in samples):.0f})")
+    if args.lifespan:
+        print(f"⏱  startup hooks: median {statistics.median(s['startup_ms'] for s in samples):.0f} ms")
+
+    heavy = sorted({name for sample in samples for name in sample["heavy_modules"]})
+    if heavy:
+        print(f"⚠️  heavy modules imported at startup: {', '.join(heavy)}")
+
+    if args.check_startup:
+        failures = []
+        if import_ms > args.budget_ms:
+            failures.append(f"median import {import_ms:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        if heavy:
+            where = "import path or startup hooks" if args.lifespan else "import path"
+            failures.append(f"heavy modules on the {where}: {', '.join(heavy)}")
+        if failures:
+            for failure in failures:
+                print(f"✗ {failure}")
+            sys.exit(1)
+        print("✓ startup within budget")
+
+
+if __name__ == "__main__":
+    main()
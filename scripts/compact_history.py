@@ -0,0 +1,35 @@
+"""
+Script to compact expired compliance history partitions into daily rollups.
+
+Meant to run from cron (e.g. nightly). Retention is controlled by
+HISTORY_RAW_RETENTION_DAYS and HISTORY_ROLLUP_RETENTION_DAYS.
+
+Usage:
+    python -m scripts.compact_history
+"""
+
+import asyncio
+
+from src.config import settings
+from src.database import AsyncSessionLocal, create_tables
+from src.repositories import ComplianceHistoryRepository
+
+
+async def main():
+    print(
+        f"🗜  Compacting compliance history (raw retention {settings.history_raw_retention_days} days, "
+        f"rollup retention {settings.history_rollup_retention_days} days)..."
+    )
+    await create_tables()
+
+    async with AsyncSessionLocal() as session:
+        stats = await ComplianceHistoryRepository(session).compact()
+
+    for name in stats["compacted_partitions"]:
+        print(f"✓ Compacted {name}")
+    print(f"✓ {stats['rollup_rows_written']} daily rollup rows written, {stats['rollup_rows_purged']} purged")
+    print("✅ Compaction finished")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""
+Script to export the AI classifier and encoder to ONNX with int8 quantization.
+
+Run once per deployment (needs torch, transformers and onnxruntime), then set
+AI_BACKEND=onnx so workers load the exports from AI_ONNX_MODEL_DIR.
+
+Usage:
+    python -m scripts.export_onnx_models [--output-dir models/onnx] [--no-quantize]
+"""
+
+import argparse
+
+from src.config import settings
+from src.services.aviation_ai_service import CLASSIFIER_MODEL_ID, SIMILARITY_MODEL_ID
+from src.services.onnx_backend import export_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export AI models to ONNX")
+    parser.add_argument("--output-dir", default=settings.ai_onnx_model_dir)
+    parser.add_argument("--no-quantize", action="store_true", help="Skip the int8 copy")
+    args = parser.parse_args()
+
+    for model_id, kind in ((CLASSIFIER_MODEL_ID, "classifier"), (SIMILARITY_MODEL_ID, "encoder")):
+        print(f"📦 Exporting {model_id} ({kind})...")
+        target = export_model(model_id, kind, base_dir=args.output_dir, quantize=not args.no_quantize)
+        print(f"✓ {target}")
+    print("✅ Export finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Script to stream-import large regulation catalog dumps (JSON Lines, CSV or JSON array).
+
+Usage:
+    python -m scripts.import_regulations regulations.jsonl
+    python -m scripts.import_regulations dump.csv --batch-size 2000
+"""
+
+import argparse
+import asyncio
+
+from src.database import create_tables
+from src.services.regulation_importer import MAX_BATCH_SIZE, RegulationImporter, SUPPORTED_FORMATS
+
+
+def _print_progress(stats):
+    print(
+        f"  … {stats.read:,} read, {stats.written:,} written, "
+        f"{stats.duplicates:,} duplicates, {stats.invalid + stats.malformed + stats.unknown_authority:,} rejected "
+        f"({stats.records_per_second:,.0f} rec/s)"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Import a regulation catalog dump")
+    parser.add_argument("path", help="Path to the dump file")
+    parser.add_argument("--format", choices=SUPPORTED_FORMATS, help="Dump format (detected from extension by default)")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help=f"Rows per bulk upsert (at most {MAX_BATCH_SIZE}, the bind parameter limit)")
+    parser.add_argument("--progress-every", type=int, default=10000, help="Report progress every N records")
+    args = parser.parse_args()
+
+    print(f"📥 Importing regulations from {args.path}...")
+    await create_tables()
+
+    importer = RegulationImporter(
+        batch_size=args.batch_size,
+        progress_every=args.progress_every,
+        progress_callback=_print_progress,
+    )
+    stats = await importer.import_file(args.path, args.format)
+
+    print("✅ Import finished")
+    for key, value in stats.to_dict().items():
+        print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import AsyncSessionLocal
 from src.models.db_models import Authority, AircraftModel, Regulation
 from src.repositories import AuthorityRepository, AircraftModelRepository, RegulationRepository
+from src.services.applicability_service import materialize_applicability
 
 
 async def migrate_authorities(session: AsyncSession):
@@ -222,6 +223,8 @@ async def main():
             await migrate_aircraft_models(session)
             await migrate_regulations(session)
             await create_sample_data(session)
+            rows = await materialize_applicability(session)
+            print(f"Applicability materialized ({rows} regulation/model links)")
             
             print("Data migration completed successfully!")
             
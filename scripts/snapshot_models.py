@@ -0,0 +1,33 @@
+"""
+Script to snapshot the AI models into the versioned artifacts directory.
+
+Run on a machine with hub access, then ship AI_MODEL_ARTIFACTS_DIR to the
+air-gapped hosts and start them with AI_MODELS_OFFLINE=true.
+
+Usage:
+    python -m scripts.snapshot_models [--output-dir models/artifacts] [--revision main] [--no-activate]
+"""
+
+import argparse
+
+from src.config import settings
+from src.services.aviation_ai_service import CLASSIFIER_MODEL_ID, INSIGHT_MODEL_ID, SIMILARITY_MODEL_ID
+from src.services.model_artifacts import snapshot_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot AI models for offline use")
+    parser.add_argument("--output-dir", default=settings.ai_model_artifacts_dir or "models/artifacts")
+    parser.add_argument("--revision", default="main", help="Hub branch, tag or commit")
+    parser.add_argument("--no-activate", action="store_true", help="Do not point CURRENT at the new snapshots")
+    args = parser.parse_args()
+
+    for model_id in (CLASSIFIER_MODEL_ID, SIMILARITY_MODEL_ID, INSIGHT_MODEL_ID):
+        print(f"📦 Snapshotting {model_id}@{args.revision}...")
+        target = snapshot_model(model_id, args.revision, base_dir=args.output_dir, activate=not args.no_activate)
+        print(f"✓ {target}")
+    print("✅ Snapshots written")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,16 @@ Provides aggregated statistics, KPIs, and trend data.
 """
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case, and_
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import json
 
-from ..database import get_db
+from ..database import get_async_session, get_db
 from ..models.db_models_sqlite import Aircraft, ComplianceRequirement
+from ..repositories.compliance_history import ComplianceHistoryRepository
 from ..services.compliance_service import ComplianceService
 from ..exceptions import DatabaseError, ValidationError
 
@@ -84,12 +86,32 @@ async def get_fleet_metrics(db: Session = Depends(get_db)) -> Dict[str, Any]:
 @router.get("/compliance-trends", operation_id="get_compliance_trends")
 async def get_compliance_trends(
     days: int = Query(30, description="Number of days to include in trend analysis"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_session)
 ) -> List[Dict[str, Any]]:
     """
     Get historical compliance trends over specified time period.
+    
+    Counts come from the recorded compliance check history (pending and
+    partial results count as warnings). Until any check has been recorded in
+    the period, each day is estimated from the fleet's inspection dates.
     """
-    compliance_service = ComplianceService(db)
+    end = datetime.utcnow()  # history check dates are UTC
+    start = (end - timedelta(days=days - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    history = await ComplianceHistoryRepository(session).get_daily_trend(start, end)
+    if history:
+        trends = []
+        for i in range(days):
+            date = end - timedelta(days=days - i - 1)
+            counts = history.get(date.date(), {})
+            daily_stats = {
+                "compliant": counts.get("compliant", 0),
+                "warning": counts.get("pending", 0) + counts.get("partial_compliance", 0),
+                "non_compliant": counts.get("non_compliant", 0),
+            }
+            trends.append({"date": date.isoformat(), **daily_stats, "total": sum(daily_stats.values())})
+        return trends
+    
     aircraft_list = db.query(Aircraft).all()
     
     # Generate trend data for the specified period
@@ -97,8 +119,7 @@ async def get_compliance_trends(
     for i in range(days):
         date = datetime.now() - timedelta(days=days - i - 1)
         
-        # Simulate compliance status for each day
-        # In a real implementation, you'd track historical compliance data
+        # Estimate compliance status for each day from the inspection dates
         daily_stats = {"compliant": 0, "warning": 0, "non_compliant": 0}
         
         for aircraft in aircraft_list:
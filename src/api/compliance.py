@@ -2,18 +2,24 @@
 API endpoints for compliance checking service with database integration.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any, Annotated
+from typing import List, Dict, Any, Annotated, Optional
+from datetime import datetime
 from enum import Enum
 import asyncio
 
-from src.services.enhanced_compliance_service import EnhancedComplianceService
+from src.services.enhanced_compliance_service import EnhancedComplianceService, report_status
 from src.models.compliance import ComplianceReport, ErrorResponse
+from src.config import settings
 from src.database import get_async_session
 from src.logger import log_business_event, log_security_event
 from src.exceptions import ValidationError, DatabaseError, create_not_found_error
 from src.middleware.prometheus_metrics import record_compliance_check
+from src.services.compression import negotiate_encoding
+from src.services.content_version import content_version, weaken_etag
+from src.services.gap_rules import MATRIX_COLUMNS, gap_rules
+from src.services.regulation_search import regulation_search_index
 
 
 # Enums for path parameter validation
@@ -53,6 +59,7 @@ async def get_compliance_service(session: AsyncSession = Depends(get_async_sessi
 async def check_compliance(
     model: Annotated[AircraftModel, Path(description="Aircraft model", example="E175")], 
     country: Annotated[Country, Path(description="Country/region for compliance check", example="USA")],
+    request: Request,
     compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
 ):
     """
@@ -73,21 +80,36 @@ async def check_compliance(
         {"model": model, "country": country}
     )
     
-    result = await compliance_service.check_compliance(model, country)
+    # Pre-serialized report; returning a Response bypasses response_model re-validation
+    body = await compliance_service.check_compliance_json(model.value, country.value)
+    overall_status = report_status(body)
     
     # Record Prometheus metric
     record_compliance_check(
         aircraft_model=model,
         country=country, 
-        result=result.overall_status.lower()
+        result=overall_status.lower()
     )
     
     log_business_event(
         "compliance_check_response",
-        {"model": model, "country": country, "status": result.overall_status}
+        {"model": model, "country": country, "status": overall_status}
     )
     
-    return result
+    # Remembered per path so ConditionalRequestMiddleware can answer If-None-Match
+    etag = content_version.report_etag(request.url.path, body)
+    
+    # A copy compressed at cache-fill time skips CompressionMiddleware entirely
+    encoding = negotiate_encoding(request.headers.get("accept-encoding")) if settings.compression_enabled else None
+    if encoding:
+        compressed = await compliance_service.precompressed_report(model.value, country.value, encoding)
+        if compressed is not None:
+            return Response(
+                content=compressed,
+                media_type="application/json",
+                headers={"ETag": weaken_etag(etag), "Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+            )
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/check-compliance", 
@@ -114,13 +136,14 @@ async def check_compliance_legacy(
             {"endpoint": "/check-compliance", "model": model, "country": country}
         )
         
-        result = await compliance_service.check_compliance(model, country)
+        body = await compliance_service.check_compliance_json(model, country)
+        overall_status = report_status(body)
         
         # Record Prometheus metric
         record_compliance_check(
             aircraft_model=model,
             country=country,
-            result=result.overall_status.lower()
+            result=overall_status.lower()
         )
         
         log_business_event(
@@ -129,12 +152,12 @@ async def check_compliance_legacy(
                 "endpoint": "/check-compliance", 
                 "model": model, 
                 "country": country,
-                "status": result.overall_status,
+                "status": overall_status,
                 "response_code": 200
             }
         )
         
-        return result
+        return Response(content=body, media_type="application/json")
         
     except ValidationError as e:
         log_security_event(
@@ -214,8 +237,9 @@ async def get_requirements(
 ):
     """Get applicable regulations for an aircraft model and country from database."""
     try:
-        await compliance_service.validate_input(model, country)
-        regulations = await compliance_service.get_applicable_regulations(model, country)
+        # Enum members stringify as "Country.USA"; the service expects the plain values
+        await compliance_service.validate_input(model.value, country.value)
+        regulations = await compliance_service.get_applicable_regulations(model.value, country.value)
         
         return {
             "model": model,
@@ -230,6 +254,19 @@ async def get_requirements(
         raise HTTPException(status_code=500, detail=f"Error retrieving regulations: {str(e)}")
 
 
+@router.get("/history/{model}", operation_id="get_compliance_history")
+async def get_compliance_history(
+    model: Annotated[AircraftModel, Path(description="Aircraft model", example="E175")],
+    days: int = Query(30, ge=1, le=730, description="Days of history, ending now"),
+    compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
+):
+    """Compliance summary and daily trend of a model from the recorded check history."""
+    try:
+        return await compliance_service.get_compliance_history(model.value, days)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
 @router.get("/authorities", operation_id="get_authorities")
 async def get_authorities(
     compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
@@ -282,6 +319,93 @@ async def get_aircraft_models(
         raise HTTPException(status_code=500, detail=f"Error retrieving aircraft: {str(e)}")
 
 
+@router.get("/regulations/fulltext", operation_id="full_text_search_regulations")
+async def full_text_search_regulations(
+    q: Annotated[str, Query(min_length=1, max_length=500, description="Words to match; the last one also matches as a prefix")],
+    page: Annotated[int, Query(ge=1, description="1-based page number")] = 1,
+    page_size: Annotated[int, Query(ge=1, le=100, description="Results per page")] = 20,
+    authority: Annotated[Optional[str], Query(description="Restrict to an authority code (e.g. FAA)")] = None,
+    category: Annotated[Optional[str], Query(description="Restrict to a regulation category")] = None,
+    compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
+):
+    """Ranked full-text search over regulation reference, title, description and content.
+
+    Matched terms are wrapped in ``<mark>`` in ``title_highlight`` and ``snippet``.
+    """
+    try:
+        hits, total = await compliance_service.regulation_repo.full_text_search(
+            q,
+            category=category,
+            authority_code=authority,
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
+        return {
+            "query": q,
+            "page": page,
+            "page_size": page_size,
+            "total_results": total,
+            "total_pages": -(-total // page_size),
+            "results": [{**hit, "rank": round(hit["rank"], 4)} for hit in hits]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching regulations: {str(e)}")
+
+
+@router.get("/regulations/search", operation_id="search_regulations")
+async def search_regulations(
+    q: Annotated[str, Query(min_length=2, max_length=500, description="Free-text query")],
+    k: Annotated[int, Query(ge=1, le=100, description="Number of results")] = 10,
+    authority: Annotated[Optional[str], Query(description="Restrict to an authority code (e.g. FAA)")] = None,
+    compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
+):
+    """Semantic search over regulation titles and descriptions.
+
+    Ranks regulations by cosine similarity between the query embedding and
+    the precomputed regulation embeddings, so paraphrases match without
+    sharing keywords.
+    """
+    try:
+        # Over-fetch when filtering so the authority filter still fills k results
+        candidates = await regulation_search_index.search(
+            compliance_service.session, q, k * 5 if authority else k
+        )
+        regulations = {
+            regulation.id: regulation
+            for regulation in await compliance_service.regulation_repo.get_by_ids(
+                regulation_id for regulation_id, _ in candidates
+            )
+        }
+
+        results = []
+        for regulation_id, score in candidates:
+            regulation = regulations.get(regulation_id)
+            if regulation is None:
+                continue
+            authority_code = regulation.authority.code if regulation.authority else None
+            if authority and (authority_code or "").upper() != authority.upper():
+                continue
+            results.append({
+                "id": regulation.id,
+                "reference": regulation.reference,
+                "title": regulation.title,
+                "category": regulation.category,
+                "authority": authority_code,
+                "score": round(score, 4)
+            })
+            if len(results) == k:
+                break
+
+        return {
+            "query": q,
+            "encoder": regulation_search_index.encoder_id,
+            "total_results": len(results),
+            "results": results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching regulations: {str(e)}")
+
+
 @router.get("/health", operation_id="health_check")
 async def health_check(
     compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
@@ -431,12 +555,12 @@ async def regulatory_gap_analysis(
             {"model": model, "origin": origin_country, "target": target_country}
         )
         
-        # Get compliance status for both countries
-        origin_compliance = await compliance_service.check_compliance(model, origin_country)
-        target_compliance = await compliance_service.check_compliance(model, target_country)
+        # Gaps come from the static rule book; only the inputs need checking against the database
+        for country in (origin_country, target_country):
+            await compliance_service.validate_input(model.value, country.value)
         
-        # Analyze gaps between regulations
-        gaps = _analyze_regulatory_gaps(origin_compliance, target_compliance, model, origin_country, target_country)
+        # Analyze gaps between regulations; ComplianceReport has no timestamp of its own
+        gaps = gap_rules.analyze(model.value, origin_country.value, target_country.value, datetime.utcnow().isoformat())
         
         log_business_event(
             "gap_analysis_completed",
@@ -462,346 +586,65 @@ async def regulatory_gap_analysis(
         raise HTTPException(status_code=500, detail=f"Gap analysis failed: {str(e)}")
 
 
-def _analyze_regulatory_gaps(origin_compliance, target_compliance, model: str, origin_country: str, target_country: str):
-    """Analyze regulatory gaps between two compliance reports."""
-    
-    # Country authority mapping
-    country_authorities = {
-        "BR": {"name": "Brasil", "authority": "ANAC"},
-        "US": {"name": "Estados Unidos", "authority": "FAA"},
-        "EU": {"name": "União Europeia", "authority": "EASA"},
-        "UK": {"name": "Reino Unido", "authority": "UK CAA"},
-        "CA": {"name": "Canadá", "authority": "Transport Canada"},
-        "AR": {"name": "Argentina", "authority": "ANAC Argentina"}
-    }
-    
-    origin_info = country_authorities.get(origin_country.upper(), {"name": origin_country, "authority": "Unknown"})
-    target_info = country_authorities.get(target_country.upper(), {"name": target_country, "authority": "Unknown"})
-    
-    # Analyze specific gaps based on target country requirements
-    gaps = []
-    recommendations = []
-    estimated_timeline = "6-12 months"
-    overall_risk = "medium"
-    
-    # US-specific gaps
-    if target_country.upper() == "US":
-        gaps.extend([
-            {
-                "category": "Type Certification",
-                "requirement": "FAA Type Certificate or Validation",
-                "current_status": "Missing" if origin_country.upper() != "US" else "Available",
-                "gap_description": "Requires FAA type certificate validation or acceptance of foreign type certificate",
-                "impact": "high",
-                "estimated_effort": "6-12 months",
-                "cost_estimate": "$250,000 - $1,000,000"
-            },
-            {
-                "category": "Noise Certification",
-                "requirement": "FAR Part 36 Noise Certificate",
-                "current_status": "Verification Required",
-                "gap_description": "Must demonstrate compliance with FAR Part 36 noise standards",
-                "impact": "medium",
-                "estimated_effort": "3-6 months",
-                "cost_estimate": "$50,000 - $150,000"
-            },
-            {
-                "category": "Environmental",
-                "requirement": "EPA Emission Compliance",
-                "current_status": "Assessment Required",
-                "gap_description": "Environmental Protection Agency emission standards compliance",
-                "impact": "medium",
-                "estimated_effort": "2-4 months",
-                "cost_estimate": "$25,000 - $75,000"
-            }
-        ])
-        
-        if model.lower() in ["kc390", "kc-390"]:
-            gaps.append({
-                "category": "Military/Export Control",
-                "requirement": "ITAR Compliance",
-                "current_status": "Required",
-                "gap_description": "International Traffic in Arms Regulations compliance for military aircraft",
-                "impact": "critical",
-                "estimated_effort": "12-24 months",
-                "cost_estimate": "$500,000 - $2,000,000"
-            })
-            overall_risk = "high"
-        
-        recommendations.extend([
-            "Engage FAA-certified representative early in the process",
-            "Prepare comprehensive technical documentation package",
-            "Schedule pre-application meetings with FAA",
-            "Consider type certificate validation pathway if original certification exists"
-        ])
-    
-    # EU-specific gaps
-    elif target_country.upper() == "EU":
-        gaps.extend([
-            {
-                "category": "Type Certification",
-                "requirement": "EASA Type Certificate",
-                "current_status": "Missing" if origin_country.upper() not in ["EU", "UK"] else "Available",
-                "gap_description": "EASA type certificate required for EU operations",
-                "impact": "high",
-                "estimated_effort": "8-14 months",
-                "cost_estimate": "$300,000 - $1,200,000"
-            },
-            {
-                "category": "Environmental",
-                "requirement": "ICAO Annex 16 Compliance",
-                "current_status": "Verification Required",
-                "gap_description": "Strict noise and emission limits per ICAO Annex 16",
-                "impact": "high",
-                "estimated_effort": "4-8 months",
-                "cost_estimate": "$100,000 - $300,000"
-            },
-            {
-                "category": "Safety",
-                "requirement": "EASA Safety Assessment",
-                "current_status": "Required",
-                "gap_description": "Comprehensive safety assessment per EASA requirements",
-                "impact": "medium",
-                "estimated_effort": "6-10 months",
-                "cost_estimate": "$150,000 - $400,000"
-            }
-        ])
-        
-        recommendations.extend([
-            "Engage EASA early through pre-certification meetings",
-            "Ensure compliance with latest environmental standards",
-            "Prepare for extensive documentation requirements",
-            "Consider bilateral agreement benefits with origin country"
-        ])
-    
-    # UK-specific gaps (post-Brexit)
-    elif target_country.upper() == "UK":
-        gaps.extend([
-            {
-                "category": "Type Certification",
-                "requirement": "UK CAA Type Certificate",
-                "current_status": "Required",
-                "gap_description": "Post-Brexit requirement for separate UK type certificate",
-                "impact": "high",
-                "estimated_effort": "6-12 months",
-                "cost_estimate": "$200,000 - $800,000"
-            },
-            {
-                "category": "Brexit Transition",
-                "requirement": "UK Aviation Transition Documentation",
-                "current_status": "Required",
-                "gap_description": "Additional documentation due to UK's exit from EASA framework",
-                "impact": "medium",
-                "estimated_effort": "3-6 months",
-                "cost_estimate": "$50,000 - $150,000"
-            }
-        ])
-        
-        overall_risk = "medium"
-        recommendations.extend([
-            "Navigate post-Brexit regulatory framework carefully",
-            "Consider expedited pathways for existing EASA certifications",
-            "Prepare for additional UK-specific requirements"
-        ])
-    
-    # Canada-specific gaps
-    elif target_country.upper() == "CA":
-        gaps.extend([
-            {
-                "category": "Type Certification",
-                "requirement": "Transport Canada Type Certificate",
-                "current_status": "Missing" if origin_country.upper() != "CA" else "Available",
-                "gap_description": "Transport Canada type certificate or validation required",
-                "impact": "high",
-                "estimated_effort": "4-8 months",
-                "cost_estimate": "$150,000 - $600,000"
-            },
-            {
-                "category": "Bilateral Agreement",
-                "requirement": "BASA Agreement Benefits",
-                "current_status": "Available" if origin_country.upper() in ["US", "BR"] else "Not Available",
-                "gap_description": "Bilateral Aviation Safety Agreement may expedite certification",
-                "impact": "positive",
-                "estimated_effort": "Reduced timeline",
-                "cost_estimate": "Cost savings possible"
-            }
-        ])
-        
-        if origin_country.upper() in ["US", "BR"]:
-            overall_risk = "low"
-            estimated_timeline = "3-6 months"
-            recommendations.append("Leverage BASA agreement for expedited certification")
-    
-    # Calculate overall metrics
-    high_impact_gaps = len([g for g in gaps if g.get("impact") == "high"])
-    critical_gaps = len([g for g in gaps if g.get("impact") == "critical"])
-    
-    if critical_gaps > 0:
-        overall_risk = "critical"
-        estimated_timeline = "12-24 months"
-    elif high_impact_gaps > 2:
-        overall_risk = "high"
-        estimated_timeline = "8-15 months"
-    
-    return {
-        "analysis": {
-            "model": model,
-            "originCountry": f"{origin_info['name']} ({origin_info['authority']})",
-            "targetCountry": f"{target_info['name']} ({target_info['authority']})",
-            "analysisDate": origin_compliance.generated_at
-        },
-        "summary": {
-            "totalGaps": len(gaps),
-            "criticalGaps": critical_gaps,
-            "highImpactGaps": high_impact_gaps,
-            "overallRisk": overall_risk,
-            "estimatedTimeline": estimated_timeline,
-            "estimatedCostRange": _calculate_cost_range(gaps)
-        },
-        "gaps": gaps,
-        "recommendations": recommendations,
-        "actionPlan": _generate_action_plan(gaps, target_country),
-        "regulatoryContext": {
-            "originFramework": _get_regulatory_framework(origin_country),
-            "targetFramework": _get_regulatory_framework(target_country),
-            "bilateralAgreements": _check_bilateral_agreements(origin_country, target_country)
-        }
-    }
-
-
-def _calculate_cost_range(gaps):
-    """Calculate estimated cost range for addressing all gaps."""
-    min_cost = 0
-    max_cost = 0
-    
-    for gap in gaps:
-        cost_str = gap.get("cost_estimate", "$0 - $0")
-        # Extract numbers from cost estimate string
-        import re
-        numbers = re.findall(r'\$?([\d,]+)', cost_str)
-        if len(numbers) >= 2:
-            min_val = int(numbers[0].replace(',', ''))
-            max_val = int(numbers[1].replace(',', ''))
-            min_cost += min_val
-            max_cost += max_val
-    
-    return f"${min_cost:,} - ${max_cost:,}"
-
+async def _gap_matrices(
+    compliance_service: EnhancedComplianceService,
+    models: List[AircraftModel],
+    origins: Optional[List[Country]],
+    targets: Optional[List[Country]]
+) -> Dict[str, Any]:
+    """Gap matrices for several models, validating each (model, country) once."""
+    origin_codes = [country.value for country in (origins or list(Country))]
+    target_codes = [country.value for country in (targets or list(Country))]
+    countries = list(dict.fromkeys(origin_codes + target_codes))
+    model_codes = [model.value for model in dict.fromkeys(models)]
+
+    matrices = []
+    for model in model_codes:
+        # Cells come from the rule book; a pair is left empty when its inputs fail validation
+        errors = await compliance_service.validation_errors(model, countries)
+        matrix = gap_rules.matrix(model, origin_codes, target_codes, unavailable=errors)
+        matrix["errors"] = errors
+        matrices.append(matrix)
+
+    return {"columns": list(MATRIX_COLUMNS), "matrices": matrices}
+
+
+@router.get("/gap-matrix/{model}", operation_id="gap_analysis_matrix")
+async def gap_analysis_matrix(
+    model: Annotated[AircraftModel, Path(description="Aircraft model", examples=["E175"])],
+    origins: Annotated[Optional[List[Country]], Query(description="Origin countries (default: all)")] = None,
+    targets: Annotated[Optional[List[Country]], Query(description="Target countries (default: all)")] = None,
+    compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
+):
+    """
+    Gap summary for every origin x target pair of one aircraft model.
 
-def _generate_action_plan(gaps, target_country):
-    """Generate prioritized action plan based on gaps."""
-    action_items = []
-    
-    # Prioritize critical and high-impact gaps
-    critical_gaps = [g for g in gaps if g.get("impact") == "critical"]
-    high_gaps = [g for g in gaps if g.get("impact") == "high"]
-    
-    phase = 1
-    
-    if critical_gaps:
-        action_items.append({
-            "phase": phase,
-            "title": "Critical Requirements (Immediate Action)",
-            "duration": "0-3 months",
-            "items": [f"Address {gap['requirement']}: {gap['gap_description']}" for gap in critical_gaps]
-        })
-        phase += 1
-    
-    if high_gaps:
-        action_items.append({
-            "phase": phase,
-            "title": "High Priority Certifications",
-            "duration": "3-8 months",
-            "items": [f"Complete {gap['requirement']}: {gap['gap_description']}" for gap in high_gaps]
-        })
-        phase += 1
-    
-    action_items.append({
-        "phase": phase,
-        "title": "Final Validation and Documentation",
-        "duration": "1-2 months",
-        "items": [
-            "Submit final certification package",
-            "Coordinate with target authority for final review",
-            "Prepare for operational approval",
-            "Finalize compliance documentation"
-        ]
-    })
-    
-    return action_items
+    ``cells[i][j]`` holds the ``columns`` values for ``origins[i]`` -> ``targets[j]``;
+    it is null on the diagonal and for countries listed in ``errors``.
+    """
+    try:
+        result = await _gap_matrices(compliance_service, [model], origins, targets)
+        matrix = result["matrices"][0]
+        log_business_event("gap_matrix_completed", {"models": [model.value], "cells": len(matrix["origins"]) * len(matrix["targets"])})
+        return {"columns": result["columns"], **matrix}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Gap matrix failed: {str(e)}")
 
 
-def _get_regulatory_framework(country_code):
-    """Get regulatory framework information for a country."""
-    frameworks = {
-        "BR": {
-            "authority": "ANAC Brasil",
-            "framework": "RBAC (Regulamento Brasileiro da Aviação Civil)",
-            "standards": "ICAO compliant with local adaptations",
-            "strengths": ["Strong commercial aviation framework", "BASA agreements with US/Canada"]
-        },
-        "US": {
-            "authority": "FAA",
-            "framework": "Federal Aviation Regulations (FAR)",
-            "standards": "Most stringent global standards",
-            "strengths": ["Comprehensive safety oversight", "Advanced certification processes"]
-        },
-        "EU": {
-            "authority": "EASA",
-            "framework": "European Aviation Safety Regulations",
-            "standards": "Harmonized European standards",
-            "strengths": ["Environmental leadership", "Unified European market access"]
-        },
-        "UK": {
-            "authority": "UK CAA",
-            "framework": "UK Aviation Regulations (post-Brexit)",
-            "standards": "Based on EASA with UK modifications",
-            "strengths": ["Flexible post-Brexit framework", "Experienced regulator"]
-        },
-        "CA": {
-            "authority": "Transport Canada",
-            "framework": "Canadian Aviation Regulations (CARs)",
-            "standards": "ICAO compliant with bilateral agreements",
-            "strengths": ["BASA agreements", "Streamlined processes"]
-        }
-    }
-    
-    return frameworks.get(country_code.upper(), {
-        "authority": "Unknown",
-        "framework": "Country-specific regulations",
-        "standards": "Typically ICAO based",
-        "strengths": ["Varies by country"]
-    })
-
-
-def _check_bilateral_agreements(origin_country, target_country):
-    """Check for bilateral aviation safety agreements."""
-    basa_pairs = [
-        ("BR", "US"), ("US", "BR"),
-        ("BR", "CA"), ("CA", "BR"),
-        ("US", "CA"), ("CA", "US"),
-        ("EU", "US"), ("US", "EU"),
-        ("EU", "CA"), ("CA", "EU")
-    ]
-    
-    pair = (origin_country.upper(), target_country.upper())
-    has_basa = pair in basa_pairs
-    
-    return {
-        "hasBilateralAgreement": has_basa,
-        "agreementType": "BASA (Bilateral Aviation Safety Agreement)" if has_basa else "None",
-        "benefits": [
-            "Expedited certification process",
-            "Mutual recognition of certifications",
-            "Reduced documentation requirements",
-            "Cost and time savings"
-        ] if has_basa else [],
-        "limitations": [] if has_basa else [
-            "Full certification process required",
-            "Extended timeline and costs",
-            "Potential for regulatory differences"
-        ]
-    }
+@router.get("/gap-matrix", operation_id="gap_analysis_matrices")
+async def gap_analysis_matrices(
+    models: Annotated[List[AircraftModel], Query(min_length=1, max_length=len(AircraftModel), description="Aircraft models")],
+    origins: Annotated[Optional[List[Country]], Query(description="Origin countries (default: all)")] = None,
+    targets: Annotated[Optional[List[Country]], Query(description="Target countries (default: all)")] = None,
+    compliance_service: EnhancedComplianceService = Depends(get_compliance_service)
+):
+    """Gap matrices for several aircraft models in one request."""
+    try:
+        result = await _gap_matrices(compliance_service, models, origins, targets)
+        log_business_event("gap_matrix_completed", {"models": [model.value for model in models]})
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Gap matrix failed: {str(e)}")
 
 
 @router.get("/", operation_id="compliance_root")
@@ -827,6 +670,10 @@ async def compliance_root():
             "ai_analysis": "/compliance/ai-analysis/{model}/{country}",
             "models": "/compliance/models",
             "regulations": "/compliance/regulations/{model}/{country}",
+            "regulation_search": "/compliance/regulations/search?q=",
+            "regulation_fulltext": "/compliance/regulations/fulltext?q=",
+            "gap_matrix": "/compliance/gap-matrix/{model}",
+            "history": "/compliance/history/{model}?days=30",
             "authorities": "/compliance/authorities",
             "aircraft": "/compliance/aircraft",
             "health": "/compliance/health"
@@ -34,6 +34,7 @@ class SystemMetrics(BaseModel):
     requests_per_minute: float = Field(..., description="Requests per minute rate")
     last_request_time: Optional[str] = Field(..., description="Timestamp of last request")
     active_endpoints: int = Field(..., description="Number of active endpoints")
+    workers: int = Field(1, description="Worker processes merged into these figures")
 
 
 class MetricsResponse(BaseModel):
@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     database_max_overflow: int = 20
     database_pool_timeout: int = 30
     database_pool_recycle: int = 1800
+    database_create_tables: Optional[bool] = None  # create_all at startup; None = SQLite only (PostgreSQL uses Alembic)
     
     # Redis Configuration
     redis_host: str = "localhost"
@@ -39,16 +40,51 @@ class Settings(BaseSettings):
         "http://localhost:5173",  # Local development
         "http://127.0.0.1:5173"   # Local development alternative
     ]
+    rate_limit_enabled: bool = True  # Per-client token buckets; the benchmark suite turns them off to measure the app itself
     
     # Monitoring Configuration
     prometheus_metrics_enabled: bool = True
     system_metrics_enabled: bool = True
     metrics_update_interval: int = 30  # seconds
     openmetrics_support: bool = True
+    prometheus_multiproc_dir: Optional[str] = None  # Set via the PROMETHEUS_MULTIPROC_DIR env var to merge metrics across workers
     
     # Performance Configuration
     max_cache_size: int = 1000  # Maximum number of cached items
+    local_cache_enabled: bool = True  # In-process LRU tier in front of Redis; invalidations reach every worker over Redis pub/sub
+    http_cache_control: str = "no-cache"  # Sent with ETagged responses; clients revalidate with If-None-Match
+    content_version_ttl_seconds: float = 5.0  # Re-read the catalog tables' (count, max(updated_at)) signature at most this often
+    compression_enabled: bool = True  # Negotiated gzip/brotli response compression
+    compression_minimum_size: int = 1024  # Bodies smaller than this (bytes) are sent uncompressed
+    compression_gzip_level: int = 6  # zlib level 1-9; 6 is close to 9 in size at a fraction of the CPU
+    compression_brotli_quality: int = 5  # Brotli quality 0-11 (needs the optional brotli package)
     cache_eviction_policy: str = "allkeys-lru"
+    model_resolver_ttl_seconds: int = 300  # Rebuild the designation trie at least this often (0 = only on invalidation)
+    ai_preload_models: bool = False  # Start loading Hugging Face models at startup instead of on first AI request
+    ai_inference_workers: int = 1  # Executor threads running model inference off the event loop
+    ai_inference_queue_size: int = 8  # Tasks allowed to wait for a worker before new ones are rejected
+    ai_inference_timeout_seconds: float = 10.0  # Per-task limit before the analyzer falls back to rules
+    ai_inference_torch_threads: int = 0  # torch intra-op threads per worker (0 = torch default)
+    ai_embedding_cache_dir: Optional[str] = None  # Persist reference embeddings here (None = recompute on load)
+    ai_backend: str = "torch"  # Classifier/encoder runtime: "torch" (transformers pipelines) or "onnx" (onnxruntime)
+    ai_onnx_model_dir: str = "models/onnx"  # Exports written by scripts/export_onnx_models.py
+    ai_onnx_quantized: bool = True  # Serve the int8 dynamically quantized export
+    ai_model_server_socket: Optional[str] = None  # Unix socket of the model server sidecar (None = load models in-process)
+    ai_model_server_ready_timeout_seconds: float = 600.0  # How long workers wait for the sidecar to load a model
+    ai_model_artifacts_dir: Optional[str] = None  # Versioned model snapshots (None = load by hub name)
+    ai_models_offline: bool = False  # Never contact the Hugging Face hub; require local snapshots
+    ai_model_verify_checksums: bool = True  # Verify snapshot SHA-256 manifests before loading
+    ai_batch_max_size: int = 16  # Most concurrent requests combined into one forward pass
+    ai_batch_max_wait_ms: float = 5.0  # How long the first request of a batch waits for others
+    ai_cache_ttl_seconds: int = 3600  # AI analysis results are deterministic per model and knowledge-base version
+    ai_cache_warm_on_startup: bool = False  # Precompute AI analysis for every known (aircraft, country) pair, again once models load; imports the AI service at startup
+    regulation_index_dir: str = "data/regulation_index"  # Memory-mapped regulation embeddings for semantic search
+    
+    # Compliance History Retention
+    compliance_history_enabled: bool = True  # Append every evaluated check to the partitioned compliance history
+    history_flush_interval_seconds: float = 1.0  # Checks are queued and written in one background batch per interval
+    history_raw_retention_days: int = 90  # Raw checks older than this are compacted into daily rollups
+    history_rollup_retention_days: int = 730  # Daily rollups older than this are deleted
     
     class Config:
         env_file = ".env"
@@ -79,6 +79,18 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def create_tables_on_startup() -> bool:
+    """Whether the application should run ``create_all`` when it boots.
+
+    PostgreSQL schemas are owned by Alembic (``alembic upgrade head``), so by
+    default only SQLite files, used for local development and tests, are
+    bootstrapped at startup. ``settings.database_create_tables`` overrides this.
+    """
+    if settings.database_create_tables is not None:
+        return settings.database_create_tables
+    return engine.dialect.name == "sqlite"
+
+
 async def create_tables():
     """Create all database tables."""
     # Import models to register them with Base.metadata
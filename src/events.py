@@ -0,0 +1,53 @@
+"""
+Write notifications for in-process caches and derived tables built on repository data.
+
+Repositories publish a topic after each write; the services that cache that
+data (designation resolver, search index, dataset version) subscribe when
+they are imported, so the data layer never imports the services. Services
+that keep derived rows in step with a table (applicability links) register a
+write hook instead, which the repository awaits in its own session before
+the listeners run.
+"""
+
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, DefaultDict, Iterable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+AIRCRAFT_MODELS = "aircraft_models"
+AUTHORITIES = "authorities"
+REGULATIONS = "regulations"
+
+TOPICS = (AIRCRAFT_MODELS, AUTHORITIES, REGULATIONS)
+
+WriteHook = Callable[[AsyncSession, List[str]], Awaitable[Any]]
+
+_listeners: DefaultDict[str, List[Callable[[], None]]] = defaultdict(list)
+_write_hooks: DefaultDict[str, List[WriteHook]] = defaultdict(list)
+
+
+def subscribe(topic: str, listener: Callable[[], None]) -> None:
+    """Call ``listener`` after every write published on ``topic``."""
+    if listener not in _listeners[topic]:
+        _listeners[topic].append(listener)
+
+
+def on_write(topic: str, hook: WriteHook) -> None:
+    """Await ``hook(session, ids)`` after every repository write on ``topic``."""
+    if hook not in _write_hooks[topic]:
+        _write_hooks[topic].append(hook)
+
+
+def publish(topic: str) -> None:
+    """Notify the subscribers of ``topic`` that its table changed."""
+    for listener in list(_listeners[topic]):
+        listener()
+
+
+async def written(topic: str, session: AsyncSession, ids: Iterable[str]) -> None:
+    """Run the write hooks of ``topic`` for the committed rows ``ids``, then publish it."""
+    ids = list(ids)
+    for hook in list(_write_hooks[topic]):
+        await hook(session, ids)
+    publish(topic)
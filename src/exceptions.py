@@ -325,6 +325,47 @@ class ExternalServiceError(AppException):
         )
 
 
+class InferenceUnavailableError(AppException):
+    """
+    Exception raised when AI inference cannot run.
+    
+    Used by the inference executor when its queue is full or a task exceeds
+    its timeout, so callers can degrade to rule-based analysis.
+    """
+    
+    def __init__(
+        self, 
+        message: str,
+        error_code: str = "INFERENCE_UNAVAILABLE",
+        task: Optional[str] = None,
+        reason: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize inference unavailable error.
+        
+        Args:
+            message: Human-readable error message
+            error_code: Specific inference error code
+            task: Name of the inference task
+            reason: Why the task did not run ('saturated' or 'timeout')
+            context: Additional inference context
+        """
+        inference_context = context or {}
+        if task:
+            inference_context["task"] = task
+        if reason:
+            inference_context["reason"] = reason
+            
+        super().__init__(
+            message=message,
+            error_code=error_code,
+            error_type="INFERENCE_UNAVAILABLE",
+            context=inference_context,
+            status_code=503
+        )
+
+
 class RateLimitError(AppException):
     """
     Exception raised when rate limits are exceeded.
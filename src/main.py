@@ -1,4 +1,5 @@
 """Main application file with database and cache management."""
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,9 +7,9 @@ from src.api import compliance
 from src.api import metrics
 from src.api import cache
 from src.api import analytics
-from src.database import create_tables
-from src.middleware import PerformanceMiddleware, create_rate_limit_middleware
-from src.logger import RequestLoggingMiddleware, setup_logging
+from src.database import create_tables, create_tables_on_startup
+from src.middleware import CompressionMiddleware, ConditionalRequestMiddleware, PerformanceMiddleware, create_rate_limit_middleware
+from src.logger import RequestLoggingMiddleware, get_logging_config, setup_logging
 from src.services.cache_service import cache_service
 from src.config import settings
 from src.error_handlers import register_exception_handlers
@@ -17,13 +18,32 @@ from src.error_handlers import register_exception_handlers
 async def lifespan(app: FastAPI):
     """Manage application lifecycle with database, Redis connection, and monitoring."""
     # Startup: Initialize database and connect to Redis
-    setup_logging()  # Initialize logging first
+    setup_logging(level=get_logging_config().level)  # Initialize logging first; LOG_LEVEL overrides INFO
     
-    await create_tables()  # Create database tables
+    if create_tables_on_startup():
+        await create_tables()  # SQLite bootstrap; PostgreSQL schemas come from migrations
+    
+    # Backfill the regulation/model join table for databases seeded before it was used
+    from src.database import AsyncSessionLocal
+    from src.services.applicability_service import ensure_applicability_materialized
+    from src.services.regulation_fts import ensure_fts_index
+    async with AsyncSessionLocal() as session:
+        await ensure_applicability_materialized(session)
+        await ensure_fts_index(session)  # SQLite FTS5 table and sync triggers
     
     if settings.cache_enabled:
         await cache_service.connect()
     
+    # Warm AI models in a background thread; the API serves rule-based analysis until they are ready.
+    # The AI service is imported only when startup uses it; otherwise the first AI request loads it
+    if settings.ai_preload_models or settings.ai_cache_warm_on_startup:
+        from src.services.aviation_ai_service import aviation_ai_analyzer
+        if settings.ai_preload_models:
+            aviation_ai_analyzer.start_model_loading()
+        if settings.ai_cache_warm_on_startup:
+            # In the background: it waits for model loading so warmed keys carry the model versions
+            aviation_ai_analyzer.schedule_result_cache_warm()
+    
     # Log startup completion
     from src.logger import get_logger
     logger = get_logger(__name__)
@@ -40,6 +60,17 @@ async def lifespan(app: FastAPI):
     if middleware_instance:
         middleware_instance.shutdown()
     
+    # Stop AI cache warm-up (if the AI service was ever loaded) and inference workers
+    ai_service = sys.modules.get("src.services.aviation_ai_service")
+    if ai_service is not None:
+        ai_service.aviation_ai_analyzer.cancel_result_cache_warm()
+    from src.services.inference_executor import inference_executor
+    inference_executor.shutdown()
+    
+    # Write the compliance history still queued by the last checks
+    from src.services.history_recorder import history_recorder
+    await history_recorder.flush()
+    
     # Disconnect from Redis
     if cache_service.is_connected:
         await cache_service.disconnect()
@@ -97,6 +128,13 @@ app = FastAPI(
 # Register global exception handlers
 register_exception_handlers(app)
 
+# Answer If-None-Match revalidations before routing (innermost, so 304s are still metered)
+app.add_middleware(ConditionalRequestMiddleware)
+
+# Negotiated gzip/brotli; precompressed cached reports pass through untouched
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -115,7 +153,8 @@ if settings.prometheus_metrics_enabled:
 
 app.add_middleware(PerformanceMiddleware)             # Performance monitoring
 app.add_middleware(RequestLoggingMiddleware)          # Request correlation
-app.add_middleware(create_rate_limit_middleware())    # Last to add = First to execute (innermost)
+if settings.rate_limit_enabled:
+    app.add_middleware(create_rate_limit_middleware())    # Last to add = First to execute (innermost)
 
 @app.get("/", tags=["Health"])
 def read_root():
@@ -148,6 +187,13 @@ async def health_check():
     else:
         monitoring_status = {"prometheus_metrics": "disabled"}
     
+    # Read only if already loaded: importing the AI service here would undo its deferred import
+    ai_service = sys.modules.get("src.services.aviation_ai_service")
+    if ai_service is not None:
+        ai_models = ai_service.aviation_ai_analyzer.model_status()
+    else:
+        ai_models = {"status": "not_started", "models": {}, "serving": "rule_based_fallback"}
+    
     return {
         "status": "healthy",
         "service": settings.app_name,
@@ -157,6 +203,7 @@ async def health_check():
         "database": "sqlite",
         "cache": cache_stats,
         "monitoring": monitoring_status,
+        "ai_models": ai_models,
         "rate_limits": {
             "compliance_endpoint": "30 requests/minute",
             "metrics_endpoint": "120 requests/minute", 
@@ -8,14 +8,23 @@ import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from transformers import pipeline, AutoTokenizer, AutoModel
-import torch
 from sentence_transformers import SentenceTransformer
 import logging
 
+from src.config import settings
+from src.services.embedding_index import EmbeddingIndex
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Casos de referência para a análise de similaridade
+REFERENCE_CASES = (
+    "Commercial aircraft with FAA certification operating in US airspace",
+    "Regional jet with EASA certification for European operations",
+    "Business jet with multiple international certifications"
+)
+
 @dataclass
 class ComplianceAnalysis:
     aircraft: str
@@ -35,13 +44,23 @@ class AviationMcpServer:
     
     def __init__(self):
         self.models = {}
+        self.reference_index: Optional[EmbeddingIndex] = None
         self.aircraft_knowledge = {}
         self.regulation_database = {}
         self._initialize_models()
         self._load_knowledge_base()
     
     def _initialize_models(self):
-        """Inicializa os modelos do Hugging Face"""
+        """Inicializa os modelos do Hugging Face: ONNX, PyTorch, modelos leves ou só regras"""
+        if settings.ai_backend == "onnx":
+            try:
+                self._initialize_onnx_models()
+                return
+            except Exception as e:
+                # Exportação ou sessão do onnxruntime falhou: segue para os modelos PyTorch
+                logger.error(f"Erro ao inicializar modelos ONNX, usando PyTorch: {e}")
+                self._clear_models()
+        
         try:
             logger.info("Inicializando modelos do Hugging Face...")
             
@@ -76,6 +95,8 @@ class AviationMcpServer:
                 "microsoft/deberta-v3-base"
             )
             
+            self._build_reference_index('sentence-transformers/all-MiniLM-L6-v2')
+            
             logger.info("Modelos inicializados com sucesso!")
             
         except Exception as e:
@@ -86,13 +107,43 @@ class AviationMcpServer:
     def _initialize_fallback_models(self):
         """Modelos de fallback mais leves"""
         logger.info("Inicializando modelos de fallback...")
+        self._clear_models()
         
-        self.models['classifier'] = pipeline(
-            "sentiment-analysis",
-            model="distilbert-base-uncased-finetuned-sst-2-english"
+        try:
+            self.models['classifier'] = pipeline(
+                "sentiment-analysis",
+                model="distilbert-base-uncased-finetuned-sst-2-english"
+            )
+            
+            self.models['similarity'] = SentenceTransformer('all-MiniLM-L6-v2')
+            self._build_reference_index('all-MiniLM-L6-v2')
+        except Exception as e:
+            # Sem modelos a análise segue só com as regras de _synthesize_results
+            logger.error(f"Erro ao inicializar modelos de fallback, usando análise baseada em regras: {e}")
+            self._clear_models()
+    
+    def _clear_models(self):
+        """Descarta modelos carregados pela metade antes de tentar o próximo backend"""
+        self.models.clear()
+        self.reference_index = None
+    
+    def _initialize_onnx_models(self):
+        """Classificador e encoder via onnxruntime (int8), sem torch no caminho de inferência"""
+        from src.services.onnx_backend import OnnxSentenceEncoder, OnnxTextClassifier
+        
+        logger.info("Inicializando modelos ONNX...")
+        self.models['classifier'] = OnnxTextClassifier.from_model_id("distilbert-base-uncased-finetuned-sst-2-english")
+        self.models['similarity'] = OnnxSentenceEncoder.from_model_id("sentence-transformers/all-MiniLM-L6-v2")
+        self._build_reference_index("sentence-transformers/all-MiniLM-L6-v2@onnx")
+    
+    def _build_reference_index(self, model_name: str):
+        """Codifica os casos de referência uma vez, junto com o modelo de similaridade"""
+        self.reference_index = EmbeddingIndex.build(
+            self.models['similarity'],
+            REFERENCE_CASES,
+            model_name=model_name,
+            cache_dir=settings.ai_embedding_cache_dir
         )
-        
-        self.models['similarity'] = SentenceTransformer('all-MiniLM-L6-v2')
     
     def _load_knowledge_base(self):
         """Carrega base de conhecimento sobre aviação"""
@@ -273,29 +324,15 @@ class AviationMcpServer:
                 results['insights'] = insights
             
             # 4. Análise de similaridade com casos conhecidos
-            if 'similarity' in self.models:
-                # Comparar com casos de referência
-                reference_cases = [
-                    "Commercial aircraft with FAA certification operating in US airspace",
-                    "Regional jet with EASA certification for European operations",
-                    "Business jet with multiple international certifications"
+            if 'similarity' in self.models and self.reference_index is not None:
+                # Comparar com casos de referência: um encode + um produto matriz-vetor
+                matches = self.reference_index.search(
+                    self.models['similarity'], context, len(self.reference_index)
+                )
+                results['similarity_analysis'] = [
+                    {'case': self.reference_index.texts[idx], 'similarity': similarity}
+                    for idx, similarity in matches
                 ]
-                
-                similarities = []
-                context_embedding = self.models['similarity'].encode([context])
-                
-                for ref_case in reference_cases:
-                    ref_embedding = self.models['similarity'].encode([ref_case])
-                    similarity = torch.cosine_similarity(
-                        torch.tensor(context_embedding),
-                        torch.tensor(ref_embedding)
-                    ).item()
-                    similarities.append({
-                        'case': ref_case,
-                        'similarity': similarity
-                    })
-                
-                results['similarity_analysis'] = similarities
             
         except Exception as e:
             logger.error(f"Erro na análise multi-modelo: {e}")
@@ -2,10 +2,14 @@
 Middleware package for FastAPI application.
 """
 
+from .compression import CompressionMiddleware
+from .conditional import ConditionalRequestMiddleware
 from .performance import PerformanceMiddleware, get_metrics, get_endpoint_metrics, reset_metrics
 from .rate_limit import RateLimitMiddleware, RateLimitConfig, create_rate_limit_middleware, ENDPOINT_CONFIGS
 
 __all__ = [
+    "CompressionMiddleware",
+    "ConditionalRequestMiddleware",
     "PerformanceMiddleware",
     "get_metrics", 
     "get_endpoint_metrics",
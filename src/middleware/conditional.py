@@ -0,0 +1,68 @@
+"""
+HTTP conditional request middleware.
+
+Adds strong ETags and Cache-Control to rarely changing GET endpoints and
+answers a matching ``If-None-Match`` with 304 Not Modified before the request
+reaches the router, so revalidations cost neither a database query nor a
+service call.
+"""
+
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.config import settings
+from src.services.content_version import content_version, etag_matches
+
+
+CATALOG_PATHS = frozenset({"/compliance/models", "/compliance/authorities", "/compliance/aircraft"})
+REPORT_PATH_PREFIX = "/compliance/check/"
+
+
+class ConditionalRequestMiddleware(BaseHTTPMiddleware):
+    """Serve 304 for unchanged catalog and compliance report responses.
+
+    Catalog ETags come from the dataset version, which is refreshed from the
+    database signature (at most every few seconds) first. Report ETags are set
+    by the report endpoint, which hashes the body it sends and records it with
+    ``content_version.report_etag``; until a report has been served once at
+    the current version, its requests simply pass through.
+    """
+
+    def __init__(self, app, catalog_paths: Iterable[str] = CATALOG_PATHS, report_prefix: str = REPORT_PATH_PREFIX):
+        super().__init__(app)
+        self.catalog_paths = frozenset(catalog_paths)
+        self.report_prefix = report_prefix
+
+    def _current_etag(self, path: str) -> Optional[str]:
+        if path in self.catalog_paths:
+            return content_version.dataset_etag(path)
+        if path.startswith(self.report_prefix):
+            return content_version.known_report_etag(path)
+        return None
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        if request.method != "GET" or (path not in self.catalog_paths and not path.startswith(self.report_prefix)):
+            return await call_next(request)
+
+        # Taken before the handler runs: a write racing this request leaves
+        # the client with an older tag, never newer data under a stale one
+        await content_version.refresh()
+        etag = self._current_etag(path)
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": settings.http_cache_control}
+            )
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        if path in self.catalog_paths:
+            response.headers["ETag"] = etag
+        if "etag" in response.headers:
+            response.headers.setdefault("Cache-Control", settings.http_cache_control)
+        return response
@@ -3,14 +3,19 @@ Performance monitoring middleware for FastAPI application.
 Tracks response times, request counts, and other performance metrics.
 """
 
+import json
+import os
 import time
-from typing import Dict, Optional, Callable
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Callable
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 import threading
 
+from src.config import settings
+
 
 class PerformanceMetrics:
     """Thread-safe performance metrics collector."""
@@ -33,6 +38,7 @@ class PerformanceMetrics:
         # System metrics
         self.start_time = datetime.now()
         self.last_request_time: Optional[datetime] = None
+        self.workers = 1
     
     def record_request(self, endpoint: str, method: str, response_time: float, status_code: int):
         """Record metrics for a completed request."""
@@ -109,7 +115,8 @@ class PerformanceMetrics:
                 "avg_response_time": sum(all_response_times) / len(all_response_times) if all_response_times else 0,
                 "requests_per_minute": total_requests / (uptime.total_seconds() / 60) if uptime.total_seconds() > 0 else 0,
                 "last_request_time": self.last_request_time.isoformat() if self.last_request_time else None,
-                "active_endpoints": len(self.request_count)
+                "active_endpoints": len(self.request_count),
+                "workers": self.workers
             }
     
     def get_all_metrics(self) -> Dict:
@@ -126,9 +133,152 @@ class PerformanceMetrics:
             }
 
 
+    def snapshot(self) -> Dict:
+        """JSON-serializable copy of the raw counters and response-time samples."""
+        with self._lock:
+            return {
+                "max_history": self.max_history,
+                "workers": self.workers,
+                "start_time": self.start_time.isoformat(),
+                "last_request_time": self.last_request_time.isoformat() if self.last_request_time else None,
+                "request_count": dict(self.request_count),
+                "error_count": dict(self.error_count),
+                "response_times": {key: list(times) for key, times in self.response_times.items()},
+                "total_response_time": dict(self.total_response_time),
+                "status_codes": {key: dict(codes) for key, codes in self.status_codes.items()},
+            }
+    
+    @classmethod
+    def merged(cls, snapshots: Iterable[Dict]) -> "PerformanceMetrics":
+        """Combine worker snapshots into one view.
+        
+        Counters are summed, response-time samples are pooled so percentiles
+        cover every worker, and uptime runs from the oldest worker's start.
+        """
+        snapshots = list(snapshots)
+        combined = cls(max_history=sum(snapshot["max_history"] for snapshot in snapshots) or 1000)
+        # Folded totals of exited workers report 0
+        combined.workers = sum(snapshot.get("workers", 1) for snapshot in snapshots)
+        for snapshot in snapshots:
+            combined.start_time = min(combined.start_time, datetime.fromisoformat(snapshot["start_time"]))
+            if snapshot["last_request_time"]:
+                last = datetime.fromisoformat(snapshot["last_request_time"])
+                combined.last_request_time = max(combined.last_request_time or last, last)
+            for key, count in snapshot["request_count"].items():
+                combined.request_count[key] += count
+            for key, count in snapshot["error_count"].items():
+                combined.error_count[key] += count
+            for key, times in snapshot["response_times"].items():
+                combined.response_times[key].extend(times)
+            for key, total in snapshot["total_response_time"].items():
+                combined.total_response_time[key] += total
+            for key, codes in snapshot["status_codes"].items():
+                for code, count in codes.items():
+                    combined.status_codes[key][int(code)] += count
+        return combined
+
+
+class MultiprocessMetricsStore:
+    """Per-worker metric snapshots in a directory shared by all workers.
+    
+    Each worker rewrites ``performance_<pid>.json`` at most once per
+    ``interval`` seconds (atomically, via rename); readers merge every file.
+    Point the directory at a tmpfs such as ``/dev/shm`` and files never touch
+    disk. When a worker exits, the master calls :meth:`retire` to fold its
+    counters into ``performance_totals.json`` and delete its snapshot, so
+    totals survive worker restarts without one file per dead PID. Snapshots
+    whose process is gone but was never retired are ignored by readers; the
+    directory is cleared when the server starts.
+    """
+    
+    TOTALS_NAME = "performance_totals.json"
+    
+    def __init__(self, directory: str, interval: float = 1.0):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._last_publish = 0.0
+    
+    @property
+    def path(self) -> Path:
+        # Resolved per call: workers fork after this module is imported
+        return self.directory / f"performance_{os.getpid()}.json"
+    
+    @property
+    def totals_path(self) -> Path:
+        return self.directory / self.TOTALS_NAME
+    
+    def publish(self, source: PerformanceMetrics, force: bool = False) -> None:
+        """Write this worker's snapshot unless one was written within ``interval``."""
+        now = time.monotonic()
+        if not force and now - self._last_publish < self.interval:
+            return
+        self._last_publish = now
+        self._write(self.path, source.snapshot())
+    
+    def load_all(self) -> List[Dict]:
+        """Retired totals plus the snapshot of every live worker."""
+        snapshots = []
+        for path in sorted(self.directory.glob("performance_*.json")):
+            if path.name != self.TOTALS_NAME and not _process_alive(path.stem[len("performance_"):]):
+                continue
+            snapshot = self._read(path)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+        return snapshots
+    
+    def retire(self, pid: int) -> None:
+        """Fold an exited worker's snapshot into the totals and delete it.
+        
+        Called from gunicorn's ``child_exit`` hook in the master, which is the
+        only writer of the totals file. Response-time samples are capped at
+        the worker's ``max_history`` so the totals stay bounded.
+        """
+        path = self.directory / f"performance_{pid}.json"
+        snapshot = self._read(path)
+        if snapshot is None:
+            return
+        totals = self._read(self.totals_path)
+        combined = PerformanceMetrics.merged([totals, snapshot] if totals else [snapshot]).snapshot()
+        history = snapshot["max_history"]
+        combined["max_history"] = history
+        combined["workers"] = 0
+        combined["response_times"] = {key: times[-history:] for key, times in combined["response_times"].items()}
+        self._write(self.totals_path, combined)
+        path.unlink(missing_ok=True)
+    
+    def _write(self, path: Path, snapshot: Dict) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _read(path: Path) -> Optional[Dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None  # Missing, removed or replaced mid-read
+
+
+def _process_alive(pid: str) -> bool:
+    """Whether ``pid`` names a running process (unknown names count as dead)."""
+    if not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+
 # Global metrics instance
 metrics = PerformanceMetrics()
 
+# Set when several workers share a metrics directory (see gunicorn.conf.py)
+metrics_store = MultiprocessMetricsStore(settings.prometheus_multiproc_dir) if settings.prometheus_multiproc_dir else None
+
 
 class PerformanceMiddleware(BaseHTTPMiddleware):
     """FastAPI middleware for performance monitoring."""
@@ -158,6 +308,8 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         
         # Record metrics
         metrics.record_request(endpoint, method, response_time, status_code)
+        if metrics_store is not None:
+            metrics_store.publish(metrics)
         
         # Add performance headers
         response.headers["X-Response-Time"] = f"{response_time:.3f}s"
@@ -165,14 +317,22 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def _current_view() -> PerformanceMetrics:
+    """This worker's metrics, or all workers merged in multi-process mode."""
+    if metrics_store is None:
+        return metrics
+    metrics_store.publish(metrics, force=True)
+    return PerformanceMetrics.merged(metrics_store.load_all())
+
+
 def get_metrics() -> Dict:
     """Get current performance metrics."""
-    return metrics.get_all_metrics()
+    return _current_view().get_all_metrics()
 
 
 def get_endpoint_metrics(endpoint: str, method: str = "GET") -> Dict:
     """Get metrics for a specific endpoint."""
-    return metrics.get_endpoint_metrics(endpoint, method)
+    return _current_view().get_endpoint_metrics(endpoint, method)
 
 
 def reset_metrics():
@@ -8,18 +8,21 @@ import re
 from typing import Dict, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import CollectorRegistry, Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST, multiprocess
 from prometheus_client.openmetrics.exposition import CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE_LATEST, generate_latest as openmetrics_generate_latest
-import psutil
 import threading
 import logging
 import asyncio
 
+from src.config import settings
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
 # Prometheus metrics definitions
+# Gauges declare how worker values combine when PROMETHEUS_MULTIPROC_DIR is set;
+# the mode is ignored in single-process mode.
 http_requests_total = Counter(
     'http_requests_total',
     'Total number of HTTP requests',
@@ -35,23 +38,27 @@ http_request_duration_seconds = Histogram(
 http_requests_in_progress = Gauge(
     'http_requests_in_progress',
     'Number of HTTP requests currently being processed',
-    ['method', 'endpoint']
+    ['method', 'endpoint'],
+    multiprocess_mode='livesum'
 )
 
 # System metrics
 system_cpu_percent = Gauge(
     'system_cpu_percent',
-    'System CPU usage percentage'
+    'System CPU usage percentage',
+    multiprocess_mode='livemostrecent'
 )
 
 system_memory_percent = Gauge(
     'system_memory_percent', 
-    'System memory usage percentage'
+    'System memory usage percentage',
+    multiprocess_mode='livemostrecent'
 )
 
 system_disk_percent = Gauge(
     'system_disk_percent',
-    'System disk usage percentage'
+    'System disk usage percentage',
+    multiprocess_mode='livemostrecent'
 )
 
 # Application-specific metrics
@@ -73,6 +80,48 @@ cache_operations_total = Counter(
     ['operation', 'success']
 )
 
+# AI inference metrics
+ai_inference_queue_wait_seconds = Histogram(
+    'ai_inference_queue_wait_seconds',
+    'Time AI inference tasks wait for an executor worker',
+    ['task'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+ai_inference_duration_seconds = Histogram(
+    'ai_inference_duration_seconds',
+    'Time spent running AI model inference on an executor worker',
+    ['task'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+ai_inference_batch_size = Histogram(
+    'ai_inference_batch_size',
+    'Number of requests combined into one batched forward pass',
+    ['model'],
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
+
+ai_inference_batched_latency_seconds = Histogram(
+    'ai_inference_batched_latency_seconds',
+    'Time from submitting an item to a micro-batcher until its result is ready',
+    ['model'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+ai_model_load_seconds = Gauge(
+    'ai_model_load_seconds',
+    'Time taken to load each AI model at startup',
+    ['model', 'status'],
+    multiprocess_mode='max'
+)
+
+ai_inference_rejected_total = Counter(
+    'ai_inference_rejected_total',
+    'AI inference tasks rejected or abandoned by the executor',
+    ['task', 'reason']
+)
+
 # Error metrics
 http_errors_total = Counter(
     'http_errors_total',
@@ -121,6 +170,9 @@ class PrometheusMetricsMiddleware(BaseHTTPMiddleware):
     
     def _update_system_metrics(self):
         """Update system metrics periodically with better error handling."""
+        # Imported on the monitor thread, off the application's startup path
+        import psutil
+        
         logger.info("System metrics monitoring started")
         
         while not self._shutdown_event.is_set():
@@ -303,13 +355,47 @@ def record_cache_operation(operation: str, success: bool):
     ).inc()
 
 
+def record_inference(task: str, queue_wait: float, duration: float):
+    """Record queue wait and run time of one AI inference task."""
+    ai_inference_queue_wait_seconds.labels(task=task).observe(queue_wait)
+    ai_inference_duration_seconds.labels(task=task).observe(duration)
+
+
+def record_inference_batch(model: str, size: int):
+    """Record the size of one batched forward pass."""
+    ai_inference_batch_size.labels(model=model).observe(size)
+
+
+def record_batched_latency(model: str, latency: float):
+    """Record end-to-end latency of one item served by a micro-batcher."""
+    ai_inference_batched_latency_seconds.labels(model=model).observe(latency)
+
+
+def record_model_load(model: str, seconds: float, success: bool):
+    """Record how long loading one AI model took."""
+    ai_model_load_seconds.labels(model=model, status="ready" if success else "failed").set(seconds)
+
+
+def record_inference_rejected(task: str, reason: str):
+    """Record an AI inference task rejected for saturation or timeout."""
+    ai_inference_rejected_total.labels(task=task, reason=reason).inc()
+
+
+def _exposition_registry():
+    """Registry to expose: every worker's samples merged in multi-process mode."""
+    if not settings.prometheus_multiproc_dir:
+        return None  # generate_latest defaults to this process's registry
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=settings.prometheus_multiproc_dir)
+    return registry
+
+
 def get_prometheus_metrics(openmetrics_format: bool = False) -> str:
     """Generate Prometheus metrics in text format with optional OpenMetrics support."""
     try:
-        if openmetrics_format:
-            return openmetrics_generate_latest().decode('utf-8')
-        else:
-            return generate_latest().decode('utf-8')
+        registry = _exposition_registry()
+        generate = openmetrics_generate_latest if openmetrics_format else generate_latest
+        return (generate(registry) if registry is not None else generate()).decode('utf-8')
     except Exception as e:
         logger.error(f"Error generating Prometheus metrics: {e}")
         return "# Error generating metrics\n"
@@ -30,6 +30,14 @@ class Regulation(BaseModel):
     applicability: List[str] = Field(
         description="List of aircraft models this regulation applies to"
     )
+    reference: Optional[str] = Field(
+        default=None,
+        description="Regulation reference code (defaults to the description when absent)",
+        examples=["RBAC 25.841", "14 CFR 25.562"]
+    )
+    title: Optional[str] = Field(default=None, description="Regulation title")
+    category: Optional[str] = Field(default=None, description="Regulation category")
+    subcategory: Optional[str] = Field(default=None, description="Regulation subcategory")
 
 class ComplianceCheck(BaseModel):
     """Individual compliance check result."""
@@ -2,10 +2,10 @@
 Database models for compliance application using SQLAlchemy 2.0 - SQLite compatible.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import uuid4
-from sqlalchemy import String, DateTime, Text, Boolean, JSON, ForeignKey, Index, Table, Column, Integer, Float, Enum
+from sqlalchemy import String, Date, DateTime, Text, Boolean, JSON, ForeignKey, Index, Table, Column, Integer, Float, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
 
@@ -50,14 +50,18 @@ class ComplianceRequirement(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
-# Association table for many-to-many relationship between regulations and aircraft models
+# Association table for many-to-many relationship between regulations and aircraft models.
+# Materialized from Regulation.content["applicable_models"]; authority_id is denormalized
+# so the applicable-regulation lookup is a single index range scan.
 regulation_models = Table(
     'regulation_models',
     Base.metadata,
     Column('regulation_id', String(36), ForeignKey('regulations.id')),
     Column('aircraft_model_id', String(36), ForeignKey('aircraft_models.id')),
+    Column('authority_id', String(36), ForeignKey('authorities.id'), nullable=True),
     Index('idx_regulation_models_regulation', 'regulation_id'),
     Index('idx_regulation_models_model', 'aircraft_model_id'),
+    Index('idx_regulation_models_model_authority', 'aircraft_model_id', 'authority_id', 'regulation_id'),
 )
 
 
@@ -103,6 +107,22 @@ class AircraftModel(Base):
     )
 
 
+class AircraftModelFamily(Base):
+    """Designation codes an aircraft model answers to (its own variant and its family)."""
+    
+    __tablename__ = "aircraft_model_families"
+    
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    code: Mapped[str] = mapped_column(String(100), nullable=False)
+    aircraft_model_id: Mapped[str] = mapped_column(String(36), ForeignKey('aircraft_models.id'), nullable=False)
+    level: Mapped[str] = mapped_column(String(10), nullable=False)  # variant, family
+    
+    __table_args__ = (
+        Index('idx_aircraft_model_families_code', 'code', 'aircraft_model_id', unique=True),
+        Index('idx_aircraft_model_families_model', 'aircraft_model_id'),
+    )
+
+
 class Regulation(Base):
     """Aviation regulation information."""
     
@@ -167,6 +187,25 @@ class ComplianceCheck(Base):
     )
 
 
+class ComplianceCheckDaily(Base):
+    """Daily rollup of compliance check history compacted out of the monthly partitions."""
+    
+    __tablename__ = "compliance_check_daily"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    aircraft_model_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    check_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    percentage_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    percentage_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        Index('idx_compliance_check_daily_model_day', 'aircraft_model_id', 'day'),
+        Index('idx_compliance_check_daily_day', 'day'),
+    )
+
+
 # Association table for many-to-many relationship between reports and checks
 report_checks = Table(
     'report_checks',
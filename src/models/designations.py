@@ -0,0 +1,67 @@
+"""
+Static aircraft designation data shared by the resolver and applicability.
+
+Kept in the models layer so services and repositories can both import it
+without depending on each other.
+"""
+
+import re
+
+
+# Extended supported models - All Embraer aircraft
+SUPPORTED_MODELS = (
+    # E-Jets E2 (Nova Geração)
+    "E175-E2", "E190-E2", "E195-E2",
+    
+    # E-Jets (Primeira Geração)
+    "E170", "E175", "E175-E1", "E190", "E190-E1", "E195", "E195-E1",
+    
+    # Aviação Executiva - Família Phenom
+    "Phenom-100EX", "Phenom-300E",
+    
+    # Aviação Executiva - Família Praetor
+    "Praetor-500", "Praetor-600",
+    
+    # Defesa e Segurança
+    "C-390", "KC-390", "A-29",
+    
+    # Aviação Agrícola
+    "EMB-203",
+    
+    # Outros fabricantes (legado)
+    "737", "737-800", "A320", "A320neo"
+)
+
+# Base designations accepted by the security input whitelist
+SECURE_MODEL_PATTERNS = (
+    "E175", "E190", "E195", "A320", "A380", "B737", "B747", "B777", "B787"
+)
+
+# Every designation the API, the service and the security whitelist accept;
+# the API's AircraftModel enum values are a subset of SUPPORTED_MODELS
+STATIC_DESIGNATIONS = tuple(dict.fromkeys(SUPPORTED_MODELS + SECURE_MODEL_PATTERNS))
+
+# Designations that name the same aircraft; the first entry is canonical
+ALIAS_GROUPS = (
+    ("KC-390", "C-390", "C-390-MILLENNIUM", "KC-390-MILLENNIUM"),
+    ("PHENOM-300E", "PHENOM-300"),
+    ("PHENOM-100EX", "PHENOM-100"),
+    ("PRAETOR-500", "LEGACY-450"),
+    ("PRAETOR-600", "LEGACY-500"),
+    ("A-29", "SUPER-TUCANO", "EMB-314"),
+    ("EMB-203", "IPANEMA"),
+    ("737", "B737", "BOEING-737"),
+    ("737-800", "B737-800"),
+    ("A320", "AIRBUS-A320"),
+    ("E170", "ERJ-170"),
+    ("E175", "ERJ-175"),
+    ("E190", "ERJ-190"),
+    ("E195", "ERJ-195"),
+)
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]")
+
+
+def normalize_designation(value: str) -> str:
+    """Trie key for a designation: upper-case alphanumerics only (``e175 e2`` -> ``E175E2``)."""
+    return _NON_ALNUM.sub("", str(value or "").upper())
@@ -0,0 +1,68 @@
+"""
+Schema of the SQLite full-text index over regulations and its query syntax.
+
+Kept in the models layer so the regulation repository can search the index
+and the FTS service can build it without depending on each other.
+"""
+
+import re
+from typing import List
+
+
+FTS_TABLE = "regulations_fts"
+FTS_KEYS_TABLE = "regulations_fts_keys"
+
+# Column weights for bm25(): regulation_id (unindexed), reference, title, description, content
+BM25_WEIGHTS = (0.0, 10.0, 4.0, 1.0, 0.5)
+
+# Column positions for highlight() and snippet()
+TITLE_COLUMN = 2
+DESCRIPTION_COLUMN = 3
+
+FTS_COLUMNS = "regulation_id, reference, title, description, content_text"
+_FTS_VALUES = "new.id, new.reference, new.title, new.description, coalesce(new.content, '')"
+FTS_TRIGGERS = ("regulations_fts_insert", "regulations_fts_delete", "regulations_fts_update")
+
+
+def _fts_rowid(regulation_id: str) -> str:
+    return f"(SELECT fts_rowid FROM {FTS_KEYS_TABLE} WHERE regulation_id = {regulation_id})"
+
+
+SQLITE_FTS_DDL: List[str] = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"regulation_id UNINDEXED, reference, title, description, content_text, "
+    f"tokenize = 'porter unicode61 remove_diacritics 2')",
+    # Stable integer key per regulation id; trigger lookups stay on an index instead of scanning the FTS table
+    f"CREATE TABLE IF NOT EXISTS {FTS_KEYS_TABLE} ("
+    f"fts_rowid INTEGER PRIMARY KEY, regulation_id VARCHAR(36) NOT NULL UNIQUE)",
+    f"CREATE TRIGGER IF NOT EXISTS regulations_fts_insert AFTER INSERT ON regulations BEGIN "
+    f"INSERT OR IGNORE INTO {FTS_KEYS_TABLE}(regulation_id) VALUES (new.id); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {FTS_COLUMNS}) VALUES ({_fts_rowid('new.id')}, {_FTS_VALUES}); END",
+    f"CREATE TRIGGER IF NOT EXISTS regulations_fts_delete AFTER DELETE ON regulations BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = {_fts_rowid('old.id')}; "
+    f"DELETE FROM {FTS_KEYS_TABLE} WHERE regulation_id = old.id; END",
+    f"CREATE TRIGGER IF NOT EXISTS regulations_fts_update AFTER UPDATE ON regulations BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = {_fts_rowid('old.id')}; "
+    f"UPDATE {FTS_KEYS_TABLE} SET regulation_id = new.id WHERE regulation_id = old.id; "
+    f"INSERT INTO {FTS_TABLE}(rowid, {FTS_COLUMNS}) VALUES ({_fts_rowid('new.id')}, {_FTS_VALUES}); END",
+]
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators in user input are treated as
+    literals; all words must match and the last one also matches as a
+    prefix, so results keep up with a user who is still typing.
+
+    Returns:
+        The MATCH expression, or an empty string when the query has no words
+    """
+    terms = _TERM.findall(query)
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
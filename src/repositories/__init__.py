@@ -7,6 +7,7 @@ from .authority import AuthorityRepository
 from .regulation import RegulationRepository
 from .aircraft_model import AircraftModelRepository
 from .compliance_check import ComplianceCheckRepository
+from .compliance_history import ComplianceHistoryRepository
 
 __all__ = [
     "BaseRepository",
@@ -14,4 +15,5 @@ __all__ = [
     "RegulationRepository",
     "AircraftModelRepository",
     "ComplianceCheckRepository",
+    "ComplianceHistoryRepository",
 ]
\ No newline at end of file
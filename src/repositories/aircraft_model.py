@@ -2,12 +2,13 @@
 Repository for AircraftModel entity operations.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.events import AIRCRAFT_MODELS, written
 from src.models.db_models_sqlite import AircraftModel
 from src.repositories.base import BaseRepository
 
@@ -18,6 +19,33 @@ class AircraftModelRepository(BaseRepository[AircraftModel]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, AircraftModel)
     
+    async def create(self, **kwargs) -> AircraftModel:
+        """Create an aircraft model, relink applicability and notify designation caches."""
+        instance = await super().create(**kwargs)
+        await written(AIRCRAFT_MODELS, self.session, [instance.id])
+        return instance
+    
+    async def update(self, id: UUID, **kwargs) -> Optional[AircraftModel]:
+        """Update an aircraft model, relink applicability and notify designation caches."""
+        instance = await super().update(id, **kwargs)
+        await written(AIRCRAFT_MODELS, self.session, [id])
+        return instance
+    
+    async def delete(self, id: UUID) -> bool:
+        """Delete an aircraft model, relink applicability and notify designation caches."""
+        deleted = await super().delete(id)
+        await written(AIRCRAFT_MODELS, self.session, [id])
+        return deleted
+    
+    async def get_by_ids(self, ids: Iterable[str]) -> List[AircraftModel]:
+        """Get aircraft models by primary keys, ordered by variant."""
+        result = await self.session.execute(
+            select(AircraftModel)
+            .where(AircraftModel.id.in_(list(ids)))
+            .order_by(AircraftModel.model, AircraftModel.variant)
+        )
+        return result.scalars().all()
+    
     async def get_by_manufacturer_and_model(
         self, 
         manufacturer: str, 
@@ -3,10 +3,12 @@ Repository for Authority entity operations.
 """
 
 from typing import List, Optional
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.events import AUTHORITIES, publish
 from src.models.db_models_sqlite import Authority
 from src.repositories.base import BaseRepository
 
@@ -17,6 +19,24 @@ class AuthorityRepository(BaseRepository[Authority]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Authority)
     
+    async def create(self, **kwargs) -> Authority:
+        """Create an authority and notify dataset caches."""
+        instance = await super().create(**kwargs)
+        publish(AUTHORITIES)
+        return instance
+    
+    async def update(self, id: UUID, **kwargs) -> Optional[Authority]:
+        """Update an authority and notify dataset caches."""
+        instance = await super().update(id, **kwargs)
+        publish(AUTHORITIES)
+        return instance
+    
+    async def delete(self, id: UUID) -> bool:
+        """Delete an authority and notify dataset caches."""
+        deleted = await super().delete(id)
+        publish(AUTHORITIES)
+        return deleted
+    
     async def get_by_code(self, code: str) -> Optional[Authority]:
         """Get authority by code."""
         result = await self.session.execute(
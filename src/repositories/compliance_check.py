@@ -8,12 +8,24 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, case, func, desc
 
 from src.models.db_models_sqlite import ComplianceCheck
 from src.repositories.base import BaseRepository
 
 
+# When a check ran: checked_at if it was recorded, else when the row was written
+_CHECK_TIME = func.coalesce(ComplianceCheck.checked_at, ComplianceCheck.created_at)
+
+# The SQLite model stores no percentage; score each verdict, leaving undecided checks out of the average
+_STATUS_PERCENTAGE = case(
+    (func.lower(ComplianceCheck.status) == 'compliant', 100.0),
+    (func.lower(ComplianceCheck.status) == 'partial_compliance', 50.0),
+    (func.lower(ComplianceCheck.status) == 'non_compliant', 0.0),
+    else_=None
+)
+
+
 class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
     """Repository for ComplianceCheck operations."""
     
@@ -34,7 +46,7 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
                     ComplianceCheck.regulation_id == regulation_id
                 )
             )
-            .order_by(desc(ComplianceCheck.check_date))
+            .order_by(desc(_CHECK_TIME))
         )
         return result.scalars().all()
     
@@ -52,7 +64,7 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
                     ComplianceCheck.regulation_id == regulation_id
                 )
             )
-            .order_by(desc(ComplianceCheck.check_date))
+            .order_by(desc(_CHECK_TIME))
             .limit(1)
         )
         return result.scalar_one_or_none()
@@ -66,7 +78,7 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
                 selectinload(ComplianceCheck.aircraft_model)
             )
             .where(ComplianceCheck.aircraft_model_id == aircraft_model_id)
-            .order_by(desc(ComplianceCheck.check_date))
+            .order_by(desc(_CHECK_TIME))
         )
         return result.scalars().all()
     
@@ -75,7 +87,7 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
         result = await self.session.execute(
             select(ComplianceCheck)
             .where(ComplianceCheck.status == status)
-            .order_by(desc(ComplianceCheck.check_date))
+            .order_by(desc(_CHECK_TIME))
         )
         return result.scalars().all()
     
@@ -99,13 +111,8 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
         
         # Get average compliance percentage
         compliance_result = await self.session.execute(
-            select(func.avg(ComplianceCheck.compliance_percentage))
-            .where(
-                and_(
-                    ComplianceCheck.aircraft_model_id == aircraft_model_id,
-                    ComplianceCheck.compliance_percentage.isnot(None)
-                )
-            )
+            select(func.avg(_STATUS_PERCENTAGE))
+            .where(ComplianceCheck.aircraft_model_id == aircraft_model_id)
         )
         
         avg_compliance = compliance_result.scalar() or 0.0
@@ -126,8 +133,8 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
         """Get compliance checks within date range."""
         query = select(ComplianceCheck).where(
             and_(
-                ComplianceCheck.check_date >= start_date,
-                ComplianceCheck.check_date <= end_date
+                _CHECK_TIME >= start_date,
+                _CHECK_TIME <= end_date
             )
         )
         
@@ -135,7 +142,7 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
             query = query.where(ComplianceCheck.aircraft_model_id == aircraft_model_id)
         
         result = await self.session.execute(
-            query.order_by(desc(ComplianceCheck.check_date))
+            query.order_by(desc(_CHECK_TIME))
         )
         return result.scalars().all()
     
@@ -150,6 +157,6 @@ class ComplianceCheckRepository(BaseRepository[ComplianceCheck]):
                     ComplianceCheck.status == 'pending'
                 )
             )
-            .order_by(ComplianceCheck.check_date)
+            .order_by(_CHECK_TIME)
         )
         return result.scalars().all()
\ No newline at end of file
@@ -0,0 +1,457 @@
+"""
+Repository for time-partitioned compliance check history.
+
+Raw checks are appended to monthly partitions: native ``PARTITION BY RANGE``
+children on PostgreSQL and one ``compliance_check_history_yYYYYmMM`` table per
+month on SQLite. Range queries only touch the partitions overlapping the range,
+and ``compact`` rolls expired partitions into ``compliance_check_daily`` before
+dropping them (and purges legacy ``compliance_checks`` rows of the same age)
+so the database stays small.
+
+Partitions are created on first write to their month; once a transaction
+creating one commits, later writes to that month skip the DDL.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    JSON, Column, DateTime, Float, Index, MetaData, PrimaryKeyConstraint, String, Table,
+    and_, cast, delete, event, exists, func, insert, literal_column, select, text, union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Date
+
+from src.config import settings
+from src.logger import get_logger, log_business_event
+from src.models.db_models_sqlite import ComplianceCheck, ComplianceCheckDaily, report_checks
+
+
+logger = get_logger(__name__)
+
+HISTORY_TABLE = "compliance_check_history"
+
+# Partition tables live outside Base.metadata so create_all never touches them
+_partition_metadata = MetaData()
+
+# (database URL, table) pairs known to exist. Partitions created in an open
+# transaction wait in ``session.info`` until it commits, so a rollback that
+# undoes the DDL never leaves a partition cached that is not there.
+_known_partitions: Set[Tuple[str, str]] = set()
+_PENDING_PARTITIONS = "compliance_history_partitions"
+
+ModelIds = Union[UUID, str, Sequence[Union[UUID, str]]]
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_partitions(session: Session) -> None:
+    _known_partitions.update(session.info.pop(_PENDING_PARTITIONS, ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_partitions(session: Session) -> None:
+    session.info.pop(_PENDING_PARTITIONS, None)
+
+
+def _history_columns() -> List:
+    return [
+        Column("id", String(36), nullable=False),
+        Column("aircraft_model_id", String(36), nullable=False),
+        Column("regulation_id", String(36), nullable=False),
+        Column("check_date", DateTime, nullable=False),
+        Column("status", String(20), nullable=False),
+        Column("compliance_percentage", Float, nullable=True),
+        Column("checked_by", String(100), nullable=True),
+        Column("details", JSON, nullable=True),
+    ]
+
+
+def month_start(value: datetime) -> date:
+    """First day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def next_month(value: date) -> date:
+    """First day of the month after ``value``."""
+    return date(value.year + (value.month == 12), value.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Table name of the partition holding ``month``."""
+    return f"{HISTORY_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def months_in_range(start: datetime, end: datetime) -> List[date]:
+    """Months overlapping the inclusive ``[start, end]`` range."""
+    months = []
+    current = month_start(start)
+    last = month_start(end)
+    while current <= last:
+        months.append(current)
+        current = next_month(current)
+    return months
+
+
+def _partition_table(name: str) -> Table:
+    """Core table for one SQLite monthly partition."""
+    table = _partition_metadata.tables.get(name)
+    if table is None:
+        table = Table(
+            name,
+            _partition_metadata,
+            *_history_columns(),
+            PrimaryKeyConstraint("id"),
+            Index(f"idx_{name}_model_date", "aircraft_model_id", "check_date"),
+        )
+    return table
+
+
+# PostgreSQL parent table; children are attached per month with PARTITION OF
+history_parent = Table(
+    HISTORY_TABLE,
+    _partition_metadata,
+    *_history_columns(),
+    PrimaryKeyConstraint("id", "check_date"),
+    Index("idx_compliance_check_history_model_date", "aircraft_model_id", "check_date"),
+    postgresql_partition_by="RANGE (check_date)",
+)
+
+
+class ComplianceHistoryRepository:
+    """Append-only compliance history with monthly partitions and daily rollups."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @property
+    def dialect(self) -> str:
+        return self.session.bind.dialect.name
+
+    async def record_checks(self, checks: Iterable[Dict[str, Any]], commit: bool = True) -> int:
+        """Append raw checks to their monthly partitions.
+
+        Args:
+            checks: Dicts with ``aircraft_model_id``, ``regulation_id``, ``status`` and
+                optionally ``check_date``, ``compliance_percentage``, ``checked_by``, ``details``
+            commit: Commit immediately; pass False to join the caller's transaction
+
+        Returns:
+            Number of rows written
+        """
+        by_month: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
+        for check in checks:
+            row = {
+                "id": str(check.get("id") or uuid4()),
+                "aircraft_model_id": str(check["aircraft_model_id"]),
+                "regulation_id": str(check["regulation_id"]),
+                "check_date": check.get("check_date") or datetime.utcnow(),
+                "status": check["status"],
+                "compliance_percentage": check.get("compliance_percentage"),
+                "checked_by": check.get("checked_by"),
+                "details": check.get("details"),
+            }
+            by_month[month_start(row["check_date"])].append(row)
+
+        written = 0
+        for month, rows in by_month.items():
+            table = await self._ensure_partition(month)
+            await self.session.execute(insert(table), rows)
+            written += len(rows)
+
+        if commit:
+            await self.session.commit()
+        return written
+
+    async def get_checks_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        aircraft_model_id: Optional[ModelIds] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get raw checks within an inclusive date range, newest first.
+
+        Only partitions overlapping the range are read.
+
+        Args:
+            start_date: Range start
+            end_date: Range end (inclusive)
+            aircraft_model_id: One aircraft model id or several (e.g. a family)
+            limit: Return at most this many checks
+        """
+        queries = [
+            self._range_select(table, start_date, end_date, aircraft_model_id)
+            for table in await self._tables_for_range(start_date, end_date)
+        ]
+        if not queries:
+            return []
+
+        query = queries[0] if len(queries) == 1 else union_all(*queries)
+        query = query.order_by(literal_column("check_date").desc())
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_compliance_summary(
+        self,
+        aircraft_model_id: ModelIds,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[str, Any]:
+        """Summarize checks in a range from raw partitions plus compacted daily rollups.
+
+        Args:
+            aircraft_model_id: One aircraft model id or several (e.g. a family)
+            start_date: Range start
+            end_date: Range end (inclusive)
+        """
+        status_counts: Dict[str, int] = defaultdict(int)
+        percentage_sum = 0.0
+        percentage_count = 0
+
+        for table in await self._tables_for_range(start_date, end_date):
+            result = await self.session.execute(
+                select(
+                    table.c.status,
+                    func.count().label("check_count"),
+                    func.coalesce(func.sum(table.c.compliance_percentage), 0.0).label("percentage_sum"),
+                    func.count(table.c.compliance_percentage).label("percentage_count"),
+                )
+                .where(
+                    _model_filter(table.c.aircraft_model_id, aircraft_model_id),
+                    table.c.check_date >= start_date,
+                    table.c.check_date <= end_date,
+                )
+                .group_by(table.c.status)
+            )
+            for row in result:
+                status_counts[row.status] += row.check_count
+                percentage_sum += row.percentage_sum
+                percentage_count += row.percentage_count
+
+        rollups = await self.session.execute(
+            select(
+                ComplianceCheckDaily.status,
+                func.sum(ComplianceCheckDaily.check_count).label("check_count"),
+                func.sum(ComplianceCheckDaily.percentage_sum).label("percentage_sum"),
+                func.sum(ComplianceCheckDaily.percentage_count).label("percentage_count"),
+            )
+            .where(
+                _model_filter(ComplianceCheckDaily.aircraft_model_id, aircraft_model_id),
+                ComplianceCheckDaily.day >= start_date.date(),
+                ComplianceCheckDaily.day <= end_date.date(),
+            )
+            .group_by(ComplianceCheckDaily.status)
+        )
+        for row in rollups:
+            status_counts[row.status] += row.check_count or 0
+            percentage_sum += row.percentage_sum or 0.0
+            percentage_count += row.percentage_count or 0
+
+        total_checks = sum(status_counts.values())
+        return {
+            'total_checks': total_checks,
+            'status_counts': dict(status_counts),
+            'average_compliance': percentage_sum / percentage_count if percentage_count else 0.0,
+            'compliance_rate': status_counts.get('compliant', 0) / total_checks * 100 if total_checks > 0 else 0
+        }
+
+    async def get_daily_trend(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        aircraft_model_id: Optional[ModelIds] = None,
+    ) -> Dict[date, Dict[str, int]]:
+        """Check counts per day and status in a range, from raw partitions plus rollups.
+
+        Args:
+            start_date: Range start
+            end_date: Range end (inclusive)
+            aircraft_model_id: Restrict to one aircraft model id or several
+
+        Returns:
+            ``{day: {status: check_count}}`` for days with at least one check
+        """
+        trend: Dict[date, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        for table in await self._tables_for_range(start_date, end_date):
+            day = self._day_expression(table.c.check_date)
+            conditions = [table.c.check_date >= start_date, table.c.check_date <= end_date]
+            if aircraft_model_id is not None:
+                conditions.append(_model_filter(table.c.aircraft_model_id, aircraft_model_id))
+            result = await self.session.execute(
+                select(day.label("day"), table.c.status, func.count().label("check_count"))
+                .where(*conditions)
+                .group_by(day, table.c.status)
+            )
+            for row in result:
+                trend[_as_date(row.day)][row.status] += row.check_count
+
+        conditions = [ComplianceCheckDaily.day >= start_date.date(), ComplianceCheckDaily.day <= end_date.date()]
+        if aircraft_model_id is not None:
+            conditions.append(_model_filter(ComplianceCheckDaily.aircraft_model_id, aircraft_model_id))
+        rollups = await self.session.execute(
+            select(
+                ComplianceCheckDaily.day,
+                ComplianceCheckDaily.status,
+                func.sum(ComplianceCheckDaily.check_count).label("check_count"),
+            )
+            .where(*conditions)
+            .group_by(ComplianceCheckDaily.day, ComplianceCheckDaily.status)
+        )
+        for row in rollups:
+            trend[_as_date(row.day)][row.status] += row.check_count or 0
+
+        return {day: dict(counts) for day, counts in sorted(trend.items())}
+
+    async def compact(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Roll expired partitions into daily aggregates and apply rollup retention.
+
+        A partition is compacted once its whole month is older than
+        ``history_raw_retention_days``.
+
+        Returns:
+            Names of compacted partitions and counts of rolled up / purged rows
+        """
+        now = now or datetime.utcnow()
+        raw_cutoff = (now - timedelta(days=settings.history_raw_retention_days)).date()
+        rollup_cutoff = (now - timedelta(days=settings.history_rollup_retention_days)).date()
+
+        compacted = []
+        rolled_up = 0
+        for month, name in await self._existing_partitions():
+            if next_month(month) > raw_cutoff:
+                continue
+            table = _partition_table(name)
+            day = self._day_expression(table.c.check_date)
+            aggregate = (
+                select(
+                    day.label("day"),
+                    table.c.aircraft_model_id,
+                    table.c.status,
+                    func.count().label("check_count"),
+                    func.coalesce(func.sum(table.c.compliance_percentage), 0.0).label("percentage_sum"),
+                    func.count(table.c.compliance_percentage).label("percentage_count"),
+                )
+                .group_by(day, table.c.aircraft_model_id, table.c.status)
+            )
+            result = await self.session.execute(
+                insert(ComplianceCheckDaily).from_select(
+                    ["day", "aircraft_model_id", "status", "check_count", "percentage_sum", "percentage_count"],
+                    aggregate,
+                )
+            )
+            rolled_up += result.rowcount or 0
+            await self.session.execute(text(f'DROP TABLE "{name}"'))
+            _partition_metadata.remove(table)
+            _known_partitions.discard((self._database_key, name))
+            compacted.append(name)
+
+        purged = await self.session.execute(
+            delete(ComplianceCheckDaily).where(ComplianceCheckDaily.day < rollup_cutoff)
+        )
+        # Legacy per-check rows were copied into the history; keep those a report still references
+        legacy = await self.session.execute(
+            delete(ComplianceCheck).where(
+                ComplianceCheck.created_at < raw_cutoff,
+                ~exists().where(report_checks.c.check_id == ComplianceCheck.id),
+            )
+        )
+        await self.session.commit()
+
+        stats = {
+            "compacted_partitions": compacted,
+            "rollup_rows_written": rolled_up,
+            "rollup_rows_purged": purged.rowcount or 0,
+            "legacy_checks_purged": legacy.rowcount or 0,
+        }
+        log_business_event("compliance_history_compacted", stats)
+        return stats
+
+    @property
+    def _database_key(self) -> str:
+        return self.session.bind.url.render_as_string(hide_password=True)
+
+    async def _ensure_partition(self, month: date) -> Table:
+        name = partition_name(month)
+        key = (self._database_key, name)
+        pending = self.session.info.setdefault(_PENDING_PARTITIONS, set())
+        if key in _known_partitions or key in pending:
+            return history_parent if self.dialect == "postgresql" else _partition_table(name)
+
+        if self.dialect == "postgresql":
+            await self.session.run_sync(
+                lambda sync_session: history_parent.create(sync_session.connection(), checkfirst=True)
+            )
+            await self.session.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {HISTORY_TABLE} '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+            ))
+            pending.add(key)
+            return history_parent
+
+        table = _partition_table(name)
+        await self.session.run_sync(
+            lambda sync_session: table.create(sync_session.connection(), checkfirst=True)
+        )
+        pending.add(key)
+        return table
+
+    async def _existing_partitions(self) -> List[tuple]:
+        """``(month, table_name)`` pairs of existing partitions, oldest first."""
+        if self.dialect == "postgresql":
+            query = text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE parent.relname = :parent"
+            )
+            result = await self.session.execute(query, {"parent": HISTORY_TABLE})
+        else:
+            query = text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern")
+            result = await self.session.execute(query, {"pattern": f"{HISTORY_TABLE}_y%"})
+
+        partitions = []
+        for (name,) in result:
+            suffix = name[len(HISTORY_TABLE) + 2:]
+            partitions.append((date(int(suffix[:4]), int(suffix[5:7]), 1), name))
+        return sorted(partitions)
+
+    async def _tables_for_range(self, start_date: datetime, end_date: datetime) -> List[Table]:
+        if self.dialect == "postgresql":
+            # The planner prunes partitions from the check_date predicate
+            return [history_parent]
+        wanted = {partition_name(month) for month in months_in_range(start_date, end_date)}
+        return [
+            _partition_table(name)
+            for _, name in await self._existing_partitions()
+            if name in wanted
+        ]
+
+    def _day_expression(self, column):
+        if self.dialect == "postgresql":
+            return cast(column, Date)
+        return func.date(column)
+
+    @staticmethod
+    def _range_select(table: Table, start_date: datetime, end_date: datetime, aircraft_model_id: Optional[ModelIds]):
+        conditions = [table.c.check_date >= start_date, table.c.check_date <= end_date]
+        if aircraft_model_id:
+            conditions.append(_model_filter(table.c.aircraft_model_id, aircraft_model_id))
+        return select(*table.c).where(and_(*conditions))
+
+
+def _model_filter(column, aircraft_model_id: ModelIds):
+    """``column`` equal to one id, or in a list of ids."""
+    if isinstance(aircraft_model_id, (list, tuple, set, frozenset)):
+        return column.in_([str(model_id) for model_id in aircraft_model_id])
+    return column == str(aircraft_model_id)
+
+
+def _as_date(value) -> date:
+    """SQLite's ``date()`` returns ISO strings; PostgreSQL returns dates."""
+    return date.fromisoformat(value) if isinstance(value, str) else value
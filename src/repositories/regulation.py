@@ -2,13 +2,16 @@
 Repository for Regulation entity operations.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
+from sqlalchemy import func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
-from src.models.db_models_sqlite import Regulation
+from src.events import REGULATIONS, written
+from src.models.db_models_sqlite import AircraftModelFamily, Regulation, regulation_models
+from src.models.regulation_fts import BM25_WEIGHTS, DESCRIPTION_COLUMN, FTS_TABLE, TITLE_COLUMN, build_match_query
 from src.repositories.base import BaseRepository
 
 
@@ -18,6 +21,33 @@ class RegulationRepository(BaseRepository[Regulation]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Regulation)
     
+    async def create(self, **kwargs) -> Regulation:
+        """Create a regulation, relink its applicability and notify the caches."""
+        instance = await super().create(**kwargs)
+        await written(REGULATIONS, self.session, [instance.id])
+        return instance
+    
+    async def update(self, id: UUID, **kwargs) -> Optional[Regulation]:
+        """Update a regulation, relink its applicability and notify the caches."""
+        instance = await super().update(id, **kwargs)
+        await written(REGULATIONS, self.session, [id])
+        return instance
+    
+    async def delete(self, id: UUID) -> bool:
+        """Delete a regulation, relink its applicability and notify the caches."""
+        deleted = await super().delete(id)
+        await written(REGULATIONS, self.session, [id])
+        return deleted
+    
+    async def get_by_ids(self, ids: Iterable[str]) -> List[Regulation]:
+        """Get regulations with their authority by primary keys."""
+        result = await self.session.execute(
+            select(Regulation)
+            .options(selectinload(Regulation.authority))
+            .where(Regulation.id.in_(list(ids)))
+        )
+        return result.scalars().all()
+    
     async def get_by_reference(self, reference: str) -> Optional[Regulation]:
         """Get regulation by reference."""
         result = await self.session.execute(
@@ -64,24 +94,153 @@ class RegulationRepository(BaseRepository[Regulation]):
         )
         return result.scalars().all()
     
+    async def has_regulations_for_authority(self, authority_id: UUID) -> bool:
+        """Check whether an authority has any regulation without loading them."""
+        result = await self.session.execute(
+            select(Regulation.id).where(Regulation.authority_id == authority_id).limit(1)
+        )
+        return result.scalar_one_or_none() is not None
+    
+    async def get_applicable(self, code: str, authority_id: UUID) -> List[Regulation]:
+        """Get regulations of an authority applicable to a model designation.
+        
+        Resolves the designation through ``aircraft_model_families`` and joins the
+        materialized ``regulation_models`` table on ``(aircraft_model_id, authority_id)``.
+        For a family code only regulations covering every member of the family are
+        returned, so variant-specific rules do not leak into family-level checks.
+        
+        Args:
+            code: Upper-cased designation code (e.g. "E175" or "E175-E2")
+            authority_id: Authority the regulations belong to
+            
+        Returns:
+            Applicable regulations ordered by reference
+        """
+        member_ids = select(AircraftModelFamily.aircraft_model_id).where(AircraftModelFamily.code == code)
+        member_count = (
+            select(func.count())
+            .select_from(AircraftModelFamily)
+            .where(AircraftModelFamily.code == code)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(Regulation)
+            .join(regulation_models, regulation_models.c.regulation_id == Regulation.id)
+            .where(
+                regulation_models.c.authority_id == authority_id,
+                regulation_models.c.aircraft_model_id.in_(member_ids),
+            )
+            .group_by(Regulation.id)
+            .having(func.count(func.distinct(regulation_models.c.aircraft_model_id)) == member_count)
+            .order_by(Regulation.reference)
+        )
+        return result.scalars().all()
+    
     async def search_regulations(
         self, 
         search_term: str, 
         category: Optional[str] = None,
-        authority_id: Optional[UUID] = None
+        authority_id: Optional[UUID] = None,
+        limit: int = 100
     ) -> List[Regulation]:
-        """Search regulations by title, description or reference."""
-        query = select(Regulation).where(
-            Regulation.title.ilike(f"%{search_term}%") |
-            Regulation.description.ilike(f"%{search_term}%") |
-            Regulation.reference.ilike(f"%{search_term}%")
-        )
+        """Search regulations by title, description or reference, best matches first."""
+        hits, _ = await self.full_text_search(search_term, category=category, authority_id=authority_id, limit=limit)
+        by_id = {regulation.id: regulation for regulation in await self.get_by_ids(hit["id"] for hit in hits)}
+        return [by_id[hit["id"]] for hit in hits if hit["id"] in by_id]
+    
+    async def full_text_search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        authority_id: Optional[UUID] = None,
+        authority_code: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        mark: Tuple[str, str] = ("<mark>", "</mark>")
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Ranked, paginated full-text search with highlighted matches.
         
-        if category:
-            query = query.where(Regulation.category == category)
+        Uses the FTS5 table on SQLite and the ``search_vector`` GIN index on
+        PostgreSQL; other dialects fall back to an unranked ``ILIKE`` scan.
         
+        Args:
+            query: Free-text query
+            category: Restrict to a regulation category
+            authority_id: Restrict to an authority by id
+            authority_code: Restrict to an authority by code (e.g. "FAA")
+            limit: Page size
+            offset: Number of hits to skip
+            mark: Opening and closing markers wrapped around matched terms
+            
+        Returns:
+            The page of hits (id, reference, title, category, authority, rank,
+            title_highlight, snippet) and the total number of matches
+        """
+        filters = []
+        params: Dict[str, Any] = {"limit": limit, "offset": offset, "open": mark[0], "close": mark[1]}
+        if category:
+            filters.append("r.category = :category")
+            params["category"] = category
         if authority_id:
-            query = query.where(Regulation.authority_id == authority_id)
+            filters.append("r.authority_id = :authority_id")
+            params["authority_id"] = str(authority_id)
+        if authority_code:
+            filters.append("upper(a.code) = :authority_code")
+            params["authority_code"] = authority_code.upper()
+        where = "".join(f" AND {condition}" for condition in filters)
+        
+        dialect = self.session.bind.dialect.name
+        if dialect == "sqlite":
+            params["query"] = build_match_query(query)
+            if not params["query"]:
+                return [], 0
+            source = (
+                f"FROM {FTS_TABLE} JOIN regulations r ON r.id = {FTS_TABLE}.regulation_id "
+                f"JOIN authorities a ON a.id = r.authority_id "
+                f"WHERE {FTS_TABLE} MATCH :query{where}"
+            )
+            weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+            # bm25() is lower-is-better; negate it so rank is higher-is-better on every dialect
+            page_sql = (
+                f"SELECT r.id, r.reference, r.title, r.category, a.code AS authority, "
+                f"-bm25({FTS_TABLE}, {weights}) AS rank, "
+                f"highlight({FTS_TABLE}, {TITLE_COLUMN}, :open, :close) AS title_highlight, "
+                f"snippet({FTS_TABLE}, {DESCRIPTION_COLUMN}, :open, :close, '…', 24) AS snippet "
+                f"{source} ORDER BY rank DESC, r.reference LIMIT :limit OFFSET :offset"
+            )
+        elif dialect == "postgresql":
+            params["query"] = query
+            headline = "'StartSel=' || :open || ', StopSel=' || :close"
+            source = (
+                "FROM regulations r JOIN authorities a ON a.id = r.authority_id, "
+                "websearch_to_tsquery('english', :query) q "
+                f"WHERE r.search_vector @@ q{where}"
+            )
+            # Headlines are computed only for the page, not for every match
+            page_sql = (
+                "SELECT page.id, page.reference, page.title, page.category, page.authority, page.rank, "
+                f"ts_headline('english', page.title, page.q, {headline} || ', HighlightAll=true') AS title_highlight, "
+                f"ts_headline('english', page.description, page.q, {headline} || ', MaxWords=35, MinWords=15') AS snippet "
+                "FROM (SELECT r.id, r.reference, r.title, r.description, r.category, a.code AS authority, q, "
+                f"ts_rank_cd(r.search_vector, q) AS rank {source} "
+                "ORDER BY rank DESC, r.reference LIMIT :limit OFFSET :offset) page "
+                "ORDER BY page.rank DESC, page.reference"
+            )
+        else:
+            params["query"] = f"%{query}%"
+            source = (
+                "FROM regulations r JOIN authorities a ON a.id = r.authority_id "
+                "WHERE (r.title LIKE :query OR r.description LIKE :query OR r.reference LIKE :query)"
+                f"{where}"
+            )
+            page_sql = (
+                "SELECT r.id, r.reference, r.title, r.category, a.code AS authority, 0.0 AS rank, "
+                f"r.title AS title_highlight, r.description AS snippet {source} "
+                "ORDER BY r.reference LIMIT :limit OFFSET :offset"
+            )
         
-        result = await self.session.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        total = await self.session.scalar(text(f"SELECT count(*) {source}"), params)
+        if not total:
+            return [], 0
+        rows = await self.session.execute(text(page_sql), params)
+        return [dict(row._mapping) for row in rows], total
@@ -13,6 +13,8 @@ from fastapi import HTTPException, Request, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 
+from src.models.designations import SECURE_MODEL_PATTERNS
+
 # Security Configuration
 SECURITY_CONFIG = {
     "api_key_length": 32,
@@ -199,18 +201,16 @@ def add_security_headers(response):
 class SecureModelInput:
     """Secure validation for aircraft model input."""
     
+    # Whitelist of allowed model patterns
+    ALLOWED_MODEL_PATTERNS = SECURE_MODEL_PATTERNS
+    
     @staticmethod
     def validate_model(model: str) -> str:
         """Validate aircraft model input."""
         model = validate_input(model, "aircraft_model")
         
-        # Whitelist of allowed model patterns
-        allowed_patterns = [
-            "E175", "E190", "E195", "A320", "A380", "B737", "B747", "B777", "B787"
-        ]
-        
         base_model = model.split('-')[0] if '-' in model else model
-        if base_model not in allowed_patterns:
+        if base_model not in SecureModelInput.ALLOWED_MODEL_PATTERNS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unsupported aircraft model: {model}"
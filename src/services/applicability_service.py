@@ -0,0 +1,215 @@
+"""
+Regulation applicability materialization.
+
+Applicability is authored as ``Regulation.content["applicable_models"]``; this
+module expands it into the ``regulation_models`` join table using the
+``aircraft_model_families`` hierarchy so lookups become an indexed join.
+
+Matching is exact-or-family: an entry applies to an aircraft model when it
+equals the model's own designation (``E175-E2``) or its family (``E175``),
+compared the way the model resolver keys them (case and separators ignored).
+An alias (``KC-390``) matches the rows of its group's first member backed by
+an aircraft model (``C-390``), as the resolver resolves it. Arbitrary
+prefixes such as ``E17`` never match.
+
+Writes through the repositories keep the table current: a regulation write
+relinks that regulation and an aircraft model write rebuilds every link
+(write hooks registered when this module is imported). Bulk writers that
+bypass the repositories, such as the importer, call
+``materialize_applicability`` once per batch, and the application backfills
+an empty ``regulation_models`` on startup.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.events import AIRCRAFT_MODELS, REGULATIONS, on_write
+from src.logger import get_logger, log_business_event
+from src.models.db_models_sqlite import AircraftModel, AircraftModelFamily, Regulation, regulation_models
+from src.models.designations import ALIAS_GROUPS, normalize_designation
+
+
+logger = get_logger(__name__)
+
+# Family designations carry at least one digit (E175, 737); C-390 or EMB-203 are whole names
+_FAMILY_SUFFIX = re.compile(r"^(?P<family>[A-Z]*\d+[A-Z]*)-(?:E\d|\d{3})$")
+
+_INSERT_CHUNK = 1000
+
+
+def designation_codes(model: str, variant: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """Return the ``(variant_code, family_code)`` pair for an aircraft designation.
+
+    Handles both row layouts found in the data (``model="E175", variant="E175-E2"``
+    and ``model="E175-E2", variant="E2"``) as well as bare request strings.
+
+    Args:
+        model: Model column or requested model string
+        variant: Optional variant column
+
+    Returns:
+        Upper-cased variant code and family code (``None`` when the model has no family)
+    """
+    model_code = (model or "").strip().upper()
+    variant_code = (variant or "").strip().upper()
+
+    if variant_code:
+        if variant_code.startswith(model_code):
+            return variant_code, model_code if variant_code != model_code else None
+        if model_code.endswith(f"-{variant_code}"):
+            return model_code, model_code[: -len(variant_code) - 1]
+        return f"{model_code}-{variant_code}", model_code
+
+    match = _FAMILY_SUFFIX.match(model_code)
+    return model_code, match.group("family") if match else None
+
+
+def model_codes(model: str) -> Set[str]:
+    """All designation codes a requested model answers to."""
+    code, family = designation_codes(model)
+    return {code, family} if family else {code}
+
+
+def applies_to(applicable_models: Iterable[str], codes: Set[str]) -> bool:
+    """Check an applicability list against a model's designation codes.
+
+    An empty list means the regulation applies to every model.
+    """
+    entries = [str(entry).strip().upper() for entry in applicable_models or [] if str(entry).strip()]
+    if not entries:
+        return True
+    return any(entry in codes for entry in entries)
+
+
+def applicable_models_of(content) -> List[str]:
+    """Extract the applicability list from a regulation ``content`` payload."""
+    if not isinstance(content, dict):
+        return []
+    applicable = content.get("applicable_models") or []
+    if isinstance(applicable, str):
+        applicable = applicable.split(",")
+    return [str(entry).strip().upper() for entry in applicable if str(entry).strip()]
+
+
+async def rebuild_model_families(session: AsyncSession) -> Dict[str, Set[str]]:
+    """Rebuild ``aircraft_model_families`` from ``aircraft_models``.
+
+    Returns:
+        Mapping of designation code to the aircraft model ids it covers
+    """
+    result = await session.execute(select(AircraftModel.id, AircraftModel.model, AircraftModel.variant))
+
+    code_index: Dict[str, Set[str]] = defaultdict(set)
+    rows = []
+    for aircraft_model_id, model, variant in result:
+        variant_code, family_code = designation_codes(model, variant)
+        for code, level in ((variant_code, "variant"), (family_code, "family")):
+            if code and aircraft_model_id not in code_index[code]:
+                code_index[code].add(aircraft_model_id)
+                rows.append({"code": code, "aircraft_model_id": aircraft_model_id, "level": level})
+
+    await session.execute(delete(AircraftModelFamily))
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        await session.execute(insert(AircraftModelFamily), rows[start:start + _INSERT_CHUNK])
+
+    return code_index
+
+
+def _lookup_index(code_index: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """Key designation codes the way the resolver does and add alias entries."""
+    index: Dict[str, Set[str]] = defaultdict(set)
+    for code, ids in code_index.items():
+        index[normalize_designation(code)].update(ids)
+    for group in ALIAS_GROUPS:
+        keys = [normalize_designation(alias) for alias in group]
+        target = next((key for key in keys if index.get(key)), None)
+        if target is None:
+            continue
+        for key in keys:
+            if not index.get(key):
+                index[key] = index[target]
+    return index
+
+
+async def materialize_applicability(
+    session: AsyncSession,
+    regulation_ids: Optional[Iterable[str]] = None,
+) -> int:
+    """Expand regulation applicability into ``regulation_models``.
+
+    Args:
+        session: Database session; committed on success
+        regulation_ids: Restrict the rebuild to these regulations; all when omitted
+
+    Returns:
+        Number of ``regulation_models`` rows written
+    """
+    code_index = _lookup_index(await rebuild_model_families(session))
+    all_model_ids = sorted({model_id for ids in code_index.values() for model_id in ids})
+
+    query = select(Regulation.id, Regulation.authority_id, Regulation.content)
+    delete_stmt = delete(regulation_models)
+    if regulation_ids is not None:
+        regulation_ids = list(regulation_ids)
+        query = query.where(Regulation.id.in_(regulation_ids))
+        delete_stmt = delete_stmt.where(regulation_models.c.regulation_id.in_(regulation_ids))
+    await session.execute(delete_stmt)
+
+    written = 0
+    batch = []
+    for regulation_id, authority_id, content in await session.execute(query):
+        entries = applicable_models_of(content)
+        if entries:
+            model_ids = set()
+            for entry in entries:
+                model_ids.update(code_index.get(normalize_designation(entry), ()))
+        else:
+            model_ids = all_model_ids
+        batch.extend(
+            {"regulation_id": regulation_id, "aircraft_model_id": model_id, "authority_id": authority_id}
+            for model_id in model_ids
+        )
+        if len(batch) >= _INSERT_CHUNK:
+            await session.execute(insert(regulation_models), batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        await session.execute(insert(regulation_models), batch)
+        written += len(batch)
+
+    await session.commit()
+    log_business_event(
+        "regulation_applicability_materialized",
+        {"rows": written, "partial": regulation_ids is not None},
+    )
+    return written
+
+
+async def ensure_applicability_materialized(session: AsyncSession) -> bool:
+    """Materialize applicability once for databases populated before the join table was used.
+
+    Returns:
+        True when a rebuild was performed
+    """
+    has_links = await session.scalar(select(func.count()).select_from(regulation_models))
+    if has_links:
+        return False
+    has_regulations = await session.scalar(select(func.count(Regulation.id)))
+    if not has_regulations:
+        return False
+    await materialize_applicability(session)
+    return True
+
+
+async def _relink_all(session: AsyncSession, aircraft_model_ids: List[str]) -> None:
+    # A model can join a family every regulation entry names, so every link is rebuilt
+    await materialize_applicability(session)
+
+
+# Repository writes keep regulation_models in step with the catalog
+on_write(REGULATIONS, materialize_applicability)
+on_write(AIRCRAFT_MODELS, _relink_all)
@@ -4,28 +4,112 @@ Implementação real para análise de conformidade de aviação
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
-try:
-    # Importações dos modelos Hugging Face
-    from transformers import (
-        AutoTokenizer, AutoModelForSequenceClassification,
-        AutoModelForCausalLM, pipeline, AutoModel
-    )
-    from sentence_transformers import SentenceTransformer
-    import torch
-    import numpy as np
-    from scipy.spatial.distance import cosine
+from src.config import settings
+from src.exceptions import InferenceUnavailableError
+from src.services.cache_service import cache_service
+from src.services.embedding_index import EmbeddingIndex
+from src.services.inference_executor import inference_executor
+from src.services.micro_batcher import MicroBatcher
+from src.services.model_artifacts import artifact_revision, pretrained_kwargs, resolve_model_path
+from src.services.model_registry import ModelRegistry
+from src.services.model_server import remote_loader
+
+CLASSIFIER_MODEL_ID = "distilbert-base-uncased-finetuned-sst-2-english"
+SIMILARITY_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+INSIGHT_MODEL_ID = "google/flan-t5-small"  # Usando versão smaller para performance
+
+# Dependências por backend; o gerador de insights roda em torch nos dois
+_BACKEND_MODULES = {
+    "torch": ("transformers", "sentence_transformers", "torch"),
+    "onnx": ("transformers", "onnxruntime", "torch"),
+}
+ONNX_BACKEND = settings.ai_backend == "onnx"
+MODEL_SERVER_MODE = bool(settings.ai_model_server_socket)
+
+# Detectar dependências sem importá-las; torch/transformers só são carregados
+# na thread do ModelRegistry (ou no sidecar, quando configurado)
+HF_AVAILABLE = MODEL_SERVER_MODE or all(
+    importlib.util.find_spec(module) is not None
+    for module in _BACKEND_MODULES["onnx" if ONNX_BACKEND else "torch"]
+)
+if not HF_AVAILABLE:
+    logging.warning("⚠️ Hugging Face dependencies not available, using rule-based analysis")
+
+# A API usa os nomes do enum Country; a base de conhecimento usa códigos curtos
+REGULATORY_REGION_ALIASES = {"USA": "US", "UNITED STATES": "US", "EUROPE": "EU", "UNITED KINGDOM": "UK"}
+
+
+def _region_key(country: Any) -> str:
+    """Chave da base de conhecimento para um país da API ou código curto"""
+    code = str(getattr(country, 'value', country)).strip().upper()
+    return REGULATORY_REGION_ALIASES.get(code, code)
+
+
+def _backend_model_id(model_id: str, onnx: bool = ONNX_BACKEND) -> str:
+    """Identificador do modelo incluindo snapshot e backend, usado no status e na chave de cache"""
+    revision = artifact_revision(model_id)
+    if revision:
+        model_id = f"{model_id}@{revision[:12]}"
+    if not onnx:
+        return model_id
+    return f"{model_id}@onnx-{'int8' if settings.ai_onnx_quantized else 'fp32'}"
+
+
+def _load_compliance_classifier():
+    if ONNX_BACKEND:
+        from src.services.onnx_backend import OnnxTextClassifier
+        return OnnxTextClassifier.from_model_id(CLASSIFIER_MODEL_ID)
     
-    HF_AVAILABLE = True
-    logging.info("✅ Hugging Face dependencies loaded successfully")
+    from transformers import pipeline
+    path = resolve_model_path(CLASSIFIER_MODEL_ID)
+    return pipeline(
+        "text-classification",
+        model=path,
+        return_all_scores=True,
+        model_kwargs=pretrained_kwargs(path)
+    )
+
+
+def _load_similarity_model():
+    if ONNX_BACKEND:
+        from src.services.onnx_backend import OnnxSentenceEncoder
+        return OnnxSentenceEncoder.from_model_id(SIMILARITY_MODEL_ID)
     
-except ImportError as e:
-    HF_AVAILABLE = False
-    logging.warning(f"⚠️ Hugging Face dependencies not available: {e}")
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(resolve_model_path(SIMILARITY_MODEL_ID))
+
+
+def _load_insight_generator():
+    from transformers import pipeline
+    path = resolve_model_path(INSIGHT_MODEL_ID)
+    return pipeline(
+        "text2text-generation",
+        model=path,
+        max_length=100,
+        model_kwargs=pretrained_kwargs(path)
+    )
+
+
+# Modelos hospedados: carregados no processo ou no sidecar (src.services.model_server)
+LOCAL_MODEL_LOADERS = {
+    'compliance_classifier': (_backend_model_id(CLASSIFIER_MODEL_ID), _load_compliance_classifier),
+    'similarity_model': (_backend_model_id(SIMILARITY_MODEL_ID), _load_similarity_model),
+    'insight_generator': (_backend_model_id(INSIGHT_MODEL_ID, onnx=False), _load_insight_generator),
+}
+
+
+def _model_loader(name: str):
+    """Loader local ou proxy para o sidecar, conforme AI_MODEL_SERVER_SOCKET"""
+    if MODEL_SERVER_MODE:
+        return remote_loader(name, settings.ai_model_server_socket)
+    return LOCAL_MODEL_LOADERS[name][1]
 
 class AviationAIAnalyzer:
     """
@@ -35,8 +119,8 @@ class AviationAIAnalyzer:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.models_loaded = False
-        self.fallback_mode = not HF_AVAILABLE
+        self.registry = ModelRegistry()
+        self._warm_tasks = set()
         
         # Configurações dos modelos
         self.model_configs = {
@@ -62,53 +146,122 @@ class AviationAIAnalyzer:
             }
         }
         
-        # Inicializar modelos se disponível
-        if not self.fallback_mode:
-            try:
-                self._initialize_models()
-            except Exception as e:
-                self.logger.error(f"Failed to initialize models: {e}")
-                self.fallback_mode = True
+        # Modelos carregados sob demanda em background (ver start_model_loading)
+        for name in ('compliance_classifier', 'similarity_model', 'insight_generator'):
+            self.registry.register(name, LOCAL_MODEL_LOADERS[name][0], _model_loader(name))
+        self.registry.register('pattern_index', _backend_model_id(SIMILARITY_MODEL_ID), self._build_pattern_index)
+        
+        # Requisições concorrentes compartilham um forward pass por modelo
+        batching = {'max_batch_size': settings.ai_batch_max_size, 'max_wait_ms': settings.ai_batch_max_wait_ms}
+        self.batchers = {
+            'compliance_classifier': MicroBatcher('compliance_classifier', self._classify_batch, **batching),
+            'similarity_model': MicroBatcher('similarity_model', self._encode_batch, **batching),
+            'insight_generator': MicroBatcher('insight_generator', self._generate_batch, **batching),
+        }
         
         # Base de conhecimento para análise
         self.knowledge_base = self._load_aviation_knowledge()
+        self.knowledge_base_version = hashlib.blake2b(
+            json.dumps(self.knowledge_base, sort_keys=True).encode('utf-8'), digest_size=8
+        ).hexdigest()
+    
+    @property
+    def fallback_mode(self) -> bool:
+        """Análise baseada em regras: dependências ausentes ou algum modelo falhou"""
+        return not HF_AVAILABLE or self.registry.any_failed
+    
+    @property
+    def models_loaded(self) -> bool:
+        return self.registry.all_ready
+    
+    def start_model_loading(self) -> bool:
+        """Inicia o carregamento dos modelos em background sem bloquear o event loop
+        
+        Returns:
+            True quando esta chamada iniciou o carregamento
+        """
+        if not HF_AVAILABLE:
+            return False
+        started = self.registry.start()
+        if started:
+            self.logger.info("🤖 Loading Hugging Face models in background...")
+        return started
+    
+    def model_status(self) -> Dict[str, Any]:
+        """Estado de prontidão dos modelos para o /health"""
+        status = self.registry.status()
+        status["dependencies_available"] = HF_AVAILABLE
+        status["backend"] = settings.ai_backend
+        status["model_server"] = settings.ai_model_server_socket
+        status["serving"] = "hugging_face_models" if self.models_loaded else "rule_based_fallback"
+        status["inference"] = inference_executor.status()
+        return status
     
-    def _initialize_models(self):
-        """Inicializa os modelos do Hugging Face"""
-        self.logger.info("🤖 Initializing Hugging Face models...")
+    def _build_pattern_index(self) -> EmbeddingIndex:
+        """Codifica os padrões de conformidade uma única vez, após o similarity_model"""
+        similarity_model = self.registry.get('similarity_model')
+        if similarity_model is None:
+            raise RuntimeError("similarity_model is not loaded")
+        return EmbeddingIndex.build(
+            similarity_model,
+            [pattern['pattern'] for pattern in self.knowledge_base['compliance_patterns']],
+            model_name=_backend_model_id(SIMILARITY_MODEL_ID),
+            cache_dir=settings.ai_embedding_cache_dir
+        )
+    
+    def _result_cache_key(self, aircraft: str, country: str) -> str:
+        """Chave do resultado: aeronave, país, versões dos modelos e da base de conhecimento"""
+        if self.models_loaded:
+            model_versions = ','.join(status['model_id'] for status in self.registry.status()['models'].values())
+        else:
+            model_versions = 'rule_based'
+        models_tag = hashlib.blake2b(model_versions.encode('utf-8'), digest_size=6).hexdigest()
+        return f"ai:{aircraft.lower()}:{_region_key(country)}:{models_tag}:{self.knowledge_base_version}"
+    
+    async def warm_result_cache(self) -> int:
+        """Pré-calcula a análise de todos os pares (aeronave, país) conhecidos
         
-        self.models = {}
+        Se os modelos estão carregando, espera o fim do carregamento: a chave leva
+        as versões dos modelos, e resultados rule-based deixariam de ser usados.
         
-        try:
-            # Modelo de classificação de conformidade (leve)
-            self.logger.info("Loading compliance classifier...")
-            self.models['compliance_classifier'] = pipeline(
-                "text-classification",
-                model="distilbert-base-uncased-finetuned-sst-2-english",
-                return_all_scores=True
-            )
-            
-            # Modelo de similaridade semântica
-            self.logger.info("Loading similarity model...")
-            self.models['similarity_model'] = SentenceTransformer(
-                'sentence-transformers/all-MiniLM-L6-v2'
-            )
-            
-            # Modelo para geração de insights
-            self.logger.info("Loading insight generator...")
-            self.models['insight_generator'] = pipeline(
-                "text2text-generation",
-                model="google/flan-t5-small",  # Usando versão smaller para performance
-                max_length=100
-            )
-            
-            self.models_loaded = True
-            self.logger.info("✅ All models loaded successfully!")
-            
-        except Exception as e:
-            self.logger.error(f"Model initialization failed: {e}")
-            self.fallback_mode = True
-            self.models_loaded = False
+        Returns:
+            Número de pares calculados
+        """
+        while self.registry.started and not self.registry.finished:
+            await asyncio.sleep(0.5)
+        warmed = 0
+        for aircraft in self.knowledge_base['aircraft_database']:
+            for country in self.knowledge_base['regulatory_knowledge']:
+                await self._analyze(aircraft, country)
+                warmed += 1
+        self.logger.info(f"AI result cache warmed with {warmed} analyses")
+        return warmed
+    
+    def schedule_result_cache_warm(self) -> asyncio.Task:
+        """Aquece o cache em background, sem bloquear quem chamou"""
+        task = asyncio.create_task(self.warm_result_cache())
+        self._warm_tasks.add(task)
+        task.add_done_callback(self._warm_tasks.discard)
+        return task
+    
+    def cancel_result_cache_warm(self) -> None:
+        """Cancela aquecimentos pendentes (shutdown)"""
+        for task in list(self._warm_tasks):
+            task.cancel()
+    
+    def _classify_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Classifica um lote; cada item recebe a lista de scores por label"""
+        outputs = self.registry.get('compliance_classifier')(texts)
+        return [output if isinstance(output, list) else [output] for output in outputs]
+    
+    def _encode_batch(self, texts: List[str]) -> List[Any]:
+        """Gera embeddings de um lote em um único encode"""
+        return list(self.registry.get('similarity_model').encode(texts))
+    
+    def _generate_batch(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """Gera um insight por prompt em um único forward pass"""
+        outputs = self.registry.get('insight_generator')(prompts, max_length=50, num_return_sequences=1)
+        return [output[0] if isinstance(output, list) else output for output in outputs]
     
     def _load_aviation_knowledge(self) -> Dict[str, Any]:
         """Carrega base de conhecimento de aviação"""
@@ -248,16 +401,30 @@ class AviationAIAnalyzer:
         """
         Análise principal usando modelos AI do Hugging Face
         """
+        # Primeiro uso dispara o carregamento; até lá, serve o fallback
+        if self.start_model_loading() and settings.ai_cache_warm_on_startup:
+            # Re-aquece com as chaves dos modelos assim que eles ficarem prontos
+            self.schedule_result_cache_warm()
+        return await self._analyze(aircraft, country)
+    
+    async def _analyze(self, aircraft: str, country: str) -> Dict[str, Any]:
+        """Análise com cache de resultados, sem disparar o carregamento dos modelos"""
         try:
             self.logger.info(f"🤖 Starting AI analysis: {aircraft} → {country}")
             
             # Obter dados base
             aircraft_data = self.knowledge_base['aircraft_database'].get(aircraft.lower())
-            regulatory_data = self.knowledge_base['regulatory_knowledge'].get(country.upper())
+            regulatory_data = self.knowledge_base['regulatory_knowledge'].get(_region_key(country))
             
             if not aircraft_data or not regulatory_data:
                 return await self._fallback_analysis(aircraft, country, "Insufficient data")
             
+            # Mesma entrada, mesmos modelos e mesma base de conhecimento: mesmo resultado
+            cache_key = self._result_cache_key(aircraft, country)
+            cached_result = await cache_service.get_value(cache_key)
+            if cached_result is not None:
+                return cached_result
+            
             # Preparar contexto para análise AI
             analysis_context = self._prepare_analysis_context(aircraft_data, regulatory_data)
             
@@ -272,6 +439,10 @@ class AviationAIAnalyzer:
                 aircraft, country, aircraft_data, regulatory_data, ai_results
             )
             
+            # Fallbacks por falha de inferência não são cacheados; o próximo pedido tenta de novo
+            if not (self.models_loaded and ai_results.get('fallback_used')):
+                await cache_service.set_value(cache_key, final_result, settings.ai_cache_ttl_seconds)
+            
             self.logger.info("✅ AI analysis completed successfully")
             return final_result
             
@@ -309,7 +480,11 @@ ANALYSIS REQUIRED: Evaluate compliance status, identify risk factors, and provid
         return context.strip()
     
     async def _run_ai_models(self, context: str, aircraft_data: Dict, regulatory_data: Dict) -> Dict[str, Any]:
-        """Executa modelos AI reais do Hugging Face"""
+        """Executa modelos AI reais do Hugging Face
+        
+        Cada modelo roda em micro-lotes no inference_executor, nunca no event loop.
+        Fila cheia ou timeout degradam para a análise baseada em regras.
+        """
         
         results = {}
         
@@ -318,23 +493,24 @@ ANALYSIS REQUIRED: Evaluate compliance status, identify risk factors, and provid
             self.logger.info("Running compliance classification...")
             compliance_input = f"Aircraft: {aircraft_data['name']} seeking certification with {regulatory_data['authority']}"
             
-            classification_result = self.models['compliance_classifier'](compliance_input)
+            classification_result = await self.batchers['compliance_classifier'].submit(compliance_input)
+            best_label = max(classification_result, key=lambda score: score['score'])
             results['compliance_classification'] = {
-                'prediction': classification_result[0]['label'],
-                'confidence': classification_result[0]['score'],
+                'prediction': best_label['label'],
+                'confidence': best_label['score'],
                 'all_scores': classification_result
             }
             
             # 2. Análise de similaridade semântica
             self.logger.info("Running similarity analysis...")
-            query_embedding = self.models['similarity_model'].encode([context])
+            patterns = self.knowledge_base['compliance_patterns']
+            context_embedding = await self.batchers['similarity_model'].submit(context)
+            matches = self.registry.get('pattern_index').top_k(context_embedding, 3)
             
-            # Comparar com padrões conhecidos
+            # Comparar com padrões conhecidos (já ordenados por similaridade)
             similarities = []
-            for pattern in self.knowledge_base['compliance_patterns']:
-                pattern_embedding = self.models['similarity_model'].encode([pattern['pattern']])
-                similarity = 1 - cosine(query_embedding[0], pattern_embedding[0])
-                
+            for pattern_idx, similarity in matches:
+                pattern = patterns[pattern_idx]
                 similarities.append({
                     'pattern': pattern['pattern'],
                     'similarity': float(similarity),
@@ -343,22 +519,16 @@ ANALYSIS REQUIRED: Evaluate compliance status, identify risk factors, and provid
                     'success_rate': pattern['success_rate']
                 })
             
-            # Ordenar por similaridade
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
-            results['similarity_analysis'] = similarities[:3]
+            results['similarity_analysis'] = similarities
             
             # 3. Geração de insights contextuais
             self.logger.info("Generating AI insights...")
             insight_prompt = f"Analyze aviation compliance: {aircraft_data['name']} to {regulatory_data['authority']}"
             
-            insight_result = self.models['insight_generator'](
-                insight_prompt, 
-                max_length=50,
-                num_return_sequences=1
-            )
+            insight_result = await self.batchers['insight_generator'].submit(insight_prompt)
             
             results['ai_insights'] = {
-                'generated_text': insight_result[0]['generated_text'],
+                'generated_text': insight_result['generated_text'],
                 'context_prompt': insight_prompt
             }
             
@@ -368,6 +538,9 @@ ANALYSIS REQUIRED: Evaluate compliance status, identify risk factors, and provid
             
             return results
             
+        except InferenceUnavailableError as e:
+            self.logger.warning(f"AI inference unavailable ({e.context.get('reason')}): {e.message}")
+            return await self._run_fallback_ai(context, aircraft_data, regulatory_data)
         except Exception as e:
             self.logger.error(f"AI model execution failed: {e}")
             # Fallback para análise simulada
@@ -378,9 +551,6 @@ ANALYSIS REQUIRED: Evaluate compliance status, identify risk factors, and provid
         
         self.logger.info("Running fallback AI analysis...")
         
-        # Simular pequeno delay para parecer processamento AI
-        await asyncio.sleep(0.3)
-        
         # Análise baseada em regras que simula AI
         target_authority = regulatory_data['authority']
         existing_certs = aircraft_data['certifications']
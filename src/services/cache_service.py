@@ -8,13 +8,16 @@ and compliance-specific caching strategies.
 import json
 import hashlib
 import asyncio
-from typing import Optional, Any, Dict, List
+from typing import TYPE_CHECKING, Optional, Any, Dict, List
 from datetime import datetime, timedelta
-import redis.asyncio as redis
 from contextlib import asynccontextmanager
 
 from src.config import settings
 from src.logger import get_logger
+from src.services.local_cache import LocalLRUCache
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
 
 
 logger = get_logger(__name__)
@@ -24,9 +27,11 @@ class CacheService:
     """Async Redis cache service with connection pooling and error handling."""
     
     def __init__(self):
-        self._redis: Optional[redis.Redis] = None
-        self._connection_pool: Optional[redis.ConnectionPool] = None
+        self._redis: Optional["redis.Redis"] = None
+        self._connection_pool: Optional["redis.ConnectionPool"] = None
         self._is_connected = False
+        self._local = LocalLRUCache(settings.max_cache_size if settings.local_cache_enabled else 0)
+        self._invalidation_listener: Optional[asyncio.Task] = None
         
     @property
     def is_enabled(self) -> bool:
@@ -45,6 +50,9 @@ class CacheService:
         Returns:
             True if connection successful, False otherwise
         """
+        # Imported here: redis.asyncio costs ~150 ms and is unused while caching is off
+        import redis.asyncio as redis
+        
         try:
             # Create connection URL
             redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
@@ -66,6 +74,8 @@ class CacheService:
             # Test connection
             await self._redis.ping()
             self._is_connected = True
+            if settings.local_cache_enabled:
+                self._start_invalidation_listener()
             
             logger.info(
                 "Redis connection established",
@@ -91,6 +101,9 @@ class CacheService:
     
     async def disconnect(self):
         """Close Redis connection and cleanup resources."""
+        if self._invalidation_listener is not None:
+            self._invalidation_listener.cancel()
+            self._invalidation_listener = None
         if self._redis:
             await self._redis.close()
         if self._connection_pool:
@@ -119,6 +132,23 @@ class CacheService:
         # Add prefix
         return f"{settings.cache_key_prefix}check:{key_data}"
     
+    def report_key(self, model: str, country: str, encoding: Optional[str] = None) -> str:
+        """
+        Key of the pre-serialized report for a model and country.
+        
+        Used with ``get_bytes``/``set_bytes``, which add the global prefix.
+        
+        Args:
+            model: Aircraft model
+            country: Country code
+            encoding: Content coding of a precompressed copy (None for the JSON itself)
+            
+        Returns:
+            Cache key string without the global prefix
+        """
+        key = f"report:{model.upper().strip()}:{country.upper().strip()}"
+        return f"{key}:{encoding}" if encoding else key
+    
     def _serialize_data(self, data: Any) -> str:
         """
         Serialize data for Redis storage.
@@ -149,6 +179,211 @@ class CacheService:
         """
         return json.loads(data)
     
+    async def get_value(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the local tier, falling back to Redis.
+        
+        Redis hits are copied into the local tier for the rest of their Redis TTL,
+        so the next lookup stays in-process. Both tiers are off while caching is disabled.
+        
+        Args:
+            key: Cache key without the global prefix
+            
+        Returns:
+            Cached value or None if not found
+        """
+        if not settings.cache_enabled:
+            return None
+        
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        
+        if not self._is_connected:
+            return None
+            
+        try:
+            cached_data, ttl = await self._get_with_ttl(key)
+            if cached_data is None:
+                return None
+            value = self._deserialize_data(cached_data)
+            self._local.set(key, value, ttl)
+            return value
+            
+        except Exception as e:
+            logger.error(
+                "Error retrieving from cache",
+                extra={"error": str(e), "cache_key": key}
+            )
+            return None
+    
+    async def set_value(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Store a value in the local tier and, when connected, in Redis.
+        
+        Args:
+            key: Cache key without the global prefix
+            value: JSON-serializable value; treat it as read-only once cached
+            ttl_seconds: Time to live in seconds (uses default if None)
+            
+        Returns:
+            True if the value reached Redis, False if it is only cached locally
+        """
+        if not settings.cache_enabled:
+            return False
+        
+        ttl = ttl_seconds or settings.cache_ttl_seconds
+        self._local.set(key, value, ttl)
+        
+        if not self._is_connected:
+            return False
+            
+        try:
+            await self._redis.setex(f"{settings.cache_key_prefix}{key}", ttl, self._serialize_data(value))
+            return True
+            
+        except Exception as e:
+            logger.error(
+                "Error caching value",
+                extra={"error": str(e), "cache_key": key}
+            )
+            return False
+    
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get a pre-serialized payload from the local tier, falling back to Redis.
+        
+        Unlike ``get_value`` nothing is decoded, so a hit can be written to the
+        response as is.
+        
+        Args:
+            key: Cache key without the global prefix
+        
+        Returns:
+            Cached bytes or None if not found
+        """
+        if not settings.cache_enabled:
+            return None
+        
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        
+        if not self._is_connected:
+            return None
+        
+        try:
+            value, ttl = await self._get_with_ttl(key)
+            if value is not None:
+                self._local.set(key, value, ttl)
+            return value
+        
+        except Exception as e:
+            logger.error(
+                "Error retrieving from cache",
+                extra={"error": str(e), "cache_key": key}
+            )
+            return None
+    
+    async def set_bytes(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Store a pre-serialized payload in the local tier and, when connected, in Redis.
+        
+        Args:
+            key: Cache key without the global prefix
+            value: Serialized payload
+            ttl_seconds: Time to live in seconds (uses default if None)
+        
+        Returns:
+            True if the value reached Redis, False if it is only cached locally
+        """
+        if not settings.cache_enabled:
+            return False
+        
+        ttl = ttl_seconds or settings.cache_ttl_seconds
+        self._local.set(key, value, ttl)
+        
+        if not self._is_connected:
+            return False
+        
+        try:
+            await self._redis.setex(f"{settings.cache_key_prefix}{key}", ttl, value)
+            return True
+        
+        except Exception as e:
+            logger.error(
+                "Error caching value",
+                extra={"error": str(e), "cache_key": key}
+            )
+            return False
+
+    async def _get_with_ttl(self, key: str):
+        """Fetch a Redis entry with its remaining TTL, so local copies expire with it.
+        
+        Returns:
+            ``(value, ttl_seconds)``; the default TTL applies to keys without an expiry
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(f"{settings.cache_key_prefix}{key}")
+            pipe.pttl(f"{settings.cache_key_prefix}{key}")
+            value, ttl_ms = await pipe.execute()
+        return value, ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else settings.cache_ttl_seconds
+
+    def clear_local(self, prefix: str = "") -> int:
+        """Drop local-tier entries whose key starts with ``prefix``."""
+        return self._local.clear(prefix)
+
+    @property
+    def _invalidation_channel(self) -> str:
+        return f"{settings.cache_key_prefix}invalidate"
+    
+    def _start_invalidation_listener(self) -> None:
+        if self._invalidation_listener is None or self._invalidation_listener.done():
+            self._invalidation_listener = asyncio.create_task(
+                self._listen_for_invalidations(), name="cache-invalidation-listener"
+            )
+    
+    async def _listen_for_invalidations(self) -> None:
+        """Apply invalidations broadcast by any worker to this process's local tier."""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._invalidation_channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "Cache invalidation listener failed",
+                    extra={"error": str(e)}
+                )
+                # Invalidations sent while unsubscribed are lost, so nothing local can be trusted
+                self._local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+    
+    def _apply_invalidation(self, data) -> None:
+        message = json.loads(data)
+        for key in message.get("keys", ()):
+            self._local.delete(key)
+        if message.get("prefix") is not None:
+            self._local.clear(message["prefix"])
+    
+    async def _broadcast_invalidation(self, keys: List[str] = (), prefix: Optional[str] = None) -> None:
+        """Ask every worker's local tier to drop ``keys`` and the keys under ``prefix``."""
+        if not settings.local_cache_enabled:
+            return
+        try:
+            await self._redis.publish(self._invalidation_channel, json.dumps({"keys": list(keys), "prefix": prefix}))
+        except Exception as e:
+            logger.error(
+                "Error broadcasting cache invalidation",
+                extra={"error": str(e)}
+            )
+    
     async def get_compliance_result(self, model: str, country: str) -> Optional[Dict]:
         """
         Get cached compliance result.
@@ -268,12 +503,17 @@ class CacheService:
         Returns:
             True if successfully invalidated, False otherwise
         """
+        report_keys = [self.report_key(model, country, encoding) for encoding in (None, "gzip", "br")]
+        dropped_locally = self._local.delete(report_keys[0])
+        for key in report_keys[1:]:
+            self._local.delete(key)
         if not self._is_connected:
-            return False
+            return dropped_locally
             
         try:
             cache_key = self._generate_cache_key(model, country)
-            deleted = await self._redis.delete(cache_key)
+            deleted = await self._redis.delete(cache_key, *(f"{settings.cache_key_prefix}{key}" for key in report_keys))
+            await self._broadcast_invalidation(keys=report_keys)
             
             logger.info(
                 "Invalidated cache entry",
@@ -304,15 +544,19 @@ class CacheService:
         Returns:
             Number of keys deleted
         """
+        dropped_locally = self._local.clear("report:")
         if not self._is_connected:
-            return 0
+            return dropped_locally
             
         try:
             pattern = f"{settings.cache_key_prefix}check:*"
             keys = await self._redis.keys(pattern)
+            keys += await self._redis.keys(f"{settings.cache_key_prefix}report:*")
             
-            if keys:
-                deleted = await self._redis.delete(*keys)
+            deleted = await self._redis.delete(*keys) if keys else 0
+            # After the delete, so no worker re-promotes a Redis copy it was told to drop
+            await self._broadcast_invalidation(prefix="report:")
+            if deleted:
                 logger.info(
                     "Cleared compliance cache",
                     extra={
@@ -320,8 +564,7 @@ class CacheService:
                         "pattern": pattern
                     }
                 )
-                return deleted
-            return 0
+            return deleted
             
         except Exception as e:
             logger.error(
@@ -340,7 +583,8 @@ class CacheService:
         if not self._is_connected:
             return {
                 "connected": False,
-                "error": "Not connected to Redis"
+                "error": "Not connected to Redis",
+                "local_cache": self._local.stats()
             }
             
         try:
@@ -359,7 +603,8 @@ class CacheService:
                 "compliance_cache_entries": len(compliance_keys),
                 "cache_enabled": settings.cache_enabled,
                 "cache_ttl_seconds": settings.cache_ttl_seconds,
-                "max_cache_size": settings.max_cache_size
+                "max_cache_size": settings.max_cache_size,
+                "local_cache": self._local.stats()
             }
             
         except Exception as e:
@@ -367,11 +612,6 @@ class CacheService:
                 "connected": False,
                 "error": str(e)
             }
-    
-    @property
-    def is_connected(self) -> bool:
-        """Check if Redis is connected."""
-        return self._is_connected
 
 
 # Global cache service instance
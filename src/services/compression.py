@@ -0,0 +1,88 @@
+"""
+HTTP content-coding helpers shared by the compression middleware and the
+report cache.
+
+gzip is always available. Brotli is used when the optional ``brotli`` (or
+``brotlicffi``) package is installed; otherwise it is simply never offered.
+"""
+
+import gzip
+import zlib
+from typing import List, Optional
+
+from src.config import settings
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+def supported_encodings() -> List[str]:
+    """Content codings this process can produce, most preferred first."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick a content coding from an ``Accept-Encoding`` header.
+
+    Honours q-values (``q=0`` refuses a coding) and ``*``; on equal weight
+    brotli is preferred over gzip.
+
+    Returns:
+        ``"br"``, ``"gzip"`` or None for the identity coding
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in supported_encodings():
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body with the configured level for ``encoding``."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.compression_brotli_quality)
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
+
+
+class StreamCompressor:
+    """Incremental compressor for bodies sent in several ASGI messages."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.compression_brotli_quality)
+        else:
+            # wbits=31 selects the gzip container
+            self._zlib = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress the next chunk; may return b"" while output is buffered."""
+        if self.encoding == "br":
+            return self._brotli.process(chunk)
+        return self._zlib.compress(chunk)
+
+    def finish(self) -> bytes:
+        """Flush buffered output and close the stream."""
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
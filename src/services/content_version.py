@@ -0,0 +1,176 @@
+"""
+Content versioning for HTTP conditional requests.
+
+Catalog responses (models, authorities, aircraft) are versioned by a signature
+of the catalog tables: ``(count, max(updated_at))`` of regulations, aircraft
+models and authorities, read in one query. Every writer (the importer, the
+seeding scripts, another API worker) changes it through the database, so the
+version moves in every process without any of them having to signal. The
+signature is re-read at most every ``content_version_ttl_seconds``;
+``bump()`` forces a re-read after an in-process write. Compliance reports are
+versioned by a hash of their serialized body, which is remembered per path
+for the current dataset version.
+
+Until the signature has been read (or without a session factory, as in unit
+tests) the version is a per-process counter behind a random epoch, so two
+workers never issue the same tag for possibly different content.
+"""
+
+import hashlib
+import secrets
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.events import TOPICS, subscribe
+from src.logger import get_logger
+from src.services.local_cache import LocalLRUCache
+
+
+logger = get_logger(__name__)
+
+
+def _quote(digest: str) -> str:
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``:
+    ``W/`` prefixes are ignored and ``*`` matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def weaken_etag(etag: str) -> str:
+    """Weak form of an ETag, for a recoded (e.g. compressed) body that is no longer byte-identical."""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+async def dataset_signature(session: AsyncSession) -> str:
+    """Digest of ``(count, max(updated_at))`` over the catalog tables, in one round trip."""
+    from src.models.db_models_sqlite import AircraftModel, Authority, Regulation
+
+    columns = []
+    for model in (Regulation, AircraftModel, Authority):
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    row = (await session.execute(select(*columns))).one()
+    return hashlib.blake2b("\0".join(map(str, row)).encode(), digest_size=8).hexdigest()
+
+
+def _app_session() -> AsyncSession:
+    from src.database import AsyncSessionLocal
+
+    return AsyncSessionLocal()
+
+
+class ContentVersion:
+    """Dataset version read from the database plus the ETags of served compliance reports.
+
+    Args:
+        max_reports: Report ETags remembered at once
+        session_factory: Opens a session for reading the signature; None keeps
+            the version process-local (bumped by ``bump()`` only)
+        ttl_seconds: Reuse a signature this long before reading it again
+    """
+
+    def __init__(self, max_reports: int = 1000,
+                 session_factory: Optional[Callable[[], AsyncSession]] = None,
+                 ttl_seconds: float = 5.0):
+        self._epoch = secrets.token_hex(4)
+        self._counter = 0
+        self._report_etags = LocalLRUCache(max_reports)
+        self._session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._signature: Optional[str] = None
+        self._checked_at = float("-inf")
+
+    @property
+    def version(self) -> str:
+        """Opaque token that changes whenever the dataset may have changed."""
+        if self._signature is not None:
+            return self._signature
+        return f"{self._epoch}.{self._counter}"
+
+    async def refresh(self) -> str:
+        """Re-read the dataset signature if the last read is older than ``ttl_seconds``.
+
+        A failed read keeps the current version and is retried after the TTL.
+
+        Returns:
+            The current version
+        """
+        if self._session_factory is None or time.monotonic() - self._checked_at < self.ttl_seconds:
+            return self.version
+        # Set before awaiting so concurrent requests reuse the current version meanwhile
+        self._checked_at = time.monotonic()
+        try:
+            async with self._session_factory() as session:
+                signature = await dataset_signature(session)
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not read the dataset signature: {e}")
+            return self.version
+        if signature != self._signature:
+            self._signature = signature
+            self._report_etags.clear()
+        return self.version
+
+    def bump(self) -> None:
+        """Record a committed write in this process; every ETag issued so far goes stale."""
+        self._counter += 1
+        self._checked_at = float("-inf")
+        self._report_etags.clear()
+
+    def dataset_etag(self, scope: str) -> str:
+        """Strong ETag of a catalog response at the current dataset version.
+
+        Args:
+            scope: Identifies the representation, typically the request path
+        """
+        digest = hashlib.blake2b(f"{scope}\0{self.version}".encode(), digest_size=12).hexdigest()
+        return _quote(digest)
+
+    def report_etag(self, key: str, body: bytes) -> str:
+        """Hash a report body and remember its ETag for ``key``.
+
+        Args:
+            key: Identifies the report, typically the request path
+            body: Serialized report exactly as sent to the client
+
+        Returns:
+            Strong ETag of ``body``
+        """
+        etag = _quote(hashlib.blake2b(body, digest_size=16).hexdigest())
+        self._report_etags.set(key, (self.version, etag), settings.cache_ttl_seconds)
+        return etag
+
+    def known_report_etag(self, key: str) -> Optional[str]:
+        """ETag last served for ``key``, if issued at the current dataset version."""
+        entry = self._report_etags.get(key)
+        if entry is None or entry[0] != self.version:
+            return None
+        return entry[1]
+
+
+# Global content version instance
+content_version = ContentVersion(
+    settings.max_cache_size,
+    session_factory=_app_session,
+    ttl_seconds=settings.content_version_ttl_seconds,
+)
+
+# Repository writes in this process stale every ETag issued so far
+for _topic in TOPICS:
+    subscribe(_topic, content_version.bump)
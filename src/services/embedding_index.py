@@ -0,0 +1,121 @@
+"""
+Precomputed sentence embeddings for fixed reference texts.
+
+Compliance patterns and reference cases never change at runtime, so they are
+encoded once when the similarity model loads and kept as an L2-normalized
+matrix. Scoring a request is then one encode of the query plus a single
+matrix-vector product. Matrices can be persisted to disk, keyed by model name
+and a hash of the texts, so restarts skip the encode entirely.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+from src.logger import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+logger = get_logger(__name__)
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def content_hash(model_name: str, texts: Sequence[str]) -> str:
+    """Stable key of an encoder and the exact texts it encoded."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model_name.encode("utf-8"))
+    for text in texts:
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize each row so dot products are cosine similarities."""
+    import numpy as np  # Deferred: the index is only built once the similarity model loads
+
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class EmbeddingIndex:
+    """Normalized embedding matrix of a fixed list of texts."""
+
+    def __init__(self, texts: Sequence[str], embeddings: "np.ndarray"):
+        self.texts = list(texts)
+        self.embeddings = normalize_rows(embeddings)
+        if len(self.texts) != self.embeddings.shape[0]:
+            raise ValueError("texts and embeddings must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def build(
+        cls,
+        encoder: Any,
+        texts: Sequence[str],
+        model_name: str,
+        cache_dir: Optional[str] = None,
+    ) -> "EmbeddingIndex":
+        """Encode ``texts`` in one batch, or load them from ``cache_dir``.
+
+        Args:
+            encoder: Object with a SentenceTransformer-style ``encode(list)`` method
+            texts: Texts to index, in the order results should refer to them
+            model_name: Encoder name, part of the cache key
+            cache_dir: Directory for ``.npy`` matrices; None disables persistence
+
+        Returns:
+            EmbeddingIndex over ``texts``
+        """
+        import numpy as np
+
+        path = None
+        if cache_dir:
+            safe_name = _UNSAFE_FILENAME.sub("_", model_name)
+            path = Path(cache_dir) / f"{safe_name}-{content_hash(model_name, texts)}.npy"
+            if path.exists():
+                try:
+                    return cls(texts, np.load(path, allow_pickle=False))
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable embedding cache {path}: {e}")
+
+        index = cls(texts, encoder.encode(list(texts)))
+
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                np.save(path, index.embeddings, allow_pickle=False)
+            except OSError as e:
+                logger.warning(f"Could not persist embeddings to {path}: {e}")
+        return index
+
+    def top_k(self, query: "np.ndarray", k: int) -> List[Tuple[int, float]]:
+        """Most similar rows to an already encoded query.
+
+        Returns:
+            ``(row index, cosine similarity)`` pairs, best first
+        """
+        import numpy as np
+
+        scores = self.embeddings @ normalize_rows(query)[0]
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        best = candidates[np.argsort(-scores[candidates])]
+        return [(int(i), float(scores[i])) for i in best]
+
+    def search(self, encoder: Any, query: str, k: int) -> List[Tuple[int, float]]:
+        """Encode ``query`` once and return its ``top_k`` matches."""
+        return self.top_k(encoder.encode([query]), k)
@@ -3,19 +3,51 @@ Enhanced compliance service supporting new aircraft models and database integrat
 """
 
 import json
-from typing import List, Dict, Optional
+import re
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Sequence, Tuple
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.compliance import ComplianceReport, ComplianceCheck as ComplianceCheckModel, AircraftInfo
-from src.repositories import AuthorityRepository, AircraftModelRepository, RegulationRepository, ComplianceCheckRepository
+from src.repositories import (
+    AuthorityRepository, AircraftModelRepository, RegulationRepository, ComplianceCheckRepository,
+    ComplianceHistoryRepository,
+)
 from src.logger import log_business_event, log_security_event
+from src.models.designations import SUPPORTED_MODELS
 from src.services.cache_service import cache_service
+from src.services.history_recorder import history_recorder
+from src.services.compression import compress, supported_encodings
+from src.services.applicability_service import applicable_models_of, applies_to, designation_codes, model_codes
+from src.services.model_resolver import model_resolver
 from src.config import settings
 from src.exceptions import ValidationError, DatabaseError, create_not_found_error
 from src.error_messages import unsupported_aircraft_model, unsupported_country, resource_not_found
 
 
+_OVERALL_STATUS = re.compile(rb'"overall_status":"([A-Z_]+)"')
+
+# compliance_percentage recorded in the history for each check status
+_HISTORY_PERCENTAGE = {"COMPLIANT": 100.0, "PARTIAL_COMPLIANCE": 50.0, "NON_COMPLIANT": 0.0}
+
+
+def report_cache_key(model: str, country: str, encoding: Optional[str] = None) -> str:
+    """Cache key of the serialized (optionally precompressed) report for one model and country."""
+    return cache_service.report_key(model, country, encoding)
+
+
+def serialize_report(report: ComplianceReport) -> bytes:
+    """Compact JSON body of a report, as FastAPI would render it."""
+    return report.model_dump_json().encode()
+
+
+def report_status(body: bytes) -> str:
+    """``overall_status`` of a serialized report without parsing the whole body."""
+    match = _OVERALL_STATUS.search(body)
+    return match.group(1).decode() if match else "unknown"
+
+
 class EnhancedComplianceService:
     """Enhanced service for checking aircraft compliance with database support."""
 
@@ -25,6 +57,7 @@ class EnhancedComplianceService:
         self.aircraft_repo = AircraftModelRepository(session)
         self.regulation_repo = RegulationRepository(session)
         self.compliance_check_repo = ComplianceCheckRepository(session)
+        self.history_repo = ComplianceHistoryRepository(session)
         
         self.authority_map = {
             "USA": "FAA",
@@ -32,29 +65,7 @@ class EnhancedComplianceService:
             "EUROPE": "EASA",
         }
         
-        # Extended supported models - All Embraer aircraft
-        self.supported_models = [
-            # E-Jets E2 (Nova Geração)
-            "E175-E2", "E190-E2", "E195-E2",
-            
-            # E-Jets (Primeira Geração)
-            "E170", "E175", "E175-E1", "E190", "E190-E1", "E195", "E195-E1",
-            
-            # Aviação Executiva - Família Phenom
-            "Phenom-100EX", "Phenom-300E",
-            
-            # Aviação Executiva - Família Praetor
-            "Praetor-500", "Praetor-600",
-            
-            # Defesa e Segurança
-            "C-390", "KC-390", "A-29",
-            
-            # Aviação Agrícola
-            "EMB-203",
-            
-            # Outros fabricantes (legado)
-            "737", "737-800", "A320", "A320neo"
-        ]
+        self.supported_models = list(SUPPORTED_MODELS)
         
         self.supported_countries = ["USA", "BRAZIL", "EUROPE"]
 
@@ -88,35 +99,32 @@ class EnhancedComplianceService:
             {"model": model, "country": country}
         )
 
-    async def _find_aircraft_models(self, model: str) -> List:
-        """Find aircraft models by model name or variant."""
-        # Try exact match first
-        aircraft_models = await self.aircraft_repo.get_by_model(model)
-        if aircraft_models:
-            return aircraft_models
+    async def validation_errors(self, model: str, countries: Sequence[str]) -> Dict[str, str]:
+        """Validate one model against several countries without running any checks.
         
-        # Try to find by variant (e.g., E175-E2)
-        if "-" in model:
-            base_model, variant = model.split("-", 1)
-            # Search for base model
-            base_models = await self.aircraft_repo.get_by_model(base_model)
-            # Filter by variant
-            for aircraft in base_models:
-                if aircraft.variant and variant in aircraft.variant:
-                    return [aircraft]
-        
-        # Try search in all models
-        all_aircraft = await self.aircraft_repo.get_all()
-        for aircraft in all_aircraft:
-            # Check if model matches variant
-            if aircraft.variant == model:
-                return [aircraft]
-            # Check if model is contained in variant
-            if aircraft.variant and model in aircraft.variant:
-                return [aircraft]
+        Args:
+            model: The aircraft model
+            countries: Countries to validate
+            
+        Returns:
+            Validation message per country that failed; countries that passed are absent
+        """
+        errors = {}
+        for country in countries:
+            try:
+                await self.validate_input(model, country)
+            except ValidationError as e:
+                errors[country] = e.message
+        return errors
+
+    async def _find_aircraft_models(self, model: str) -> List:
+        """Find aircraft models by model name, variant, family code or alias."""
+        resolution = await model_resolver.resolve(self.session, model)
+        if resolution and resolution.model_ids:
+            return await self.aircraft_repo.get_by_ids(resolution.model_ids)
         
         # Fallback: if database is empty, validate against supported_models list
-        if not all_aircraft and model in self.supported_models:
+        if not model_resolver.has_aircraft and model in self.supported_models:
             # Return a mock aircraft model for validation
             return [{"model": model, "manufacturer": "Embraer", "variant": None}]
         
@@ -134,34 +142,32 @@ class EnhancedComplianceService:
             # Fallback: use static regulations data when database is empty
             return await self._get_fallback_regulations(model, country_upper)
 
-        # Get regulations for this authority
-        authority_regulations = await self.regulation_repo.get_by_authority(authority.id)
-        
-        if not authority_regulations:
+        if not await self.regulation_repo.has_regulations_for_authority(authority.id):
             # Fallback: use static regulations data when no regulations in database
             return await self._get_fallback_regulations(model, country_upper)
         
-        applicable_regulations = []
-        for regulation in authority_regulations:
-            # Check if this regulation applies to the specific model
-            if self._is_regulation_applicable(regulation, model):
-                applicable_regulations.append({
-                    "id": regulation.id,
-                    "reference": regulation.reference,
-                    "title": regulation.title,
-                    "description": regulation.description,
-                    "category": regulation.category,
-                    "subcategory": regulation.subcategory,
-                    "authority": authority.code,
-                    "content": regulation.content
-                })
+        # Indexed join over the materialized regulation_models table
+        resolution = await model_resolver.resolve(self.session, model)
+        code = resolution.code if resolution else designation_codes(model)[0]
+        regulations = await self.regulation_repo.get_applicable(code, authority.id)
         
-        return applicable_regulations
+        return [
+            {
+                "id": regulation.id,
+                "reference": regulation.reference,
+                "title": regulation.title,
+                "description": regulation.description,
+                "category": regulation.category,
+                "subcategory": regulation.subcategory,
+                "authority": authority.code,
+                "content": regulation.content
+            }
+            for regulation in regulations
+        ]
 
     async def _get_fallback_regulations(self, model: str, country: str) -> List[Dict]:
         """Get regulations from static data as fallback when database is empty."""
         # Load static regulations data
-        import json
         try:
             with open("src/data/regulations.json") as f:
                 static_regulations = json.load(f)
@@ -172,12 +178,13 @@ class EnhancedComplianceService:
         if not authority_code:
             return []
         
+        codes = model_codes(model)
         applicable_regulations = []
         for regulation in static_regulations:
             if regulation.get("authority") == authority_code:
-                # Check if model is in applicability list or use for all models if empty
+                # Exact or family match; an empty applicability list applies to all models
                 applicability = regulation.get("applicability", [])
-                if not applicability or model in applicability or any(model.startswith(app) for app in applicability):
+                if applies_to(applicability, codes):
                     applicable_regulations.append({
                         "id": len(applicable_regulations) + 1,
                         "reference": regulation.get("description", ""),
@@ -193,20 +200,8 @@ class EnhancedComplianceService:
 
     def _is_regulation_applicable(self, regulation, model: str) -> bool:
         """Check if a regulation applies to a specific aircraft model."""
-        # If regulation has content with applicable_models, check that
-        if regulation.content and isinstance(regulation.content, dict):
-            applicable_models = regulation.content.get("applicable_models", [])
-            if applicable_models:
-                # Check exact match or variant match
-                for applicable_model in applicable_models:
-                    if (applicable_model == model or 
-                        applicable_model in model or 
-                        model.startswith(applicable_model)):
-                        return True
-                return False
-        
-        # If no specific model restrictions, apply to all models
-        return True
+        # No specific model restrictions means the regulation applies to all models
+        return applies_to(applicable_models_of(regulation.content), model_codes(model))
 
     async def check_compliance(self, model: str, country: str) -> ComplianceReport:
         """Performs comprehensive compliance check with database integration.
@@ -222,19 +217,53 @@ class EnhancedComplianceService:
             ValidationError: If input validation fails
             HTTPException: If service error occurs
         """
+        report, body = await self._check_compliance(model, country)
+        return report if report is not None else ComplianceReport.model_validate_json(body)
+
+    async def check_compliance_json(self, model: str, country: str) -> bytes:
+        """Compliance report serialized as JSON.
+        
+        Cache hits are returned exactly as stored, without building or
+        validating a ``ComplianceReport``, so the endpoint can write them
+        straight to the response.
+        
+        Raises:
+            ValidationError: If input validation fails
+            HTTPException: If service error occurs
+        """
+        report, body = await self._check_compliance(model, country)
+        return body if body is not None else serialize_report(report)
+
+    async def precompressed_report(self, model: str, country: str, encoding: str) -> Optional[bytes]:
+        """Cached copy of a report body already compressed with ``encoding``.
+        
+        Returns:
+            The compressed body, or None when caching is off or no copy is cached
+        """
+        if not cache_service.is_enabled:
+            return None
+        return await cache_service.get_bytes(report_cache_key(model, country, encoding))
+
+    async def _check_compliance(self, model: str, country: str) -> Tuple[Optional[ComplianceReport], Optional[bytes]]:
+        """Run or fetch a compliance check.
+        
+        Returns:
+            ``(None, body)`` on a cache hit, otherwise the new report and, when
+            caching is enabled, its serialized body
+        """
         try:
-            # Input validation
-            await self.validate_input(model, country)
-            
             # Cache key for this specific check
-            cache_key = f"compliance:{model}:{country}"
+            cache_key = report_cache_key(model, country)
             
-            # Try to get from cache first
+            # Only validated inputs are ever cached, so a hit skips validation too
             if cache_service.is_enabled:
-                cached_result = await cache_service.get(cache_key)
-                if cached_result:
+                cached_body = await cache_service.get_bytes(cache_key)
+                if cached_body:
                     log_business_event("cache_hit", {"cache_key": cache_key})
-                    return ComplianceReport.model_validate(cached_result)
+                    return None, cached_body
+
+            # Input validation
+            await self.validate_input(model, country)
 
             log_business_event(
                 "compliance_check_started",
@@ -287,6 +316,9 @@ class EnhancedComplianceService:
                     elif overall_status == "COMPLIANT":
                         overall_status = "PARTIAL_COMPLIANCE"
 
+            if aircraft_models:
+                self._record_history(aircraft_models[0], applicable_regulations, compliance_checks, country)
+
             # Create summary
             total_checks = len(compliance_checks)
             compliant_checks = len([c for c in compliance_checks if c.status == "COMPLIANT"])
@@ -316,13 +348,19 @@ class EnhancedComplianceService:
                 aircraft_info=aircraft_info
             )
 
-            # Cache the result
+            # Cache the serialized report; hits are served without a pydantic round-trip
+            body = None
             if cache_service.is_enabled:
-                await cache_service.set(
-                    cache_key, 
-                    compliance_report.model_dump(), 
-                    ttl=settings.cache_ttl_seconds
-                )
+                body = serialize_report(compliance_report)
+                await cache_service.set_bytes(cache_key, body, settings.cache_ttl_seconds)
+                # Compress once per fill rather than once per response
+                if settings.compression_enabled and len(body) >= settings.compression_minimum_size:
+                    for encoding in supported_encodings():
+                        await cache_service.set_bytes(
+                            report_cache_key(model, country, encoding),
+                            compress(body, encoding),
+                            settings.cache_ttl_seconds
+                        )
 
             log_business_event(
                 "compliance_check_completed",
@@ -335,7 +373,7 @@ class EnhancedComplianceService:
                 }
             )
 
-            return compliance_report
+            return compliance_report, body
 
         except ValidationError:
             raise
@@ -350,6 +388,78 @@ class EnhancedComplianceService:
                 detail=f"Internal server error during compliance check: {str(e)}"
             )
 
+    async def get_compliance_history(self, model: str, days: int = 30) -> Dict:
+        """Summary and daily trend of a model's recorded compliance checks.
+        
+        A family designation (e.g. "E175") covers the checks of every member.
+        
+        Args:
+            model: The aircraft model
+            days: Days of history, ending now
+            
+        Returns:
+            The model, the period, the summary and one trend entry per day with checks
+            
+        Raises:
+            ValidationError: If the model is not in the database
+        """
+        resolution = await model_resolver.resolve(self.session, model)
+        if not resolution or not resolution.model_ids:
+            raise unsupported_aircraft_model(model)
+        
+        end = datetime.utcnow()
+        start = end - timedelta(days=days)
+        model_ids = sorted(resolution.model_ids)
+        summary = await self.history_repo.get_compliance_summary(model_ids, start, end)
+        trend = await self.history_repo.get_daily_trend(start, end, model_ids)
+        return {
+            "model": model,
+            "days": days,
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "summary": summary,
+            "trend": [
+                {"date": day.isoformat(), "total_checks": sum(counts.values()), "status_counts": counts}
+                for day, counts in trend.items()
+            ]
+        }
+
+    def _record_history(
+        self,
+        aircraft,
+        regulations: List[Dict],
+        checks: List[ComplianceCheckModel],
+        country: str
+    ) -> int:
+        """Queue evaluated checks for the partitioned compliance history.
+        
+        Only checks of database regulations are recorded; the static fallback
+        has no ids to reference. The rows are written in the background by
+        ``history_recorder``, so the check never waits on the history.
+        
+        Returns:
+            Number of history rows queued
+        """
+        if not settings.compliance_history_enabled or not hasattr(aircraft, "id"):
+            return 0
+        checked_at = datetime.utcnow()
+        rows = [
+            {
+                "aircraft_model_id": aircraft.id,
+                "regulation_id": regulation["id"],
+                "check_date": checked_at,
+                "status": check.status.lower(),
+                "compliance_percentage": _HISTORY_PERCENTAGE.get(check.status),
+                "checked_by": "system",
+                "details": {"country": country, "severity": check.severity},
+            }
+            for regulation, check in zip(regulations, checks)
+            if isinstance(regulation["id"], str)
+        ]
+        if not rows or not history_recorder.submit(self.session.bind, rows):
+            return 0
+        return len(rows)
+
     async def _perform_individual_check(self, regulation: Dict, model: str, country: str) -> ComplianceCheckModel:
         """Perform individual compliance check for a regulation."""
         # Enhanced logic for specific model checks
@@ -395,19 +505,8 @@ class EnhancedComplianceService:
 
     def _model_matches(self, aircraft_model: str, regulation_model: str) -> bool:
         """Check if aircraft model matches regulation model specification."""
-        # Exact match
-        if aircraft_model == regulation_model:
-            return True
-        
-        # Base model match (e.g., E175 matches E175-E1, E175-E2)
-        if regulation_model in aircraft_model:
-            return True
-        
-        # Series match (e.g., E175-E2 matches E175)
-        if aircraft_model.startswith(regulation_model):
-            return True
-        
-        return False
+        # Exact match or family match (E175 covers E175-E1 and E175-E2, E17 covers nothing)
+        return str(regulation_model).strip().upper() in model_codes(aircraft_model)
 
     def _perform_category_specific_check(self, regulation: Dict, model: str, country: str) -> tuple:
         """Perform category-specific compliance checks."""
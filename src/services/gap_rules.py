@@ -0,0 +1,380 @@
+"""
+Data-driven regulatory gap rules.
+
+The rule table in ``src/data/gap_rules.json`` lists, per target authority,
+the gaps an aircraft faces, how their status depends on the origin country,
+which model families trigger extra gaps, and the BASA (bilateral aviation
+safety agreement) pairs. It is compiled once into frozen structures with
+numeric cost bounds, so a gap analysis is a dictionary lookup plus a sum
+over the selected rules. Adding a country is a data change only.
+"""
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Collection, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.services.model_resolver import normalize_designation
+
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent / "data" / "gap_rules.json"
+
+# Fields of one gap-matrix cell, in order
+MATRIX_COLUMNS = (
+    "totalGaps", "criticalGaps", "highImpactGaps", "overallRisk",
+    "estimatedTimeline", "costMin", "costMax", "hasBilateralAgreement",
+)
+
+FINAL_PHASE_ITEMS = (
+    "Submit final certification package",
+    "Coordinate with target authority for final review",
+    "Prepare for operational approval",
+    "Finalize compliance documentation",
+)
+
+
+def format_cost_range(cost_min: int, cost_max: int) -> str:
+    return f"${cost_min:,} - ${cost_max:,}"
+
+
+@dataclass(frozen=True)
+class GapRule:
+    """One gap a target authority imposes."""
+
+    category: str
+    requirement: str
+    status: str
+    gap_description: str
+    impact: str
+    estimated_effort: str
+    cost_min: int
+    cost_max: int
+    cost_estimate: str
+    status_by_origin: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    models: FrozenSet[str] = frozenset()  # Normalized designations; empty = every model
+    overall_risk: Optional[str] = None  # Risk floor when this gap applies
+
+    def applies_to(self, model_key: str) -> bool:
+        return not self.models or model_key in self.models
+
+    def to_gap(self, origin: str) -> Dict[str, str]:
+        return {
+            "category": self.category,
+            "requirement": self.requirement,
+            "current_status": self.status_by_origin.get(origin, self.status),
+            "gap_description": self.gap_description,
+            "impact": self.impact,
+            "estimated_effort": self.estimated_effort,
+            "cost_estimate": self.cost_estimate,
+        }
+
+
+@dataclass(frozen=True)
+class OriginOverride:
+    """Risk, timeline and extra recommendations for specific origin countries."""
+
+    origins: FrozenSet[str]
+    overall_risk: Optional[str] = None
+    timeline: Optional[str] = None
+    recommendations: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TargetRules:
+    """Every gap rule of one target authority."""
+
+    gaps: Tuple[GapRule, ...]
+    recommendations: Tuple[str, ...] = ()
+    origin_overrides: Tuple[OriginOverride, ...] = ()
+
+
+@dataclass(frozen=True)
+class CountryInfo:
+    code: str
+    name: str
+    authority: str
+    framework: Optional[Mapping[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class GapAssessment:
+    """Gaps selected for one (target, origin, model) with precomputed totals."""
+
+    gaps: Tuple[GapRule, ...]
+    recommendations: Tuple[str, ...]
+    overall_risk: str
+    timeline: str
+    cost_min: int
+    cost_max: int
+    critical_gaps: int
+    high_impact_gaps: int
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of nested JSON data."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Fresh mutable copy of frozen data for a response body."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _compile_rule(raw: Dict[str, Any]) -> GapRule:
+    cost_min, cost_max = (int(bound) for bound in raw.get("cost", (0, 0)))
+    return GapRule(
+        category=raw["category"],
+        requirement=raw["requirement"],
+        status=raw["status"],
+        gap_description=raw["gap_description"],
+        impact=raw["impact"],
+        estimated_effort=raw["estimated_effort"],
+        cost_min=cost_min,
+        cost_max=cost_max,
+        cost_estimate=raw.get("cost_estimate") or format_cost_range(cost_min, cost_max),
+        status_by_origin=MappingProxyType({code.upper(): status for code, status in raw.get("status_by_origin", {}).items()}),
+        models=frozenset(normalize_designation(model) for model in raw.get("models", ())),
+        overall_risk=raw.get("overall_risk"),
+    )
+
+
+class GapRuleBook:
+    """Compiled gap rule table."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.version = data.get("version", 1)
+        self.default_framework = _freeze(data["default_framework"])
+        self.default_timeline = data["default_timeline"]
+        self.default_risk = data["default_risk"]
+        escalation = data["escalation"]
+        self._critical_escalation = escalation["critical"]
+        self._high_escalation = escalation["high"]
+
+        self.countries: Dict[str, CountryInfo] = {}
+        self._aliases: Dict[str, str] = {}
+        for code, country in data["countries"].items():
+            code = code.upper()
+            self.countries[code] = CountryInfo(
+                code=code,
+                name=country["name"],
+                authority=country["authority"],
+                framework=_freeze(country["framework"]) if "framework" in country else None,
+            )
+            self._aliases[code] = code
+            for alias in country.get("aliases", ()):
+                self._aliases[alias.upper()] = code
+
+        bilateral = data["bilateral_agreements"]
+        self.agreement_type = bilateral["agreement_type"]
+        self.basa_benefits = tuple(bilateral["benefits"])
+        self.basa_limitations = tuple(bilateral["limitations"])
+        self.basa_pairs: FrozenSet[Tuple[str, str]] = frozenset(
+            pair for a, b in bilateral["pairs"] for pair in ((a.upper(), b.upper()), (b.upper(), a.upper()))
+        )
+
+        self.targets: Dict[str, TargetRules] = {
+            code.upper(): TargetRules(
+                gaps=tuple(_compile_rule(rule) for rule in target["gaps"]),
+                recommendations=tuple(target.get("recommendations", ())),
+                origin_overrides=tuple(
+                    OriginOverride(
+                        origins=frozenset(origin.upper() for origin in override["origins"]),
+                        overall_risk=override.get("overall_risk"),
+                        timeline=override.get("timeline"),
+                        recommendations=tuple(override.get("recommendations", ())),
+                    )
+                    for override in target.get("origin_overrides", ())
+                ),
+            )
+            for code, target in data["targets"].items()
+        }
+
+        # Assessments depend only on (target, origin, model); memoize per rule book
+        self.assess = lru_cache(maxsize=1024)(self._assess)
+
+    def canonical(self, country: str) -> str:
+        """Country code for a code or alias (``USA`` -> ``US``); unknown values are upper-cased."""
+        value = str(country or "").upper()
+        return self._aliases.get(value, value)
+
+    def _assess(self, target: str, origin: str, model_key: str) -> GapAssessment:
+        rules = self.targets.get(target)
+        if rules is None:
+            return GapAssessment((), (), self.default_risk, self.default_timeline, 0, 0, 0, 0)
+
+        gaps = tuple(rule for rule in rules.gaps if rule.applies_to(model_key))
+        overall_risk = self.default_risk
+        timeline = self.default_timeline
+        recommendations = rules.recommendations
+        for rule in gaps:
+            if rule.overall_risk:
+                overall_risk = rule.overall_risk
+        for override in rules.origin_overrides:
+            if origin in override.origins:
+                overall_risk = override.overall_risk or overall_risk
+                timeline = override.timeline or timeline
+                recommendations += override.recommendations
+
+        critical_gaps = sum(1 for rule in gaps if rule.impact == "critical")
+        high_impact_gaps = sum(1 for rule in gaps if rule.impact == "high")
+        if critical_gaps >= self._critical_escalation["min_gaps"]:
+            overall_risk = self._critical_escalation["overall_risk"]
+            timeline = self._critical_escalation["timeline"]
+        elif high_impact_gaps >= self._high_escalation["min_gaps"]:
+            overall_risk = self._high_escalation["overall_risk"]
+            timeline = self._high_escalation["timeline"]
+
+        return GapAssessment(
+            gaps=gaps,
+            recommendations=recommendations,
+            overall_risk=overall_risk,
+            timeline=timeline,
+            cost_min=sum(rule.cost_min for rule in gaps),
+            cost_max=sum(rule.cost_max for rule in gaps),
+            critical_gaps=critical_gaps,
+            high_impact_gaps=high_impact_gaps,
+        )
+
+    def framework(self, country: str) -> Dict[str, Any]:
+        """Regulatory framework description of a country."""
+        info = self.countries.get(self.canonical(country))
+        return _thaw(info.framework if info and info.framework else self.default_framework)
+
+    def bilateral_agreement(self, origin: str, target: str) -> Dict[str, Any]:
+        """BASA status between two countries."""
+        has_basa = (self.canonical(origin), self.canonical(target)) in self.basa_pairs
+        return {
+            "hasBilateralAgreement": has_basa,
+            "agreementType": self.agreement_type if has_basa else "None",
+            "benefits": list(self.basa_benefits) if has_basa else [],
+            "limitations": [] if has_basa else list(self.basa_limitations),
+        }
+
+    def _describe(self, country: str) -> str:
+        info = self.countries.get(self.canonical(country))
+        if info is None:
+            return f"{country} (Unknown)"
+        return f"{info.name} ({info.authority})"
+
+    def analyze(self, model: str, origin_country: str, target_country: str, analysis_date: Any = None) -> Dict[str, Any]:
+        """Gap analysis response for moving ``model`` from one country to another."""
+        origin = self.canonical(origin_country)
+        assessment = self.assess(self.canonical(target_country), origin, normalize_designation(model))
+        gaps = [rule.to_gap(origin) for rule in assessment.gaps]
+
+        return {
+            "analysis": {
+                "model": model,
+                "originCountry": self._describe(origin_country),
+                "targetCountry": self._describe(target_country),
+                "analysisDate": analysis_date
+            },
+            "summary": {
+                "totalGaps": len(gaps),
+                "criticalGaps": assessment.critical_gaps,
+                "highImpactGaps": assessment.high_impact_gaps,
+                "overallRisk": assessment.overall_risk,
+                "estimatedTimeline": assessment.timeline,
+                "estimatedCostRange": format_cost_range(assessment.cost_min, assessment.cost_max)
+            },
+            "gaps": gaps,
+            "recommendations": list(assessment.recommendations),
+            "actionPlan": action_plan(gaps),
+            "regulatoryContext": {
+                "originFramework": self.framework(origin_country),
+                "targetFramework": self.framework(target_country),
+                "bilateralAgreements": self.bilateral_agreement(origin_country, target_country)
+            }
+        }
+
+    def matrix_cell(self, model: str, origin_country: str, target_country: str) -> List[Any]:
+        """Gap summary of one origin/target pair as a ``MATRIX_COLUMNS`` row."""
+        origin = self.canonical(origin_country)
+        target = self.canonical(target_country)
+        assessment = self.assess(target, origin, normalize_designation(model))
+        return [
+            len(assessment.gaps),
+            assessment.critical_gaps,
+            assessment.high_impact_gaps,
+            assessment.overall_risk,
+            assessment.timeline,
+            assessment.cost_min,
+            assessment.cost_max,
+            (origin, target) in self.basa_pairs,
+        ]
+
+    def matrix(
+        self,
+        model: str,
+        origins: Sequence[str],
+        targets: Sequence[str],
+        unavailable: Collection[str] = (),
+    ) -> Dict[str, Any]:
+        """Every origin x target gap summary for one model.
+
+        ``cells[i][j]`` is the ``MATRIX_COLUMNS`` row for ``origins[i]`` ->
+        ``targets[j]``; it is null on the diagonal and for countries in
+        ``unavailable`` (e.g. whose compliance check failed).
+        """
+        return {
+            "model": model,
+            "origins": list(origins),
+            "targets": list(targets),
+            "cells": [
+                [
+                    None if origin == target or origin in unavailable or target in unavailable
+                    else self.matrix_cell(model, origin, target)
+                    for target in targets
+                ]
+                for origin in origins
+            ],
+        }
+
+
+def action_plan(gaps: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Prioritized action plan: critical gaps, then high-impact gaps, then final validation."""
+    phases = []
+    critical = [gap for gap in gaps if gap["impact"] == "critical"]
+    high = [gap for gap in gaps if gap["impact"] == "high"]
+
+    if critical:
+        phases.append({
+            "phase": len(phases) + 1,
+            "title": "Critical Requirements (Immediate Action)",
+            "duration": "0-3 months",
+            "items": [f"Address {gap['requirement']}: {gap['gap_description']}" for gap in critical]
+        })
+    if high:
+        phases.append({
+            "phase": len(phases) + 1,
+            "title": "High Priority Certifications",
+            "duration": "3-8 months",
+            "items": [f"Complete {gap['requirement']}: {gap['gap_description']}" for gap in high]
+        })
+    phases.append({
+        "phase": len(phases) + 1,
+        "title": "Final Validation and Documentation",
+        "duration": "1-2 months",
+        "items": list(FINAL_PHASE_ITEMS)
+    })
+    return phases
+
+
+def load_gap_rules(path: Union[str, Path] = DEFAULT_RULES_PATH) -> GapRuleBook:
+    """Read and compile a gap rule table."""
+    with open(path, encoding="utf-8") as handle:
+        return GapRuleBook(json.load(handle))
+
+
+# Global rule book, compiled once at import
+gap_rules = load_gap_rules()
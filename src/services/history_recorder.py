@@ -0,0 +1,117 @@
+"""
+Background writer for the partitioned compliance history.
+
+Compliance checks hand their history rows to ``history_recorder.submit`` and
+return straight away. A background task collects rows for up to
+``flush_interval`` seconds (or ``max_batch_rows`` rows) and appends them on
+its own session, one transaction per database. A failed write is logged and
+its batch dropped, so a compliance check never waits on, or fails with, the
+history partition DDL.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.config import settings
+from src.logger import get_logger
+from src.repositories.compliance_history import ComplianceHistoryRepository
+
+
+logger = get_logger(__name__)
+
+
+class HistoryRecorder:
+    """Queues compliance history rows and writes them in batches."""
+
+    def __init__(self, flush_interval: float = 1.0, max_batch_rows: int = 1000, max_pending_rows: int = 50_000):
+        """
+        Args:
+            flush_interval: Longest a queued row waits before it is written
+            max_batch_rows: Most rows written in one transaction
+            max_pending_rows: Rows queued beyond this are dropped with a warning
+        """
+        self.flush_interval = flush_interval
+        self.max_batch_rows = max(1, max_batch_rows)
+        self.max_pending_rows = max_pending_rows
+        # Rows per engine, so each check is recorded in the database it read from
+        self._pending: Dict[AsyncEngine, List[Dict[str, Any]]] = defaultdict(list)
+        self._writer: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending(self) -> int:
+        """Rows queued and not yet written."""
+        return sum(len(rows) for rows in self._pending.values())
+
+    def submit(self, bind: AsyncEngine, rows: List[Dict[str, Any]]) -> bool:
+        """Queue rows for ``ComplianceHistoryRepository.record_checks`` on ``bind``.
+        
+        Returns:
+            False if the queue is full and the rows were dropped
+        """
+        if not rows:
+            return True
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Engines and tasks of a closed loop cannot be reused
+            self._pending.clear()
+            self._writer = None
+            self._wake = asyncio.Event()
+            self._loop = loop
+        if self.pending + len(rows) > self.max_pending_rows:
+            logger.warning(f"Compliance history queue is full; dropping {len(rows)} rows")
+            return False
+        self._pending[bind].extend(rows)
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._drain(), name="compliance-history-writer")
+        return True
+
+    async def flush(self) -> None:
+        """Write every queued row now, e.g. on shutdown."""
+        writer = self._writer
+        if writer is not None and not writer.done():
+            self._wake.set()
+            await writer
+        while self.pending:
+            await self._write_batches()
+
+    async def _drain(self) -> None:
+        while self.pending:
+            if self.pending < self.max_batch_rows:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._write_batches()
+        self._wake.clear()
+
+    async def _write_batches(self) -> int:
+        """Write up to ``max_batch_rows`` queued rows of each database."""
+        written = 0
+        for bind in list(self._pending):
+            queued = self._pending[bind]
+            batch, self._pending[bind] = queued[:self.max_batch_rows], queued[self.max_batch_rows:]
+            if not self._pending[bind]:
+                del self._pending[bind]
+            written += await self._write(bind, batch)
+        return written
+
+    async def _write(self, bind: AsyncEngine, rows: List[Dict[str, Any]]) -> int:
+        async with AsyncSession(bind, expire_on_commit=False) as session:
+            try:
+                written = await ComplianceHistoryRepository(session).record_checks(rows, commit=False)
+                await session.commit()
+                return written
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.warning(f"Could not record {len(rows)} compliance history rows: {e}")
+                return 0
+
+
+# Global recorder instance
+history_recorder = HistoryRecorder(flush_interval=settings.history_flush_interval_seconds)
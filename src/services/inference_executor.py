@@ -0,0 +1,169 @@
+"""
+Bounded executor for CPU-bound AI inference.
+
+Hugging Face pipelines and sentence encoders hold the GIL-free torch kernels
+for most of their run time, so a small thread pool keeps them off the event
+loop without copying models into worker processes. Admission is bounded:
+once every worker is busy and the queue is full, new tasks are rejected
+immediately with ``InferenceUnavailableError`` so callers can serve the
+rule-based fallback instead of piling up latency.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.config import settings
+from src.exceptions import InferenceUnavailableError
+from src.logger import get_logger
+from src.middleware.prometheus_metrics import record_inference, record_inference_rejected
+
+
+logger = get_logger(__name__)
+
+
+def _pin_torch_threads(threads: int) -> None:
+    """Worker initializer limiting torch intra-op parallelism."""
+    if threads <= 0:
+        return
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+class InferenceExecutor:
+    """Thread pool with a bounded admission queue and per-task timeouts."""
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        max_queue: int = 8,
+        timeout_seconds: float = 10.0,
+        torch_threads: int = 0,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self.torch_threads = torch_threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        """Tasks admitted at once: one running per worker plus the queue."""
+        return self.max_workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(
+        self,
+        task: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Run ``fn(*args)`` on a worker thread.
+
+        Args:
+            task: Name used for metrics and errors (e.g. ``compliance_classifier``)
+            fn: Blocking callable to run
+            timeout: Seconds to wait for the result; defaults to ``timeout_seconds``
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            InferenceUnavailableError: The executor is saturated or the task timed out
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                saturated = True
+            else:
+                saturated = False
+                self._in_flight += 1
+        if saturated:
+            record_inference_rejected(task, "saturated")
+            raise InferenceUnavailableError(
+                f"Inference executor saturated ({self.capacity} tasks in flight)",
+                task=task,
+                reason="saturated",
+            )
+
+        submitted = time.perf_counter()
+
+        def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                record_inference(task, started - submitted, time.perf_counter() - started)
+
+        try:
+            future = self._get_pool().submit(timed)
+        except Exception:
+            self._release()
+            raise
+        # The slot is held until the worker finishes, even when the caller gives up,
+        # so abandoned tasks still count against the queue bound
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout if timeout is not None else self.timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            future.cancel()
+            record_inference_rejected(task, "timeout")
+            raise InferenceUnavailableError(
+                f"Inference task '{task}' timed out",
+                task=task,
+                reason="timeout",
+            )
+
+    def status(self) -> Dict[str, Any]:
+        """Executor occupancy for health endpoints."""
+        return {
+            "workers": self.max_workers,
+            "queue_size": self.max_queue,
+            "in_flight": self._in_flight,
+            "timeout_seconds": self.timeout_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; queued tasks are cancelled."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ai-inference",
+                    initializer=_pin_torch_threads,
+                    initargs=(self.torch_threads,),
+                )
+            return self._pool
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+# Global executor instance
+inference_executor = InferenceExecutor(
+    max_workers=settings.ai_inference_workers,
+    max_queue=settings.ai_inference_queue_size,
+    timeout_seconds=settings.ai_inference_timeout_seconds,
+    torch_threads=settings.ai_inference_torch_threads,
+)
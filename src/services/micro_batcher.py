@@ -0,0 +1,98 @@
+"""
+Dynamic micro-batching in front of a model.
+
+Concurrent requests submit single items; the batcher collects them for at most
+``max_wait_ms`` or ``max_batch_size`` items, runs one batched forward pass on
+the inference executor and resolves each caller's future with its own result.
+A lone request waits at most ``max_wait_ms`` longer than it would unbatched.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Sequence, Set, Tuple
+
+from src.middleware.prometheus_metrics import record_batched_latency, record_inference_batch
+from src.services.inference_executor import InferenceExecutor, inference_executor
+
+
+class MicroBatcher:
+    """Collects single-item requests into batches for ``batch_fn``."""
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        executor: Optional[InferenceExecutor] = None,
+    ):
+        """
+        Args:
+            name: Model name used for metrics and executor task labels
+            batch_fn: Blocking callable mapping a list of items to a same-length list of results
+            max_batch_size: Most items per forward pass
+            max_wait_ms: Longest the first item of a batch waits for more to arrive
+            executor: Executor running ``batch_fn``; defaults to the global inference executor
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor or inference_executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result from the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_collector()
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    def _ensure_collector(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._collector is None or self._collector.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue()
+                self._loop = loop
+            self._collector = loop.create_task(self._collect(), name=f"micro-batcher-{self.name}")
+
+    async def _collect(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.perf_counter() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without awaiting so the next batch can form while this one runs
+            task = asyncio.create_task(self._run_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future, float]]) -> None:
+        items = [item for item, _, _ in batch]
+        record_inference_batch(self.name, len(items))
+        try:
+            results = await self.executor.run(self.name, self.batch_fn, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name} returned {len(results)} results for a batch of {len(items)}"
+                )
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        for (_, future, submitted), result in zip(batch, results):
+            record_batched_latency(self.name, finished - submitted)
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,169 @@
+"""
+Versioned local snapshots of the Hugging Face models used by the AI service.
+
+``snapshot_model`` downloads the safetensors weights, configs and tokenizer
+files of one hub revision into ``<artifacts dir>/<model>/<commit sha>/`` and
+writes a manifest with the SHA-256 of every file. ``CURRENT`` in the model
+directory names the revision to serve, so rolling back is a one-line edit.
+
+At startup ``resolve_model_path`` maps a hub id to its verified snapshot;
+loaders pass that path to ``pipeline``/``SentenceTransformer`` so nothing is
+fetched from the hub, and safetensors files are memory-mapped instead of
+unpickled. With ``AI_MODELS_OFFLINE`` the hub is never contacted and a
+missing snapshot is an error rather than a silent download.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.config import settings
+from src.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+CURRENT_FILENAME = "CURRENT"
+
+# Weights only as safetensors; pickled *.bin checkpoints are never downloaded
+SNAPSHOT_PATTERNS = ["*.json", "*.safetensors", "*.txt", "*.model", "1_Pooling/*", "*.py"]
+
+_UNSAFE_DIRNAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+if settings.ai_models_offline:
+    # Read by huggingface_hub/transformers at import time
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+
+class ModelArtifactError(RuntimeError):
+    """A snapshot is missing, incomplete or fails checksum verification."""
+
+
+def artifact_root(model_id: str, base_dir: Union[str, Path, None] = None) -> Path:
+    """Directory holding every snapshot of ``model_id``."""
+    return Path(base_dir or settings.ai_model_artifacts_dir) / _UNSAFE_DIRNAME.sub("__", model_id)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_manifest(path: Path, model_id: str, revision: str) -> Dict[str, Any]:
+    """Record checksums of every file in a snapshot directory."""
+    files = {
+        file.relative_to(path).as_posix(): file_sha256(file)
+        for file in sorted(path.rglob("*"))
+        if file.is_file() and file.name != MANIFEST_FILENAME and ".cache" not in file.parts
+    }
+    manifest = {
+        "model_id": model_id,
+        "revision": revision,
+        "created_at": datetime.utcnow().isoformat(),
+        "files": files,
+    }
+    (path / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def verify_artifact(path: Path) -> Dict[str, Any]:
+    """Check that every file listed in the manifest exists with the recorded SHA-256.
+
+    Raises:
+        ModelArtifactError: The manifest is missing or a file is missing or altered
+    """
+    manifest_path = path / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        raise ModelArtifactError(f"No manifest in {path}")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    for relative, expected in manifest["files"].items():
+        file = path / relative
+        if not file.is_file():
+            raise ModelArtifactError(f"{manifest['model_id']}: missing {relative}")
+        if file_sha256(file) != expected:
+            raise ModelArtifactError(f"{manifest['model_id']}: checksum mismatch for {relative}")
+    return manifest
+
+
+def snapshot_model(
+    model_id: str,
+    revision: str = "main",
+    base_dir: Union[str, Path, None] = None,
+    activate: bool = True,
+) -> Path:
+    """Download one hub revision into the artifacts directory and checksum it.
+
+    Args:
+        model_id: Hugging Face model id
+        revision: Branch, tag or commit to snapshot
+        base_dir: Artifacts root; defaults to ``settings.ai_model_artifacts_dir``
+        activate: Point ``CURRENT`` at the new snapshot
+
+    Returns:
+        Snapshot directory, named after the resolved commit sha
+    """
+    from huggingface_hub import HfApi, snapshot_download
+
+    commit = HfApi().model_info(model_id, revision=revision).sha
+    root = artifact_root(model_id, base_dir)
+    target = root / commit
+    snapshot_download(model_id, revision=commit, local_dir=str(target), allow_patterns=SNAPSHOT_PATTERNS)
+    if not any(target.rglob("*.safetensors")):
+        raise ModelArtifactError(f"{model_id}@{commit} has no safetensors weights")
+
+    write_manifest(target, model_id, commit)
+    if activate:
+        (root / CURRENT_FILENAME).write_text(commit, encoding="utf-8")
+    logger.info(f"Snapshot of {model_id}@{commit} written to {target}")
+    return target
+
+
+def resolve_model_path(model_id: str) -> str:
+    """Local snapshot path to load ``model_id`` from, or the hub id itself.
+
+    Without ``AI_MODEL_ARTIFACTS_DIR`` the hub id is returned unchanged.
+
+    Raises:
+        ModelArtifactError: Offline mode without a snapshot, or verification failed
+    """
+    if not settings.ai_model_artifacts_dir:
+        return model_id
+
+    root = artifact_root(model_id)
+    current = root / CURRENT_FILENAME
+    if not current.exists():
+        if settings.ai_models_offline:
+            raise ModelArtifactError(f"No local snapshot of {model_id} in {root} (offline mode)")
+        logger.warning(f"No local snapshot of {model_id}; loading from the Hugging Face hub")
+        return model_id
+
+    path = root / current.read_text(encoding="utf-8").strip()
+    if settings.ai_model_verify_checksums:
+        verify_artifact(path)
+    elif not path.is_dir():
+        raise ModelArtifactError(f"Snapshot {path} does not exist")
+    return str(path)
+
+
+def pretrained_kwargs(path: str) -> Dict[str, Any]:
+    """``from_pretrained`` options for a resolved path: mmap safetensors when local."""
+    if Path(path).is_dir():
+        return {"use_safetensors": True, "local_files_only": True}
+    return {}
+
+
+def artifact_revision(model_id: str) -> Optional[str]:
+    """Active snapshot revision of ``model_id``, if any (part of model version keys)."""
+    if not settings.ai_model_artifacts_dir:
+        return None
+    current = artifact_root(model_id) / CURRENT_FILENAME
+    return current.read_text(encoding="utf-8").strip() if current.exists() else None
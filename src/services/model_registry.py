@@ -0,0 +1,150 @@
+"""
+Registry of lazily loaded AI models.
+
+Models are loaded one after another in a daemon thread so importing torch and
+reading weights never blocks the event loop. Callers ask for a model with
+``get`` and receive ``None`` until it is ready, which lets the analyzer keep
+serving its rule-based fallback in the meantime.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from src.logger import get_logger, log_business_event
+from src.middleware.prometheus_metrics import record_model_load
+
+
+logger = get_logger(__name__)
+
+
+class ModelState(str, Enum):
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class ModelStatus:
+    """Load state of one registered model."""
+
+    name: str
+    model_id: str
+    state: ModelState = ModelState.PENDING
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model_id": self.model_id,
+            "state": self.state.value,
+            "load_seconds": round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            "error": self.error,
+        }
+
+
+class ModelRegistry:
+    """Loads registered models in the background and tracks per-model readiness."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._status: Dict[str, ModelStatus] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = threading.Event()
+
+    def register(self, name: str, model_id: str, loader: Callable[[], Any]) -> None:
+        """Register a loader; it runs on the background thread, never on the caller."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._status[name] = ModelStatus(name=name, model_id=model_id)
+
+    def start(self) -> bool:
+        """Start background loading if it has not started yet.
+
+        Returns:
+            True when this call started the loader thread
+        """
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self._thread = threading.Thread(target=self._load_all, name="model-registry-loader", daemon=True)
+        self._thread.start()
+        return True
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def finished(self) -> bool:
+        """Every loader has run, whether it succeeded or failed."""
+        return self._finished.is_set()
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return a loaded model, or None while it is pending, loading or failed."""
+        return self._models.get(name)
+
+    def is_ready(self, name: str) -> bool:
+        status = self._status.get(name)
+        return status is not None and status.state == ModelState.READY
+
+    @property
+    def all_ready(self) -> bool:
+        return bool(self._status) and all(s.state == ModelState.READY for s in self._status.values())
+
+    @property
+    def any_failed(self) -> bool:
+        return any(s.state == ModelState.FAILED for s in self._status.values())
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every loader has finished (successfully or not). For scripts and tests."""
+        return self._finished.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of registry state for health endpoints."""
+        with self._lock:
+            models = {name: status.to_dict() for name, status in self._status.items()}
+        if self.all_ready:
+            overall = "ready"
+        elif not self.started:
+            overall = "not_started"
+        elif self._finished.is_set():
+            overall = "degraded"
+        else:
+            overall = "loading"
+        return {"status": overall, "models": models}
+
+    def _load_all(self) -> None:
+        for name, loader in list(self._loaders.items()):
+            self._load_one(name, loader)
+        self._finished.set()
+        log_business_event("ai_models_load_finished", self.status())
+
+    def _load_one(self, name: str, loader: Callable[[], Any]) -> None:
+        status = self._status[name]
+        with self._lock:
+            status.state = ModelState.LOADING
+
+        started = time.perf_counter()
+        try:
+            model = loader()
+        except Exception as e:
+            with self._lock:
+                status.state = ModelState.FAILED
+                status.error = str(e)
+                status.load_seconds = time.perf_counter() - started
+            record_model_load(name, status.load_seconds, success=False)
+            logger.warning(f"AI model '{name}' failed to load: {e}")
+            return
+
+        with self._lock:
+            self._models[name] = model
+            status.state = ModelState.READY
+            status.load_seconds = time.perf_counter() - started
+        record_model_load(name, status.load_seconds, success=True)
+        logger.info(f"AI model '{name}' ready in {status.load_seconds:.2f}s")
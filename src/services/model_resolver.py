@@ -0,0 +1,187 @@
+"""
+In-memory resolver mapping user supplied aircraft designations to model rows.
+
+Designations from ``aircraft_models`` (variants and family codes), the static
+designations in ``src.models.designations`` and its alias table are stored in
+a character trie.
+Resolving a string walks the trie once, so lookups cost O(len(model)) and no
+longer fall back to scanning every aircraft row.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.events import AIRCRAFT_MODELS, subscribe
+from src.logger import get_logger, log_business_event
+from src.models.db_models_sqlite import AircraftModel
+from src.models.designations import ALIAS_GROUPS, STATIC_DESIGNATIONS, normalize_designation
+from src.services.applicability_service import designation_codes
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelResolution:
+    """Canonical designation and the aircraft model rows it covers."""
+
+    code: str
+    level: str  # variant, family
+    model_ids: FrozenSet[str] = frozenset()
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    resolution: Optional[ModelResolution] = None
+
+
+class ModelResolver:
+    """Character trie of aircraft designations, rebuilt lazily after invalidation."""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._root = _TrieNode()
+        self._loaded_at: Optional[float] = None
+        self._aircraft_count = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        return not self.ttl_seconds or time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    @property
+    def has_aircraft(self) -> bool:
+        """Whether the last build saw any ``aircraft_models`` rows."""
+        return self._aircraft_count > 0
+
+    def invalidate(self) -> None:
+        """Drop the trie so the next lookup rebuilds it from the database."""
+        self._loaded_at = None
+
+    async def resolve(self, session: AsyncSession, model: str) -> Optional[ModelResolution]:
+        """Resolve a user supplied designation, rebuilding the trie when stale.
+
+        Args:
+            session: Database session used when a rebuild is needed
+            model: Designation as typed by the user (case and separators are ignored)
+
+        Returns:
+            ModelResolution, or None when the designation is unknown
+        """
+        if not self.is_loaded:
+            await self.load(session)
+        return self.lookup(model)
+
+    def lookup(self, model: str) -> Optional[ModelResolution]:
+        """Walk the trie for an exact designation match."""
+        node = self._root
+        for char in normalize_designation(model):
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node.resolution
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """Known canonical designations starting with ``prefix``."""
+        node = self._root
+        for char in normalize_designation(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        found: Set[str] = set()
+        stack = [node]
+        while stack and len(found) < limit:
+            current = stack.pop()
+            if current.resolution:
+                found.add(current.resolution.code)
+            stack.extend(current.children.values())
+        return sorted(found)
+
+    async def load(self, session: AsyncSession) -> None:
+        """Rebuild the trie from ``aircraft_models`` and the static designations."""
+        async with self._loop_lock():
+            if self.is_loaded:
+                return
+            rows = (await session.execute(
+                select(AircraftModel.id, AircraftModel.model, AircraftModel.variant)
+            )).all()
+            self.build(rows)
+            log_business_event(
+                "model_resolver_loaded",
+                {"aircraft_models": self._aircraft_count},
+            )
+
+    def _loop_lock(self) -> asyncio.Lock:
+        """Rebuild lock, created on first use in the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def build(self, rows: Iterable) -> None:
+        """Build the trie from ``(id, model, variant)`` rows."""
+        ids_by_code: Dict[str, Set[str]] = {}
+        levels: Dict[str, str] = {}
+        count = 0
+
+        for aircraft_model_id, model, variant in rows:
+            count += 1
+            variant_code, family_code = designation_codes(model, variant)
+            ids_by_code.setdefault(variant_code, set()).add(aircraft_model_id)
+            levels.setdefault(variant_code, "variant")
+            if family_code:
+                ids_by_code.setdefault(family_code, set()).add(aircraft_model_id)
+                levels[family_code] = "family"
+
+        for designation in STATIC_DESIGNATIONS:
+            variant_code, family_code = designation_codes(designation)
+            ids_by_code.setdefault(variant_code, set())
+            levels.setdefault(variant_code, "variant")
+            if family_code:
+                ids_by_code.setdefault(family_code, set())
+                levels[family_code] = "family"
+
+        resolutions = {
+            code: ModelResolution(code=code, level=levels[code], model_ids=frozenset(ids))
+            for code, ids in ids_by_code.items()
+        }
+
+        # Aliases point at the first group member backed by aircraft rows
+        for group in ALIAS_GROUPS:
+            target = next((resolutions[code] for code in group if code in resolutions and resolutions[code].model_ids), None)
+            target = target or resolutions.get(group[0]) or ModelResolution(code=group[0], level="variant")
+            for alias in group:
+                if alias not in resolutions or not resolutions[alias].model_ids:
+                    resolutions[alias] = target
+
+        root = _TrieNode()
+        for code, resolution in resolutions.items():
+            self._insert(root, code, resolution)
+
+        self._root = root
+        self._aircraft_count = count
+        self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _insert(root: _TrieNode, code: str, resolution: ModelResolution) -> None:
+        node = root
+        for char in normalize_designation(code):
+            node = node.children.setdefault(char, _TrieNode())
+        node.resolution = resolution
+
+
+# Global resolver instance
+model_resolver = ModelResolver(ttl_seconds=settings.model_resolver_ttl_seconds)
+subscribe(AIRCRAFT_MODELS, model_resolver.invalidate)
@@ -0,0 +1,285 @@
+"""
+Model server sidecar hosting the AI models once per host.
+
+Without it every uvicorn worker loads its own copy of the Hugging Face
+models, so memory grows with the worker count. The sidecar loads them once
+through a ``ModelRegistry`` and serves inference over a Unix socket; API
+workers started with ``AI_MODEL_SERVER_SOCKET`` register lightweight proxies
+instead of the models themselves and never import torch.
+
+Frames are ``!II`` (header length, payload length) followed by a JSON header
+and a raw payload. Array results (embeddings) travel as raw float32 bytes and
+are exposed to the worker with ``np.frombuffer``, a view over the received
+buffer with no further copy or JSON encoding.
+
+Usage:
+    python -m src.services.model_server [--socket /tmp/aviation-models.sock]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.config import settings
+from src.exceptions import InferenceUnavailableError
+from src.logger import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+logger = get_logger(__name__)
+
+_FRAME_HEADER = struct.Struct("!II")
+
+# Connect or send failures that mean the sidecar never read the frame, so a retry cannot run it twice
+_UNSENT_ERRORS = (ConnectionRefusedError, FileNotFoundError, BrokenPipeError, ConnectionResetError)
+
+
+def encode_frame(header: Dict[str, Any], payload: bytes = b"") -> bytes:
+    """Serialize one frame."""
+    header_bytes = json.dumps(header, default=float).encode("utf-8")
+    return _FRAME_HEADER.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def encode_result(result: Any) -> bytes:
+    """Frame a model result, sending arrays as raw bytes."""
+    import numpy as np  # Deferred so API workers importing the client never load numpy
+
+    if isinstance(result, np.ndarray):
+        array = np.ascontiguousarray(result, dtype=np.float32)
+        return encode_frame({"ok": True, "dtype": "float32", "shape": list(array.shape)}, array.tobytes())
+    return encode_frame({"ok": True, "result": result})
+
+
+def decode_result(header: Dict[str, Any], payload: bytes) -> Any:
+    """Inverse of ``encode_result``; raises for error frames."""
+    if not header.get("ok"):
+        raise InferenceUnavailableError(
+            header.get("error", "Model server error"), task=header.get("model"), reason="model_server"
+        )
+    if "dtype" in header:
+        import numpy as np
+        return np.frombuffer(payload, dtype=header["dtype"]).reshape(header["shape"])
+    return header.get("result")
+
+
+class ModelServer:
+    """Asyncio Unix socket server running requests against a ModelRegistry."""
+
+    def __init__(self, socket_path: str, registry=None, executor=None):
+        from src.services.inference_executor import inference_executor
+
+        self.socket_path = socket_path
+        self.registry = registry
+        self.executor = executor or inference_executor
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    @staticmethod
+    def default_registry():
+        """Registry with the analyzer's local loaders."""
+        from src.services.aviation_ai_service import LOCAL_MODEL_LOADERS
+        from src.services.model_registry import ModelRegistry
+
+        registry = ModelRegistry()
+        for name, (model_id, loader) in LOCAL_MODEL_LOADERS.items():
+            registry.register(name, model_id, loader)
+        return registry
+
+    async def start(self) -> None:
+        if self.registry is None:
+            self.registry = self.default_registry()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.registry.start()
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        logger.info(f"Model server listening on {self.socket_path}")
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Workers keep their connections open; close them so wait_closed returns
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    header_length, payload_length = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+                except asyncio.IncompleteReadError:
+                    break
+                request = json.loads(await reader.readexactly(header_length))
+                if payload_length:
+                    await reader.readexactly(payload_length)
+                writer.write(await self._dispatch(request))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> bytes:
+        name = request.get("model")
+        if request.get("op") == "status":
+            return encode_result(self.registry.status())
+
+        model = self.registry.get(name)
+        if model is None:
+            return encode_frame({"ok": False, "model": name, "error": f"Model '{name}' is not ready"})
+
+        method = model.encode if request.get("method") == "encode" else model
+        try:
+            result = await self.executor.run(name, lambda: method(request["inputs"], **request.get("kwargs", {})))
+        except Exception as e:
+            return encode_frame({"ok": False, "model": name, "error": str(e)})
+        if request.get("method") == "encode":
+            import numpy as np
+            result = np.asarray(result)
+        return encode_result(result)
+
+
+class ModelServerClient:
+    """Blocking client; one connection per thread, reconnected on failure.
+
+    Calls are blocking because they run on inference executor threads,
+    exactly where local models would run.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def call(self, model: str, inputs: Sequence[Any], method: str = "__call__", **kwargs: Any) -> Any:
+        request = {"op": "infer", "model": model, "method": method, "inputs": list(inputs), "kwargs": kwargs}
+        return decode_result(*self._request(request))
+
+    def status(self) -> Dict[str, Any]:
+        return decode_result(*self._request({"op": "status"}))
+
+    def wait_until_ready(self, model: str, timeout: float, poll_seconds: float = 1.0) -> None:
+        """Block until the sidecar reports ``model`` ready (or failed / timed out)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                state = self.status()["models"].get(model, {}).get("state")
+            except OSError:
+                state = None
+            if state == "ready":
+                return
+            if state == "failed":
+                raise RuntimeError(f"Model server failed to load '{model}'")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Model server did not load '{model}' within {timeout}s")
+            time.sleep(poll_seconds)
+
+    def _request(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], bytearray]:
+        frame = encode_frame(request)
+        try:
+            try:
+                sock = self._send(frame)
+            except _UNSENT_ERRORS:
+                # The sidecar may have restarted; retry once on a fresh connection
+                self._disconnect()
+                sock = self._send(frame)
+            return self._receive(sock)
+        except OSError:
+            # Timeouts and failures after the frame went out are not retried: the model may have run it
+            self._disconnect()
+            raise
+
+    def _send(self, frame: bytes) -> socket.socket:
+        sock = self._connection()
+        sock.sendall(frame)
+        return sock
+
+    def _receive(self, sock: socket.socket) -> Tuple[Dict[str, Any], bytearray]:
+        header_length, payload_length = _FRAME_HEADER.unpack(self._read(sock, _FRAME_HEADER.size))
+        header = json.loads(self._read(sock, header_length))
+        return header, self._read(sock, payload_length)
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+        return sock
+
+    def _disconnect(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        self._local.sock = None
+        if sock is not None:
+            sock.close()
+
+    @staticmethod
+    def _read(sock: socket.socket, length: int) -> bytearray:
+        """Receive exactly ``length`` bytes into one buffer (arrays are viewed, not copied)."""
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        received = 0
+        while received < length:
+            chunk = sock.recv_into(view[received:], length - received)
+            if not chunk:
+                raise ConnectionError("Model server closed the connection")
+            received += chunk
+        return buffer
+
+
+class RemoteModel:
+    """Proxy with the call shape of a pipeline or SentenceTransformer."""
+
+    def __init__(self, client: ModelServerClient, name: str):
+        self.client = client
+        self.name = name
+
+    def __call__(self, inputs: Any, **kwargs: Any) -> List[Any]:
+        return self.client.call(self.name, [inputs] if isinstance(inputs, str) else inputs, **kwargs)
+
+    def encode(self, inputs: Any) -> "np.ndarray":
+        return self.client.call(self.name, [inputs] if isinstance(inputs, str) else inputs, method="encode")
+
+
+def remote_loader(name: str, socket_path: str):
+    """Registry loader returning a proxy once the sidecar has ``name`` ready."""
+    def load() -> RemoteModel:
+        client = ModelServerClient(socket_path, timeout=settings.ai_inference_timeout_seconds)
+        client.wait_until_ready(name, timeout=settings.ai_model_server_ready_timeout_seconds)
+        return RemoteModel(client, name)
+    return load
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host AI models for API workers")
+    parser.add_argument("--socket", default=settings.ai_model_server_socket or "/tmp/aviation-models.sock")
+    args = parser.parse_args()
+
+    setup_logging()
+    server = ModelServer(args.socket)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+ONNX Runtime backend for the compliance classifier and sentence encoder.
+
+``export_model`` converts a Hugging Face checkpoint to ONNX once (this step
+needs torch) and writes an int8 dynamically quantized copy next to it. At
+runtime only ``onnxruntime`` and the tokenizer are used, so workers serving
+the classifier and encoder no longer pay torch's start-up time or resident
+memory. The wrappers mimic the call signatures the analyzer already uses:
+``OnnxTextClassifier`` behaves like a ``text-classification`` pipeline with
+``return_all_scores=True`` and ``OnnxSentenceEncoder.encode`` like
+``SentenceTransformer.encode``.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+
+from src.config import settings
+from src.logger import get_logger
+from src.services.model_artifacts import pretrained_kwargs, resolve_model_path
+
+
+logger = get_logger(__name__)
+
+FP32_FILENAME = "model.onnx"
+INT8_FILENAME = "model.int8.onnx"
+
+_UNSAFE_DIRNAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def model_dir(model_id: str, base_dir: Union[str, Path, None] = None) -> Path:
+    """Directory holding the exported files of ``model_id``."""
+    return Path(base_dir or settings.ai_onnx_model_dir) / _UNSAFE_DIRNAME.sub("__", model_id)
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Row-wise softmax, stable for large logits."""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def mean_pool(hidden_states: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Average token embeddings, ignoring padding (sentence-transformers pooling)."""
+    mask = attention_mask[..., np.newaxis].astype(hidden_states.dtype)
+    return (hidden_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+
+def export_model(
+    model_id: str,
+    kind: str,
+    base_dir: Union[str, Path, None] = None,
+    quantize: bool = True,
+    opset: int = 17,
+) -> Path:
+    """Export a checkpoint to ONNX and optionally quantize it to int8.
+
+    Args:
+        model_id: Hugging Face model id
+        kind: ``classifier`` (sequence classification head) or ``encoder`` (bare transformer)
+        base_dir: Export root; defaults to ``settings.ai_onnx_model_dir``
+        quantize: Also write ``model.int8.onnx`` with dynamic int8 weights
+        opset: ONNX opset version
+
+    Returns:
+        Directory with the tokenizer, config and ONNX files
+    """
+    import torch
+    from transformers import AutoModel, AutoModelForSequenceClassification, AutoTokenizer
+
+    if kind not in ("classifier", "encoder"):
+        raise ValueError(f"Unknown model kind: {kind}")
+
+    target = model_dir(model_id, base_dir)
+    target.mkdir(parents=True, exist_ok=True)
+
+    source = resolve_model_path(model_id)
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    model_class = AutoModelForSequenceClassification if kind == "classifier" else AutoModel
+    model = model_class.from_pretrained(source, **pretrained_kwargs(source))
+    model.config.return_dict = False
+    model.eval()
+    tokenizer.save_pretrained(target)
+    model.config.save_pretrained(target)
+
+    output_name = "logits" if kind == "classifier" else "last_hidden_state"
+    sample = tokenizer(["aircraft certification"], return_tensors="pt")
+    dynamic_axes = {
+        "input_ids": {0: "batch", 1: "sequence"},
+        "attention_mask": {0: "batch", 1: "sequence"},
+        output_name: {0: "batch"},
+    }
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            str(target / FP32_FILENAME),
+            input_names=["input_ids", "attention_mask"],
+            output_names=[output_name],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(str(target / FP32_FILENAME), str(target / INT8_FILENAME), weight_type=QuantType.QInt8)
+
+    logger.info(f"Exported {model_id} to {target}")
+    return target
+
+
+class _OnnxModel:
+    """Tokenizer plus an onnxruntime CPU session."""
+
+    def __init__(self, directory: Union[str, Path], quantized: bool = True, threads: int = 0, max_length: int = 256):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        directory = Path(directory)
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        self.directory = directory
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(str(directory))
+        self.session = ort.InferenceSession(
+            str(directory / (INT8_FILENAME if quantized else FP32_FILENAME)),
+            options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    @classmethod
+    def from_model_id(cls, model_id: str, **kwargs: Any):
+        """Load the export of ``model_id`` from ``settings.ai_onnx_model_dir``."""
+        kwargs.setdefault("quantized", settings.ai_onnx_quantized)
+        kwargs.setdefault("threads", settings.ai_inference_torch_threads)
+        return cls(model_dir(model_id), **kwargs)
+
+    def _run(self, texts: Sequence[str]):
+        encoded = self.tokenizer(
+            list(texts), padding=True, truncation=True, max_length=self.max_length, return_tensors="np"
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self._input_names}
+        return self.session.run(None, feeds)[0], encoded["attention_mask"]
+
+
+class OnnxTextClassifier(_OnnxModel):
+    """Drop-in for a ``text-classification`` pipeline with ``return_all_scores=True``."""
+
+    def __init__(self, directory: Union[str, Path], **kwargs: Any):
+        super().__init__(directory, **kwargs)
+        config = json.loads((Path(directory) / "config.json").read_text(encoding="utf-8"))
+        self.labels = {int(index): label for index, label in config.get("id2label", {}).items()}
+
+    def __call__(self, texts: Union[str, Sequence[str]]) -> List[List[Dict[str, Any]]]:
+        if isinstance(texts, str):
+            texts = [texts]
+        logits, _ = self._run(texts)
+        return [
+            [{"label": self.labels.get(index, f"LABEL_{index}"), "score": float(score)} for index, score in enumerate(row)]
+            for row in softmax(logits)
+        ]
+
+
+class OnnxSentenceEncoder(_OnnxModel):
+    """Drop-in for ``SentenceTransformer.encode`` with mean pooling and L2 normalization."""
+
+    def encode(self, texts: Union[str, Sequence[str]], normalize: bool = True) -> np.ndarray:
+        if isinstance(texts, str):
+            texts = [texts]
+        hidden_states, attention_mask = self._run(texts)
+        embeddings = mean_pool(hidden_states, attention_mask)
+        if normalize:
+            embeddings = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
@@ -0,0 +1,91 @@
+"""
+Full-text index over regulations.
+
+On SQLite an FTS5 table ``regulations_fts`` mirrors each regulation's
+reference, title, description and content JSON, and triggers on
+``regulations`` keep it in sync on insert, update (including importer
+upserts) and delete. FTS rows carry the regulation id (an UNINDEXED column
+searches join on) and get their rowid from ``regulations_fts_keys``, so
+they never depend on the implicit rowid of ``regulations``, which VACUUM
+may renumber because its primary key is a string. On PostgreSQL the migration adds a
+generated, weighted ``search_vector`` tsvector column with a GIN index
+instead. Either way a search is an index lookup ranked by BM25 /
+``ts_rank_cd`` rather than a ``%term%`` scan of the whole table.
+
+The table layout, triggers and MATCH syntax are defined in
+``src.models.regulation_fts``; this module creates and backfills them.
+"""
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.logger import get_logger, log_business_event
+from src.models.db_models_sqlite import Regulation
+from src.models.regulation_fts import FTS_COLUMNS, FTS_KEYS_TABLE, FTS_TABLE, FTS_TRIGGERS, SQLITE_FTS_DDL
+
+
+logger = get_logger(__name__)
+
+
+async def ensure_fts_index(session: AsyncSession) -> bool:
+    """Create the SQLite FTS5 table and triggers, backfilling rows written before them.
+
+    A no-op on other dialects, where the schema migration owns the index.
+
+    Returns:
+        True when the index was (re)built from the regulations table
+    """
+    if session.bind.dialect.name != "sqlite":
+        return False
+
+    # Tables from before the id column were keyed by the regulations rowid; replace them
+    existing = await session.scalar(text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE})
+    if existing is not None and "regulation_id" not in existing:
+        for trigger in FTS_TRIGGERS:
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        await session.execute(text(f"DROP TABLE {FTS_TABLE}"))
+
+    for statement in SQLITE_FTS_DDL:
+        await session.execute(text(statement))
+
+    if await _index_matches_table(session):
+        await session.commit()
+        return False
+
+    await rebuild_fts_index(session)
+    return True
+
+
+async def _index_matches_table(session: AsyncSession) -> bool:
+    """Whether the index holds exactly one row per regulation id (not just as many rows)."""
+    indexed = await session.scalar(text(f"SELECT count(*) FROM {FTS_TABLE}"))
+    keys = await session.scalar(text(f"SELECT count(*) FROM {FTS_KEYS_TABLE}"))
+    total = await session.scalar(select(func.count(Regulation.id)))
+    if not indexed == keys == total:
+        return False
+    missing = await session.scalar(text(
+        f"SELECT count(*) FROM regulations r "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {FTS_KEYS_TABLE} k WHERE k.regulation_id = r.id)"
+    ))
+    return not missing
+
+
+async def rebuild_fts_index(session: AsyncSession) -> int:
+    """Repopulate the SQLite FTS5 table from ``regulations``.
+
+    Returns:
+        Number of regulations indexed
+    """
+    await session.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    await session.execute(text(f"DELETE FROM {FTS_KEYS_TABLE}"))
+    await session.execute(text(f"INSERT INTO {FTS_KEYS_TABLE}(regulation_id) SELECT id FROM regulations"))
+    await session.execute(text(
+        f"INSERT INTO {FTS_TABLE}(rowid, {FTS_COLUMNS}) "
+        f"SELECT k.fts_rowid, r.id, r.reference, r.title, r.description, coalesce(r.content, '') "
+        f"FROM regulations r JOIN {FTS_KEYS_TABLE} k ON k.regulation_id = r.id"
+    ))
+    await session.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')"))
+    indexed = await session.scalar(text(f"SELECT count(*) FROM {FTS_TABLE}"))
+    await session.commit()
+    log_business_event("regulation_fts_rebuilt", {"rows": indexed})
+    return indexed
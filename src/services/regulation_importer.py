@@ -0,0 +1,395 @@
+"""
+Streaming importer for large regulation catalog dumps.
+
+Parses JSON Lines, CSV or plain JSON array files record by record, validates
+each record against the ``Regulation`` pydantic model, de-duplicates on
+``reference`` (the catalog key, unique in ``regulations``) and writes through
+batched bulk upserts. Malformed JSON Lines are skipped and counted.
+"""
+
+import csv
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional
+from uuid import uuid4
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database import AsyncSessionLocal
+from src.events import REGULATIONS, publish
+from src.logger import get_logger, log_business_event
+from src.models.compliance import Regulation as RegulationRecord
+from src.models.db_models_sqlite import Authority, Regulation
+from src.services.applicability_service import materialize_applicability
+
+
+logger = get_logger(__name__)
+
+SUPPORTED_FORMATS = ("jsonl", "csv", "json")
+
+# asyncpg caps a statement at 32767 bind parameters (SQLite 3.32+ at 32766);
+# a multi-row upsert binds one per column per row
+BIND_PARAMETER_LIMIT = 32766
+MAX_BATCH_SIZE = BIND_PARAMETER_LIMIT // len(Regulation.__table__.columns)
+
+_APPLICABILITY_SEPARATORS = re.compile(r"[,;|]")
+
+
+@dataclass
+class ImportStats:
+    """Counters collected while importing a regulation dump."""
+
+    read: int = 0
+    valid: int = 0
+    invalid: int = 0
+    malformed: int = 0
+    duplicates: int = 0
+    unknown_authority: int = 0
+    written: int = 0
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "read": self.read,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "malformed": self.malformed,
+            "duplicates": self.duplicates,
+            "unknown_authority": self.unknown_authority,
+            "written": self.written,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "records_per_second": round(self.records_per_second, 1),
+        }
+
+
+def detect_format(path: Path) -> str:
+    """Guess the dump format from the file extension."""
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    if suffix == ".json":
+        return "json"
+    raise ValueError(f"Cannot detect regulation dump format for '{path.name}'")
+
+
+@dataclass(frozen=True)
+class MalformedRecord:
+    """Yielded in place of a line that is not valid JSON."""
+
+    line: int
+    error: str
+
+
+def iter_json_lines(stream: IO[str]) -> Iterator[Any]:
+    """Yield one record per non-empty line of a JSON Lines stream.
+
+    A line that does not parse yields a ``MalformedRecord`` instead, so one
+    bad line does not abort the rest of the dump.
+    """
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield MalformedRecord(number, str(e))
+
+
+def iter_csv_records(stream: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Yield records from a CSV stream with a header row.
+
+    The ``applicability`` column may hold several models separated by
+    commas, semicolons or pipes.
+    """
+    for row in csv.DictReader(stream):
+        record = {key: value for key, value in row.items() if key and value not in (None, "")}
+        applicability = record.get("applicability", "")
+        record["applicability"] = [
+            model.strip() for model in _APPLICABILITY_SEPARATORS.split(applicability) if model.strip()
+        ]
+        yield record
+
+
+def iter_json_array(stream: IO[str], chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse a top-level JSON array without loading it whole.
+
+    Only the current chunk plus one partially read element are kept in
+    memory, so memory use is bounded by the largest single record.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    eof = False
+
+    while True:
+        if not eof and len(buffer) < chunk_size:
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buffer += chunk
+            else:
+                eof = True
+
+        buffer = buffer.lstrip()
+        if not started:
+            if not buffer:
+                if eof:
+                    return
+                continue
+            if buffer[0] != "[":
+                raise ValueError("Expected a JSON array at the top level")
+            buffer = buffer[1:]
+            started = True
+            continue
+
+        if buffer.startswith(","):
+            buffer = buffer[1:]
+            continue
+        if buffer.startswith("]"):
+            return
+        if not buffer:
+            if eof:
+                raise ValueError("Unexpected end of JSON array")
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # Element spans the chunk boundary, read more before retrying
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buffer += chunk
+            else:
+                eof = True
+            continue
+
+        buffer = buffer[end:]
+        yield record
+
+
+_READERS: Dict[str, Callable[[IO[str]], Iterator[Dict[str, Any]]]] = {
+    "jsonl": iter_json_lines,
+    "csv": iter_csv_records,
+    "json": iter_json_array,
+}
+
+
+def _dedupe_key(reference: str) -> bytes:
+    """Compact fixed-size key so the seen-set stays small for huge dumps."""
+    return hashlib.blake2b(reference.encode("utf-8"), digest_size=12).digest()
+
+
+class _RecentKeys:
+    """Membership over roughly the last ``capacity`` keys added, in bounded memory.
+
+    Keys live in a current and a previous generation; when the current one
+    fills up it replaces the previous one, forgetting the oldest keys.
+    """
+
+    def __init__(self, capacity: int):
+        self.generation_size = max(capacity // 2, 1)
+        self._current = set()
+        self._previous = set()
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._current or key in self._previous
+
+    def add(self, key: bytes) -> None:
+        if len(self._current) >= self.generation_size:
+            self._previous, self._current = self._current, set()
+        self._current.add(key)
+
+
+class RegulationImporter:
+    """Import regulation dumps into the ``regulations`` table in batches.
+
+    Args:
+        session_factory: Factory for the import session
+        batch_size: Rows per bulk upsert, capped at ``MAX_BATCH_SIZE``
+        progress_every: Report progress every N records
+        progress_callback: Called with the running ``ImportStats``
+        dedupe_window: Distinct references remembered for de-duplication. A
+            repeated reference within the window is skipped (the first one
+            wins); one repeated further apart is upserted like a re-import.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: int = 1000,
+        progress_every: int = 10000,
+        progress_callback: Optional[Callable[[ImportStats], None]] = None,
+        dedupe_window: int = 1_000_000,
+    ):
+        if batch_size > MAX_BATCH_SIZE:
+            logger.warning(f"Batch size {batch_size} exceeds the bind parameter limit; using {MAX_BATCH_SIZE}")
+        self.session_factory = session_factory
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.progress_every = progress_every
+        self.progress_callback = progress_callback
+        self.dedupe_window = dedupe_window
+
+    async def import_file(self, path: str, file_format: Optional[str] = None) -> ImportStats:
+        """Import a regulation dump from disk.
+
+        Args:
+            path: Path to the dump file
+            file_format: One of ``jsonl``, ``csv`` or ``json``; detected from
+                the extension when omitted
+
+        Returns:
+            ImportStats with counters and throughput
+        """
+        dump_path = Path(path)
+        file_format = file_format or detect_format(dump_path)
+        with dump_path.open("r", encoding="utf-8", newline="") as stream:
+            return await self.import_stream(stream, file_format)
+
+    async def import_stream(self, stream: IO[str], file_format: str) -> ImportStats:
+        """Import regulation records from an already opened text stream."""
+        if file_format not in SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported format '{file_format}'. Supported: {', '.join(SUPPORTED_FORMATS)}"
+            )
+
+        stats = ImportStats()
+        seen = _RecentKeys(self.dedupe_window)
+        batch: List[Dict[str, Any]] = []
+
+        async with self.session_factory() as session:
+            authority_ids = await self._load_authority_ids(session)
+
+            for raw in _READERS[file_format](stream):
+                stats.read += 1
+                if isinstance(raw, MalformedRecord):
+                    stats.malformed += 1
+                    logger.warning(f"Skipping malformed line {raw.line}: {raw.error}")
+                    row = None
+                else:
+                    row = self._to_row(raw, authority_ids, stats)
+                if row is not None:
+                    key = _dedupe_key(row["reference"])
+                    if key in seen:
+                        stats.duplicates += 1
+                    else:
+                        seen.add(key)
+                        batch.append(row)
+
+                if len(batch) >= self.batch_size:
+                    await self._flush(session, batch, stats)
+                    batch = []
+
+                if self.progress_every and stats.read % self.progress_every == 0:
+                    self._report_progress(stats)
+
+            if batch:
+                await self._flush(session, batch, stats)
+
+            if stats.written:
+                await materialize_applicability(session)
+                publish(REGULATIONS)
+
+        stats.finished_at = time.perf_counter()
+        self._report_progress(stats)
+        log_business_event("regulation_import_completed", stats.to_dict())
+        return stats
+
+    async def _load_authority_ids(self, session: AsyncSession) -> Dict[str, str]:
+        result = await session.execute(select(Authority.code, Authority.id))
+        return {code.upper(): authority_id for code, authority_id in result}
+
+    def _to_row(
+        self,
+        raw: Dict[str, Any],
+        authority_ids: Dict[str, str],
+        stats: ImportStats,
+    ) -> Optional[Dict[str, Any]]:
+        """Validate a raw record and map it onto ``regulations`` columns."""
+        try:
+            record = RegulationRecord.model_validate(raw)
+        except PydanticValidationError:
+            stats.invalid += 1
+            return None
+
+        authority = record.authority.strip().upper()
+        authority_id = authority_ids.get(authority)
+        if authority_id is None:
+            stats.unknown_authority += 1
+            return None
+
+        stats.valid += 1
+        reference = (record.reference or record.description).strip()
+        content = raw.get("content") if isinstance(raw.get("content"), dict) else {}
+        return {
+            "id": str(uuid4()),
+            "authority_id": authority_id,
+            "reference": reference,
+            "title": record.title or record.description,
+            "description": record.description,
+            "category": record.category,
+            "subcategory": record.subcategory,
+            "status": raw.get("status") or "active",
+            "content": {**content, "applicable_models": record.applicability},
+        }
+
+    async def _flush(self, session: AsyncSession, rows: List[Dict[str, Any]], stats: ImportStats) -> None:
+        """Write one batch with a single dialect-specific upsert statement."""
+        dialect = session.bind.dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(Regulation).values(rows)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(Regulation).values(rows)
+        else:
+            raise ValueError(f"Bulk upsert not supported for dialect '{dialect}'")
+
+        update_columns = {
+            column: stmt.excluded[column]
+            for column in ("authority_id", "title", "description", "category", "subcategory", "status", "content")
+        }
+        # Bulk upserts bypass the ORM onupdate hook; the search index watches updated_at
+        update_columns["updated_at"] = datetime.utcnow()
+        stmt = stmt.on_conflict_do_update(index_elements=[Regulation.reference], set_=update_columns)
+
+        await session.execute(stmt)
+        await session.commit()
+        stats.written += len(rows)
+        stats.batches += 1
+
+    def _report_progress(self, stats: ImportStats) -> None:
+        logger.info(
+            "Regulation import progress",
+            extra={"event": "regulation_import_progress", "details": stats.to_dict()},
+        )
+        if self.progress_callback:
+            self.progress_callback(stats)
+
+
+async def import_regulations(path: str, file_format: Optional[str] = None, batch_size: int = 1000) -> ImportStats:
+    """Convenience wrapper importing a dump with the default session factory."""
+    importer = RegulationImporter(batch_size=batch_size)
+    return await importer.import_file(path, file_format)
@@ -0,0 +1,259 @@
+"""
+Semantic search over the regulations table.
+
+Each active regulation's title and description is embedded once and stored
+as a row of an L2-normalized float32 matrix in ``regulation_index_dir``
+(``vectors.npy`` plus ``meta.json`` with ids and content fingerprints). The
+matrix is memory-mapped on load, and a query is one encode plus one exact
+matrix-vector product with ``argpartition`` for top-k.
+
+Embeddings come from the analyzer's sentence encoder once it is loaded and
+from a deterministic feature-hashing encoder before that (or when the AI
+dependencies are absent); switching encoders rebuilds the index. Updates are
+incremental: ``sync`` re-encodes only regulations whose fingerprint changed
+and drops deleted ones. Repositories and the importer call ``mark_stale``,
+and a ``(count, max(updated_at))`` signature catches writes made by other
+processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.events import REGULATIONS, subscribe
+from src.logger import get_logger, log_business_event
+from src.models.db_models_sqlite import Regulation
+from src.services.inference_executor import inference_executor
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+logger = get_logger(__name__)
+
+HASHING_ENCODER_ID = "feature-hashing-v1"
+ENCODE_BATCH_SIZE = 64
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEncoder:
+    """Dependency-free encoder: signed feature hashing of word unigrams and bigrams."""
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def _features(self, text: str) -> Counter:
+        tokens = _TOKEN.findall(text.lower())
+        return Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        import numpy as np
+        from src.services.embedding_index import normalize_rows
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dim
+                sign = 1.0 if digest[4] & 1 else -1.0
+                matrix[row, bucket] += sign * (1.0 + math.log(count))
+        return normalize_rows(matrix)
+
+
+def regulation_text(title: Optional[str], description: Optional[str]) -> str:
+    """Text embedded for a regulation."""
+    return f"{title or ''}. {description or ''}".strip(". ")
+
+
+def fingerprint(title: Optional[str], description: Optional[str]) -> str:
+    return hashlib.blake2b(f"{title}\0{description}".encode("utf-8"), digest_size=12).hexdigest()
+
+
+class RegulationSearchIndex:
+    """Memory-mapped embedding matrix of active regulations, updated incrementally."""
+
+    def __init__(self, index_dir: Optional[str] = None):
+        self.index_dir = Path(index_dir or settings.regulation_index_dir)
+        self._hashing_encoder = HashingEncoder()
+        self._encoder_id: Optional[str] = None
+        self._ids: List[str] = []
+        self._fingerprints: Dict[str, str] = {}
+        self._vectors: Optional[np.ndarray] = None  # numpy is imported on first use, not at startup
+        self._signature: Optional[Tuple[int, Optional[str]]] = None
+        self._stale = True
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def encoder_id(self) -> Optional[str]:
+        return self._encoder_id
+
+    def mark_stale(self) -> None:
+        """Force a sync before the next search (regulations were written)."""
+        self._stale = True
+
+    def current_encoder(self) -> Tuple[str, Any]:
+        """The loaded sentence encoder, or the hashing encoder until it is ready."""
+        from src.services.aviation_ai_service import LOCAL_MODEL_LOADERS, aviation_ai_analyzer
+
+        model = aviation_ai_analyzer.registry.get('similarity_model')
+        if model is not None:
+            return LOCAL_MODEL_LOADERS['similarity_model'][0], model
+        return HASHING_ENCODER_ID, self._hashing_encoder
+
+    async def ensure_fresh(self, session: AsyncSession) -> Tuple[Any, List[str], Optional[np.ndarray]]:
+        """Load the persisted index and sync it if regulations or the encoder changed.
+
+        Returns:
+            ``(encoder, ids, vectors)`` captured together under the lock, so a query
+            is encoded by the same encoder as the vectors it is scored against
+        """
+        async with self._lock:
+            if not self._loaded:
+                self.load()
+            signature = await self._table_signature(session)
+            encoder_id, encoder = self.current_encoder()
+            if self._stale or signature != self._signature or encoder_id != self._encoder_id:
+                await self._sync(session, signature, (encoder_id, encoder))
+            return encoder, self._ids, self._vectors
+
+    async def sync(self, session: AsyncSession) -> Dict[str, int]:
+        """Bring the index in line with the regulations table."""
+        async with self._lock:
+            if not self._loaded:
+                self.load()
+            return await self._sync(session, await self._table_signature(session), self.current_encoder())
+
+    async def search(self, session: AsyncSession, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k ``(regulation_id, cosine similarity)`` pairs for a free-text query."""
+        encoder, ids, vectors = await self.ensure_fresh(session)
+        if not ids or not query.strip():
+            return []
+
+        import numpy as np
+        from src.services.embedding_index import normalize_rows
+
+        query_vector = await inference_executor.run("regulation_search", encoder.encode, [query])
+        scores = vectors @ normalize_rows(query_vector)[0]
+        k = min(k, len(scores))
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        best = candidates[np.argsort(-scores[candidates])]
+        return [(ids[i], float(scores[i])) for i in best]
+
+    def load(self) -> bool:
+        """Memory-map a persisted index; returns False when there is none."""
+        self._loaded = True
+        meta_path = self.index_dir / "meta.json"
+        vectors_path = self.index_dir / "vectors.npy"
+        if not meta_path.exists() or not vectors_path.exists():
+            return False
+        import numpy as np
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            vectors = np.load(vectors_path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable regulation index in {self.index_dir}: {e}")
+            return False
+        if vectors.shape[0] != len(meta["ids"]):
+            return False
+        self._encoder_id = meta["encoder_id"]
+        self._ids = meta["ids"]
+        self._fingerprints = meta["fingerprints"]
+        self._vectors = vectors
+        return True
+
+    async def _sync(
+        self, session: AsyncSession, signature: Tuple[int, Optional[str]], current_encoder: Tuple[str, Any]
+    ) -> Dict[str, int]:
+        import numpy as np
+        from src.services.embedding_index import normalize_rows
+
+        rows = (await session.execute(
+            select(Regulation.id, Regulation.title, Regulation.description)
+            .where(Regulation.status == "active")
+            .order_by(Regulation.id)
+        )).all()
+
+        encoder_id, encoder = current_encoder
+        if encoder_id != self._encoder_id:
+            ids, fingerprints, vectors = [], {}, np.zeros((0, 0), dtype=np.float32)
+        else:
+            ids, fingerprints, vectors = self._ids, self._fingerprints, self._vectors
+
+        current = {row.id: fingerprint(row.title, row.description) for row in rows}
+        kept = [position for position, regulation_id in enumerate(ids) if current.get(regulation_id) == fingerprints.get(regulation_id)]
+        kept_ids = {ids[position] for position in kept}
+        changed = [row for row in rows if row.id not in kept_ids]
+
+        new_vectors = []
+        for start in range(0, len(changed), ENCODE_BATCH_SIZE):
+            chunk = changed[start:start + ENCODE_BATCH_SIZE]
+            texts = [regulation_text(row.title, row.description) for row in chunk]
+            new_vectors.append(normalize_rows(await inference_executor.run("regulation_index", encoder.encode, texts)))
+
+        parts = ([np.asarray(vectors[kept])] if kept else []) + new_vectors
+        matrix = np.vstack(parts) if parts else np.zeros((0, 0), dtype=np.float32)
+        new_ids = [ids[position] for position in kept] + [row.id for row in changed]
+
+        stats = {
+            "encoded": len(changed),
+            "removed": sum(1 for regulation_id in ids if regulation_id not in current),
+            "total": len(new_ids),
+        }
+        self._persist(encoder_id, new_ids, current, matrix)
+        self._encoder_id = encoder_id
+        self._ids = new_ids
+        self._fingerprints = current
+        self._vectors = matrix
+        self._signature = signature
+        self._stale = False
+        if stats["encoded"] or stats["removed"]:
+            log_business_event("regulation_index_synced", {"encoder": encoder_id, **stats})
+        return stats
+
+    def _persist(self, encoder_id: str, ids: List[str], fingerprints: Dict[str, str], matrix: np.ndarray) -> None:
+        """Write vectors and metadata atomically; readers keep their old mapping."""
+        import numpy as np
+
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            vectors_tmp = self.index_dir / "vectors.tmp.npy"
+            meta_tmp = self.index_dir / "meta.json.tmp"
+            np.save(vectors_tmp, matrix.astype(np.float32, copy=False), allow_pickle=False)
+            meta_tmp.write_text(
+                json.dumps({"encoder_id": encoder_id, "ids": ids, "fingerprints": fingerprints}),
+                encoding="utf-8",
+            )
+            os.replace(vectors_tmp, self.index_dir / "vectors.npy")
+            os.replace(meta_tmp, self.index_dir / "meta.json")
+        except OSError as e:
+            logger.warning(f"Could not persist regulation index to {self.index_dir}: {e}")
+
+    @staticmethod
+    async def _table_signature(session: AsyncSession) -> Tuple[int, Optional[str]]:
+        count, last_update = (await session.execute(
+            select(func.count(Regulation.id), func.max(Regulation.updated_at))
+        )).one()
+        return count, str(last_update) if last_update is not None else None
+
+
+# Global index instance
+regulation_search_index = RegulationSearchIndex()
+subscribe(REGULATIONS, regulation_search_index.mark_stale)
@@ -65,4 +65,16 @@ def sample_compliance_report():
         country="USA",
         status="PENDING",
         pending_requirements=["AD-2025-12: Wing inspection required"]
-    )
\ No newline at end of file
+    )
+
+@pytest_asyncio.fixture
+async def sqlite_session_factory(tmp_path):
+    """Provide a session factory bound to a fresh SQLite file with all tables created."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from src.models.db_models_sqlite import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
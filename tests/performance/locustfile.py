@@ -5,8 +5,19 @@ Provides realistic load testing scenarios with varying
 user behaviors and request patterns.
 """
 
-from locust import HttpUser, task, between, events
+import os
 import random
+import sys
+from pathlib import Path
+
+from locust import HttpUser, task, between, events
+
+# Run from anywhere: ``locust -f tests/performance/locustfile.py --host http://localhost:8000``
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchmarks.profile import LoadProfile  # noqa: E402
+
+# Same endpoints, weights and values as the in-process benchmark (python -m benchmarks)
+PROFILE = LoadProfile.load(os.getenv("BENCHMARK_PROFILE"))
 
 
 class ComplianceUser(HttpUser):
@@ -14,62 +25,34 @@ class ComplianceUser(HttpUser):
     
     wait_time = between(1, 3)  # Wait 1-3 seconds between requests
     
-    # Test data
-    models = ["E190", "E195"]
-    countries = ["USA", "BRAZIL", "EUROPE"]
-    
     def on_start(self):
         """Called when a user starts."""
+        self.rng = random.Random()
+        self.client.headers.update(PROFILE.headers)
         # Test health endpoint first
         self.client.get("/health")
     
-    @task(10)  # 10x weight for compliance requests
-    def check_compliance(self):
-        """Main compliance checking task."""
-        model = random.choice(self.models)
-        country = random.choice(self.countries)
-        
-        with self.client.get(
-            "/check-compliance",
-            params={"model": model, "country": country},
+    @task
+    def profile_request(self):
+        """Request an endpoint drawn from the load profile by weight."""
+        plan = PROFILE.plan(self.rng)
+        with self.client.request(
+            plan.method,
+            plan.url,
+            params=plan.params or None,
+            name=plan.endpoint,  # group statistics per endpoint, not per URL
             catch_response=True
         ) as response:
-            if response.status_code == 200:
+            if response.status_code in plan.expected_status:
                 response.success()
             else:
                 response.failure(f"Failed with status {response.status_code}")
-    
-    @task(2)  # Lower weight for metrics
-    def check_metrics(self):
-        """Check metrics endpoint."""
-        self.client.get("/metrics")
-    
-    @task(1)  # Lowest weight for health
-    def check_health(self):
-        """Check health endpoint."""
-        self.client.get("/health")
 
 
-class PowerUser(HttpUser):
+class PowerUser(ComplianceUser):
     """Power user with more frequent requests."""
     
     wait_time = between(0.5, 1.5)  # Faster requests
-    
-    models = ["E190", "E195"]
-    countries = ["USA", "BRAZIL", "EUROPE"]
-    
-    @task(15)  # Higher weight for compliance
-    def check_compliance_frequently(self):
-        """Frequent compliance checking."""
-        model = random.choice(self.models)
-        country = random.choice(self.countries)
-        
-        self.client.get("/check-compliance", params={"model": model, "country": country})
-    
-    @task(1)
-    def check_cache_stats(self):
-        """Check cache statistics."""
-        self.client.get("/cache/stats")
 
 
 @events.test_start.add_listener
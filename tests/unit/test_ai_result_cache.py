@@ -0,0 +1,197 @@
+"""
+Unit tests for the local cache tier and memoized AI analysis results.
+"""
+
+import asyncio
+from fnmatch import fnmatch
+from unittest.mock import patch
+
+import pytest
+
+from src.api.compliance import Country
+from src.config import settings
+from src.services.aviation_ai_service import AviationAIAnalyzer
+from src.services.cache_service import CacheService, cache_service
+from src.services.local_cache import LocalLRUCache
+
+
+class TestLocalLRUCache:
+    """Test eviction order and expiry."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalLRUCache(max_size=2)
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", 2, ttl_seconds=60)
+        assert cache.get("a") == 1
+        cache.set("c", 3, ttl_seconds=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_expired_entries_are_misses(self):
+        cache = LocalLRUCache(max_size=2)
+        with patch("src.services.local_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl_seconds=10)
+        with patch("src.services.local_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_clear_by_prefix(self):
+        cache = LocalLRUCache()
+        cache.set("ai:x", 1, 60)
+        cache.set("check:y", 2, 60)
+        assert cache.clear("ai:") == 1
+        assert len(cache) == 1
+
+
+class _FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.calls.append(self.store.get(key, (None, -2))[0])
+
+    def pttl(self, key):
+        self.calls.append(self.store.get(key, (None, -2))[1])
+
+    async def execute(self):
+        return self.calls
+
+
+class _FakePubSub:
+    def __init__(self, subscribers):
+        self.subscribers = subscribers
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.subscribers.setdefault(channel, []).append(self.messages)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self, store, subscribers=None):
+        self.store = store
+        self.subscribers = {} if subscribers is None else subscribers
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self.store)
+
+    def pubsub(self):
+        return _FakePubSub(self.subscribers)
+
+    async def publish(self, channel, data):
+        for messages in self.subscribers.get(channel, []):
+            messages.put_nowait({"type": "message", "data": data})
+
+    async def keys(self, pattern):
+        return [key for key in self.store if fnmatch(key, pattern)]
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+class TestCacheTiers:
+    """Test the local tier in front of Redis."""
+
+    async def test_local_tier_is_off_while_caching_is_disabled(self):
+        with patch.object(settings, "cache_enabled", False):
+            assert await cache_service.set_bytes("tier:off", b"x") is False
+            assert await cache_service.get_bytes("tier:off") is None
+        with patch.object(settings, "cache_enabled", True), patch.object(cache_service, "_is_connected", False):
+            assert await cache_service.get_bytes("tier:off") is None
+
+    async def test_redis_hit_keeps_its_remaining_ttl(self):
+        key = "tier:promoted"
+        redis = _FakeRedis({f"{settings.cache_key_prefix}{key}": (b'{"a": 1}', 4000)})
+        with patch.object(settings, "cache_enabled", True), patch.object(cache_service, "_is_connected", True), \
+             patch.object(cache_service, "_redis", redis), patch.object(cache_service._local, "set") as local_set:
+            assert await cache_service.get_value(key) == {"a": 1}
+
+        local_set.assert_called_once_with(key, {"a": 1}, 4.0)
+
+
+    async def test_invalidation_reaches_other_workers(self):
+        subscribers = {}
+        workers = [CacheService(), CacheService()]
+        for worker in workers:
+            worker._redis = _FakeRedis({}, subscribers)
+            worker._is_connected = True
+            worker._start_invalidation_listener()
+        await asyncio.sleep(0)
+        key = workers[1].report_key("E175", "USA")
+        with patch.object(settings, "cache_enabled", True):
+            for worker in workers:
+                await worker.set_bytes(key, b"{}")
+
+            await workers[0].invalidate_compliance_result("E175", "USA")
+            await asyncio.sleep(0)
+
+            assert await workers[1].get_bytes(key) is None
+
+            await workers[1].set_bytes(key, b"{}")
+            await workers[0].clear_all_compliance_cache()
+            await asyncio.sleep(0)
+
+            assert await workers[1].get_bytes(key) is None
+        for worker in workers:
+            worker._invalidation_listener.cancel()
+
+class TestAIResultCache:
+    """Test that repeat analyses skip the models."""
+
+    @pytest.fixture
+    def analyzer(self):
+        cache_service.clear_local("ai:")
+        with patch.object(settings, "cache_enabled", True), patch.object(cache_service, "_is_connected", False):
+            yield AviationAIAnalyzer()
+        cache_service.clear_local("ai:")
+
+    async def test_repeat_analysis_is_served_from_cache(self, analyzer):
+        first = await analyzer.analyze_compliance_with_ai("e190", "US")
+        with patch.object(analyzer, "_run_fallback_ai", side_effect=AssertionError("recomputed")):
+            second = await analyzer.analyze_compliance_with_ai("E190", "us")
+        assert second is first
+
+    async def test_warm_covers_every_pair(self, analyzer):
+        warmed = await analyzer.warm_result_cache()
+        assert warmed == len(analyzer.knowledge_base["aircraft_database"]) * len(
+            analyzer.knowledge_base["regulatory_knowledge"]
+        )
+        assert not analyzer.registry.started
+        assert await cache_service.get_value(analyzer._result_cache_key("kc390", "UK")) is not None
+
+    async def test_key_tracks_knowledge_base_version(self, analyzer):
+        key = analyzer._result_cache_key("e190", "US")
+        analyzer.knowledge_base_version = "changed"
+        assert analyzer._result_cache_key("e190", "US") != key
+
+    async def test_api_country_names_use_knowledge_base_keys(self, analyzer):
+        assert analyzer._result_cache_key("e190", Country.USA) == analyzer._result_cache_key("e190", "US")
+        assert analyzer._result_cache_key("e190", "EUROPE") == analyzer._result_cache_key("e190", "EU")
+
+        result = await analyzer.analyze_compliance_with_ai("e190", Country.USA)
+        assert await cache_service.get_value(analyzer._result_cache_key("e190", "US")) is result
+
+    async def test_warm_waits_for_model_loading(self, analyzer):
+        with patch.object(type(analyzer.registry), "started", True), \
+             patch.object(type(analyzer.registry), "finished", False):
+            task = analyzer.schedule_result_cache_warm()
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not analyzer._warm_tasks
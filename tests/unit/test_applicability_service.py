@@ -0,0 +1,174 @@
+"""
+Unit tests for regulation applicability matching and materialization.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+
+from src.models.db_models_sqlite import AircraftModel, Authority, Regulation, regulation_models
+from src.repositories import AircraftModelRepository, RegulationRepository
+from src.services.applicability_service import (
+    applies_to,
+    designation_codes,
+    ensure_applicability_materialized,
+    materialize_applicability,
+    model_codes,
+)
+
+
+class TestDesignationCodes:
+    """Test variant/family resolution for the row layouts found in the data."""
+
+    @pytest.mark.parametrize("model,variant,expected", [
+        ("E175", "E175-E2", ("E175-E2", "E175")),
+        ("E175-E1", "E1", ("E175-E1", "E175")),
+        ("737", "800", ("737-800", "737")),
+        ("A320", None, ("A320", None)),
+        ("E190-E2", None, ("E190-E2", "E190")),
+        ("C-390", None, ("C-390", None)),
+        ("EMB-203", None, ("EMB-203", None)),
+        ("phenom-300e", None, ("PHENOM-300E", None)),
+    ])
+    def test_designation_codes(self, model, variant, expected):
+        assert designation_codes(model, variant) == expected
+
+    def test_family_entry_covers_variants(self):
+        assert applies_to(["E175"], model_codes("E175-E2"))
+        assert applies_to(["E175"], model_codes("E175"))
+
+    def test_partial_prefix_does_not_match(self):
+        assert not applies_to(["E17"], model_codes("E175"))
+        assert not applies_to(["E175-E2"], model_codes("E175"))
+
+    def test_empty_applicability_applies_to_all(self):
+        assert applies_to([], model_codes("A320"))
+
+
+class TestMaterializedLookup:
+    """Test the indexed join against a real SQLite database."""
+
+    @pytest.fixture
+    async def seeded(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            faa = Authority(code="FAA", name="Federal Aviation Administration")
+            anac = Authority(code="ANAC", name="Agência Nacional de Aviação Civil")
+            session.add_all([faa, anac])
+            await session.flush()
+            session.add_all([
+                AircraftModel(manufacturer="Embraer", model="E175", variant="E175-E1"),
+                AircraftModel(manufacturer="Embraer", model="E175", variant="E175-E2"),
+                AircraftModel(manufacturer="Embraer", model="E190", variant="E190-E2"),
+            ])
+            session.add_all([
+                Regulation(authority_id=faa.id, reference="FAA-E175", title="t", description="d",
+                           content={"applicable_models": ["E175"]}),
+                Regulation(authority_id=faa.id, reference="FAA-E2", title="t", description="d",
+                           content={"applicable_models": ["E175-E2", "E190-E2"]}),
+                Regulation(authority_id=faa.id, reference="FAA-E17", title="t", description="d",
+                           content={"applicable_models": ["E17"]}),
+                Regulation(authority_id=faa.id, reference="FAA-ALL", title="t", description="d", content={}),
+                Regulation(authority_id=anac.id, reference="ANAC-E175", title="t", description="d",
+                           content={"applicable_models": ["E175"]}),
+            ])
+            await session.commit()
+            await materialize_applicability(session)
+            return sqlite_session_factory, faa.id
+
+    async def _references(self, factory, code, authority_id):
+        async with factory() as session:
+            regulations = await RegulationRepository(session).get_applicable(code, authority_id)
+        return [regulation.reference for regulation in regulations]
+
+    async def test_variant_lookup(self, seeded):
+        factory, faa_id = seeded
+        assert await self._references(factory, "E175-E2", faa_id) == ["FAA-ALL", "FAA-E175", "FAA-E2"]
+
+    async def test_family_lookup_excludes_variant_specific_rules(self, seeded):
+        factory, faa_id = seeded
+        assert await self._references(factory, "E175", faa_id) == ["FAA-ALL", "FAA-E175"]
+
+    async def test_unknown_code_returns_nothing(self, seeded):
+        factory, faa_id = seeded
+        assert await self._references(factory, "E17", faa_id) == []
+
+    async def test_ensure_is_noop_once_materialized(self, seeded):
+        factory, _ = seeded
+        async with factory() as session:
+            assert await ensure_applicability_materialized(session) is False
+            count = await session.scalar(select(func.count()).select_from(regulation_models))
+        assert count == 9
+
+    async def test_deleted_regulation_is_unlinked(self, seeded):
+        factory, _ = seeded
+        async with factory() as session:
+            repo = RegulationRepository(session)
+            await repo.delete((await repo.get_by_reference("FAA-E175")).id)
+            links = await session.scalar(select(func.count()).select_from(regulation_models))
+
+        assert links == 7
+
+
+class TestAliasApplicability:
+    """Test that regulations listing an alias reach the canonical model row."""
+
+    async def test_alias_entry_links_canonical_row(self, sqlite_session_factory):
+        from src.services.enhanced_compliance_service import EnhancedComplianceService
+        from src.services.model_resolver import model_resolver
+
+        async with sqlite_session_factory() as session:
+            faa = Authority(code="FAA", name="Federal Aviation Administration")
+            session.add(faa)
+            await session.flush()
+            session.add(AircraftModel(manufacturer="Embraer", model="C-390", variant=None))
+            session.add_all([
+                Regulation(authority_id=faa.id, reference="FAA-KC390", title="t", description="d",
+                           content={"applicable_models": ["KC-390"]}),
+                Regulation(authority_id=faa.id, reference="FAA-C390", title="t", description="d",
+                           content={"applicable_models": ["c 390"]}),
+            ])
+            await session.commit()
+            await materialize_applicability(session)
+
+            model_resolver.invalidate()
+            try:
+                regulations = await EnhancedComplianceService(session).get_applicable_regulations("KC-390", "USA")
+            finally:
+                model_resolver.invalidate()
+
+        assert [regulation["reference"] for regulation in regulations] == ["FAA-C390", "FAA-KC390"]
+
+
+class TestRepositoryWrites:
+    """Test that repository writes keep regulation_models current."""
+
+    async def test_created_regulation_is_checked(self, sqlite_session_factory):
+        from src.services.enhanced_compliance_service import EnhancedComplianceService
+        from src.services.model_resolver import model_resolver
+
+        async with sqlite_session_factory() as session:
+            faa = Authority(code="FAA", name="Federal Aviation Administration")
+            session.add(faa)
+            await session.flush()
+            session.add(Regulation(authority_id=faa.id, reference="FAA-ALL", title="t", description="d", content={}))
+            await session.commit()
+            # Links exist, so the startup backfill would not run again
+            await materialize_applicability(session)
+
+            aircraft_repo = AircraftModelRepository(session)
+            await aircraft_repo.create(manufacturer="Embraer", model="E175", variant="E175-E2")
+            await RegulationRepository(session).create(
+                authority_id=faa.id, reference="FAA-E175", title="Emergency exits", description="d",
+                content={"applicable_models": ["E175"]},
+            )
+
+            model_resolver.invalidate()
+            try:
+                with patch("src.services.enhanced_compliance_service.settings.compliance_history_enabled", False):
+                    report = await EnhancedComplianceService(session).check_compliance("E175-E2", "USA")
+            finally:
+                model_resolver.invalidate()
+
+        assert [check.regulation_reference for check in report.checks] == ["FAA-ALL", "FAA-E175"]
+
@@ -0,0 +1,173 @@
+"""
+Unit tests for the benchmark suite: profiles, dataset, load driver and baselines.
+"""
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import func, select
+
+from benchmarks.baseline import compare
+from benchmarks.dataset import (
+    DatasetSpec,
+    applicable_regulation_ids,
+    build_aircraft_models,
+    build_authorities,
+    build_regulations,
+    iter_fleet,
+    iter_history,
+    seed_dataset,
+)
+from benchmarks.profile import LoadProfile
+from benchmarks.runner import percentile, run_load
+
+PROFILE = {
+    "name": "test",
+    "concurrency": 4,
+    "requests": 40,
+    "warmup_requests": 5,
+    "variables": {"model": ["E175", "E190"], "country": ["USA", "BRAZIL"]},
+    "endpoints": [
+        {"name": "check", "path": "/check/{model}/{country}", "weight": 3},
+        {"name": "search", "path": "/search", "params": {"q": "{model}"}},
+        {"name": "broken", "path": "/broken"},
+    ],
+}
+
+
+def _stats(requests=200, errors=0, p50=10.0, p95=20.0, p99=30.0, rps=100.0):
+    return {"requests": requests, "errors": errors, "p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "throughput_rps": rps}
+
+
+class TestLoadProfile:
+    """Test profile parsing and request planning."""
+
+    def test_plans_are_reproducible_and_filled(self):
+        profile = LoadProfile.from_dict(PROFILE)
+
+        first = list(profile.request_plans(50))
+        assert first == list(profile.request_plans(50))
+        assert {plan.endpoint for plan in first} == {"check", "search", "broken"}
+        search = next(plan for plan in first if plan.endpoint == "search")
+        assert search.params["q"] in ("E175", "E190")
+        assert all("{" not in plan.url for plan in first)
+
+    def test_undefined_placeholder_is_rejected(self):
+        with pytest.raises(ValueError, match="undefined variables"):
+            LoadProfile.from_dict({"endpoints": [{"name": "x", "path": "/check/{tail}"}]})
+
+    def test_bundled_default_profile_loads(self):
+        assert LoadProfile.load().endpoints
+
+
+class TestRunner:
+    """Test the in-process load driver."""
+
+    def test_percentile_interpolates(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.5
+        assert percentile([5.0], 0.99) == 5.0
+        assert percentile([], 0.5) == 0.0
+
+    async def test_run_load_reports_per_endpoint(self):
+        app = FastAPI()
+
+        @app.get("/check/{model}/{country}")
+        async def check(model: str, country: str):
+            return {"model": model, "country": country}
+
+        @app.get("/search")
+        async def search(q: str):
+            return {"q": q}
+
+        result = await run_load(app, LoadProfile.from_dict(PROFILE))
+
+        assert result["overall"]["requests"] == 40
+        assert set(result["endpoints"]) == {"check", "search", "broken"}
+        broken = result["endpoints"]["broken"]
+        assert broken["errors"] == broken["requests"] and broken["status_codes"] == {"404": broken["requests"]}
+        assert result["endpoints"]["check"]["errors"] == 0
+        assert 0 < result["overall"]["p50_ms"] <= result["overall"]["p99_ms"]
+
+
+class TestBaseline:
+    """Test regression detection against a baseline."""
+
+    def test_latency_throughput_and_errors_regress(self):
+        baseline = {"overall": _stats(), "endpoints": {"check": _stats()}}
+        current = {"overall": _stats(p95=30.0), "endpoints": {"check": _stats(rps=50.0, errors=4), "new": _stats()}}
+
+        regressions = {(r.endpoint, r.metric) for r in compare(current, baseline, tolerance=0.25)}
+
+        assert regressions == {("overall", "p95_ms"), ("check", "throughput_rps"), ("check", "error_rate")}
+
+    def test_noise_is_tolerated(self):
+        baseline = {"overall": _stats(requests=30, p50=0.4, p99=30.0), "endpoints": {}}
+        # Sub-millisecond p50 jitter, and a p99 backed by too few requests
+        current = {"overall": _stats(requests=30, p50=0.9, p99=90.0), "endpoints": {}}
+
+        assert compare(current, baseline) == []
+
+
+class TestDataset:
+    """Test the synthetic catalog, fleet and history."""
+
+    def test_catalog_is_deterministic_and_includes_real_designations(self):
+        spec = DatasetSpec(aircraft=40, regulations=300, authorities=10, seed=7)
+        authorities, models = build_authorities(spec), build_aircraft_models(spec)
+
+        assert build_regulations(spec, authorities, models) == build_regulations(spec, authorities, models)
+        assert [row["code"] for row in authorities[:3]] == ["FAA", "ANAC", "EASA"]
+        assert len(authorities) == 10 and len(models) == 40
+        assert {"E175-E2", "737", "A320"} <= {row["variant"] or row["model"] for row in models}
+
+    async def test_seeded_catalog_serves_compliance_checks(self, sqlite_session_factory):
+        from src.models.db_models_sqlite import Regulation
+        from src.services.enhanced_compliance_service import EnhancedComplianceService
+        from src.services.model_resolver import model_resolver
+
+        try:
+            async with sqlite_session_factory() as session:
+                rows = await seed_dataset(session, DatasetSpec(aircraft=30, regulations=200, authorities=4))
+                assert await session.scalar(select(func.count(Regulation.id))) == 200
+                regulations = await EnhancedComplianceService(session).get_applicable_regulations("E175-E2", "USA")
+        finally:
+            model_resolver.invalidate()  # the trie now indexes this throwaway database
+
+        assert rows["regulation_models"] > 0
+        assert regulations and all(regulation["authority"] == "FAA" for regulation in regulations)
+
+    def test_fleet_is_deterministic_with_unique_registrations(self):
+        spec = DatasetSpec(aircraft=20, regulations=50, fleet=2000, seed=3)
+        models = build_aircraft_models(spec)
+
+        fleet = list(iter_fleet(spec, models))
+
+        assert fleet == list(iter_fleet(spec, models))
+        assert len({tail["registration"] for tail in fleet}) == 2000
+        assert all(tail["last_inspection"].date() <= spec.as_of and tail["current_hours"] > 0 for tail in fleet)
+
+    def test_history_only_pairs_applicable_regulations(self):
+        spec = DatasetSpec(aircraft=20, regulations=200, history=500, history_days=30, seed=3)
+        authorities, models = build_authorities(spec), build_aircraft_models(spec)
+        regulations = build_regulations(spec, authorities, models)
+        applicable = applicable_regulation_ids(models, regulations)
+
+        history = list(iter_history(spec, models, regulations))
+
+        assert len(history) == 500
+        assert all(row["regulation_id"] in applicable[row["aircraft_model_id"]] for row in history)
+        assert all(0 < (spec.as_of - row["check_date"].date()).days <= 30 for row in history)
+
+    async def test_seeded_fleet_and_history_counts(self, sqlite_session_factory):
+        from src.models.db_models_sqlite import Aircraft
+        from src.services.model_resolver import model_resolver
+
+        spec = DatasetSpec(aircraft=20, regulations=100, authorities=3, fleet=300, history=1200)
+        try:
+            async with sqlite_session_factory() as session:
+                rows = await seed_dataset(session, spec)
+                tails = await session.scalar(select(func.count(Aircraft.id)))
+        finally:
+            model_resolver.invalidate()
+
+        assert tails == rows["aircraft"] == 300
+        assert rows["compliance_check_history"] == 1200
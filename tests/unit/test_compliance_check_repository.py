@@ -0,0 +1,48 @@
+"""
+Unit tests for the compliance check repository against the SQLite schema.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.db_models_sqlite import ComplianceCheck
+from src.repositories import ComplianceCheckRepository
+
+
+def _check(regulation_id: str, status: str, checked_at, created_at: datetime) -> ComplianceCheck:
+    return ComplianceCheck(
+        aircraft_model_id="model-1", regulation_id=regulation_id, status=status,
+        checked_at=checked_at, created_at=created_at,
+    )
+
+
+class TestComplianceCheckRepository:
+
+    @pytest.fixture
+    async def repo(self, sqlite_session_factory):
+        base = datetime(2026, 5, 1, 12)
+        async with sqlite_session_factory() as session:
+            session.add_all([
+                _check("reg-1", "pending", base, base),
+                _check("reg-1", "compliant", base + timedelta(days=2), base),
+                # No checked_at: falls back to when the row was written
+                _check("reg-2", "non_compliant", None, base + timedelta(days=1)),
+                _check("reg-2", "compliant", base, base),
+            ])
+            await session.commit()
+            yield ComplianceCheckRepository(session)
+
+    async def test_date_range_and_ordering(self, repo):
+        checks = await repo.get_checks_by_date_range(datetime(2026, 5, 1, 18), datetime(2026, 5, 10), "model-1")
+
+        assert [(check.regulation_id, check.status) for check in checks] == [
+            ("reg-1", "compliant"), ("reg-2", "non_compliant"),
+        ]
+
+    async def test_summary_scores_verdicts(self, repo):
+        summary = await repo.get_compliance_summary("model-1")
+
+        assert summary["total_checks"] == 4
+        assert summary["average_compliance"] == pytest.approx(200 / 3)
+        assert summary["compliance_rate"] == 50
@@ -0,0 +1,203 @@
+"""
+Unit tests for the partitioned compliance history repository.
+"""
+
+import asyncio
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, text
+
+from src.repositories import ComplianceHistoryRepository
+from src.repositories.compliance_history import months_in_range, partition_name
+from src.services.history_recorder import HistoryRecorder, history_recorder
+
+
+def _check(day: datetime, status: str = "compliant", percentage: float = 100.0, model: str = "model-1"):
+    return {
+        "aircraft_model_id": model,
+        "regulation_id": "reg-1",
+        "check_date": day,
+        "status": status,
+        "compliance_percentage": percentage,
+    }
+
+
+async def _partitions(session):
+    result = await session.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'compliance_check_history_y%'")
+    )
+    return sorted(name for (name,) in result)
+
+
+class TestPartitionHelpers:
+
+    def test_months_in_range_crosses_year(self):
+        months = months_in_range(datetime(2025, 11, 15), datetime(2026, 1, 2))
+        assert [partition_name(month) for month in months] == [
+            "compliance_check_history_y2025m11",
+            "compliance_check_history_y2025m12",
+            "compliance_check_history_y2026m01",
+        ]
+
+
+class TestComplianceHistoryRepository:
+
+    @pytest.fixture
+    async def session(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            repo = ComplianceHistoryRepository(session)
+            await repo.record_checks([
+                _check(datetime(2026, 1, 10, 9)),
+                _check(datetime(2026, 1, 10, 15), status="pending", percentage=50.0),
+                _check(datetime(2026, 2, 3)),
+                _check(datetime(2026, 3, 20), model="model-2"),
+            ])
+            yield session
+
+    async def test_writes_one_table_per_month(self, session):
+        assert await _partitions(session) == [
+            "compliance_check_history_y2026m01",
+            "compliance_check_history_y2026m02",
+            "compliance_check_history_y2026m03",
+        ]
+
+    async def test_range_query_reads_only_overlapping_partitions(self, session):
+        repo = ComplianceHistoryRepository(session)
+        tables = await repo._tables_for_range(datetime(2026, 2, 1), datetime(2026, 2, 28))
+        assert [table.name for table in tables] == ["compliance_check_history_y2026m02"]
+
+        checks = await repo.get_checks_by_date_range(datetime(2026, 1, 1), datetime(2026, 2, 28), "model-1")
+        assert [check["check_date"] for check in checks] == [
+            datetime(2026, 2, 3), datetime(2026, 1, 10, 15), datetime(2026, 1, 10, 9),
+        ]
+
+    async def test_compact_rolls_up_and_drops_expired_partitions(self, session):
+        repo = ComplianceHistoryRepository(session)
+        with patch("src.repositories.compliance_history.settings.history_raw_retention_days", 30):
+            stats = await repo.compact(now=datetime(2026, 4, 5))
+
+        assert stats["compacted_partitions"] == [
+            "compliance_check_history_y2026m01",
+            "compliance_check_history_y2026m02",
+        ]
+        assert await _partitions(session) == ["compliance_check_history_y2026m03"]
+
+        summary = await repo.get_compliance_summary("model-1", datetime(2026, 1, 1), datetime(2026, 3, 31))
+        assert summary["total_checks"] == 3
+        assert summary["status_counts"] == {"compliant": 2, "pending": 1}
+        assert summary["average_compliance"] == pytest.approx(250.0 / 3)
+
+    async def test_daily_trend_merges_partitions_and_rollups(self, session):
+        repo = ComplianceHistoryRepository(session)
+        with patch("src.repositories.compliance_history.settings.history_raw_retention_days", 30):
+            await repo.compact(now=datetime(2026, 4, 5))
+
+        trend = await repo.get_daily_trend(datetime(2026, 1, 1), datetime(2026, 3, 31))
+
+        assert trend == {
+            date(2026, 1, 10): {"compliant": 1, "pending": 1},
+            date(2026, 2, 3): {"compliant": 1},
+            date(2026, 3, 20): {"compliant": 1},
+        }
+        assert list(await repo.get_daily_trend(datetime(2026, 1, 1), datetime(2026, 3, 31), ["model-2"])) == [
+            date(2026, 3, 20)
+        ]
+
+
+class TestPartitionCache:
+    """Test that partition DDL runs once per month and survives rollbacks correctly."""
+
+    @staticmethod
+    def _count_ddl(engine):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith(("CREATE TABLE", "PRAGMA")):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+        return statements
+
+    async def test_known_partition_skips_ddl(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            ddl = self._count_ddl(session.bind)
+            repo = ComplianceHistoryRepository(session)
+            await repo.record_checks([_check(datetime(2026, 5, 1))])
+            first = len(ddl)
+            await repo.record_checks([_check(datetime(2026, 5, 2)), _check(datetime(2026, 5, 3))])
+
+            assert first > 0 and len(ddl) == first
+
+    async def test_rolled_back_partition_is_recreated(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            repo = ComplianceHistoryRepository(session)
+            await repo.record_checks([_check(datetime(2026, 6, 1))], commit=False)
+            await session.rollback()
+
+            assert await repo.record_checks([_check(datetime(2026, 6, 2))]) == 1
+            assert len(await repo.get_checks_by_date_range(datetime(2026, 6, 1), datetime(2026, 6, 30))) == 1
+
+
+class TestRecordedByComplianceChecks:
+    """Test that live compliance checks land in the history."""
+
+    async def test_check_compliance_records_history(self, sqlite_session_factory):
+        from benchmarks.dataset import DatasetSpec, seed_dataset
+        from src.services.enhanced_compliance_service import EnhancedComplianceService
+        from src.services.model_resolver import model_resolver
+
+        try:
+            async with sqlite_session_factory() as session:
+                await seed_dataset(session, DatasetSpec(aircraft=20, regulations=200, authorities=4))
+                service = EnhancedComplianceService(session)
+                report = await service.check_compliance("E175-E2", "USA")
+                assert history_recorder.pending == report.total_checks
+                await history_recorder.flush()
+                history = await service.get_compliance_history("E175-E2", days=1)
+        finally:
+            model_resolver.invalidate()
+
+        assert report.total_checks > 0
+        assert history["summary"]["total_checks"] == report.total_checks
+        assert sum(day["total_checks"] for day in history["trend"]) == report.total_checks
+
+
+class TestHistoryRecorder:
+    """Test the background batch writer."""
+
+    async def test_rows_are_written_in_the_background(self, sqlite_session_factory):
+        recorder = HistoryRecorder(flush_interval=0.01)
+        async with sqlite_session_factory() as session:
+            recorder.submit(session.bind, [_check(datetime(2026, 7, 1)), _check(datetime(2026, 7, 2))])
+            recorder.submit(session.bind, [_check(datetime(2026, 8, 1))])
+            assert recorder.pending == 3
+
+            await asyncio.sleep(0.1)
+
+            assert recorder.pending == 0
+            repo = ComplianceHistoryRepository(session)
+            assert len(await repo.get_checks_by_date_range(datetime(2026, 7, 1), datetime(2026, 8, 31))) == 3
+
+    async def test_failed_write_is_dropped(self, sqlite_session_factory):
+        recorder = HistoryRecorder(flush_interval=60)
+        async with sqlite_session_factory() as session:
+            recorder.submit(session.bind, [{**_check(datetime(2026, 9, 1)), "status": None}])
+            recorder.submit(session.bind, [_check(datetime(2026, 9, 2))])
+            await recorder.flush()
+
+            assert recorder.pending == 0
+            assert await ComplianceHistoryRepository(session).get_checks_by_date_range(
+                datetime(2026, 9, 1), datetime(2026, 9, 30)
+            ) == []
+
+    async def test_full_queue_drops_new_rows(self, sqlite_session_factory):
+        recorder = HistoryRecorder(flush_interval=60, max_pending_rows=1)
+        async with sqlite_session_factory() as session:
+            assert recorder.submit(session.bind, [_check(datetime(2026, 10, 1))])
+            assert not recorder.submit(session.bind, [_check(datetime(2026, 10, 2))])
+            await recorder.flush()
+
+            repo = ComplianceHistoryRepository(session)
+            assert len(await repo.get_checks_by_date_range(datetime(2026, 10, 1), datetime(2026, 10, 31))) == 1
@@ -0,0 +1,109 @@
+"""
+Unit tests for negotiated response compression and precompressed reports.
+"""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.config import settings
+from src.middleware.compression import CompressionMiddleware
+from src.services import compression
+from src.services.cache_service import cache_service
+from src.services.compression import negotiate_encoding
+
+LARGE = {"aircraft": [{"model": f"E{index}", "notes": "Type certificate validated"} for index in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(50):
+                yield f'{{"row":{index},"text":"regulation excerpt"}}\n'.encode()
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    @app.get("/precompressed")
+    async def precompressed():
+        return Response(gzip.compress(b'{"done":true}'), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    return TestClient(app)
+
+
+class TestNegotiation:
+    """Test Accept-Encoding parsing."""
+
+    def test_quality_values_and_refusal(self):
+        with patch.object(compression, "brotli", None):
+            assert negotiate_encoding("gzip, deflate, br") == "gzip"
+            assert negotiate_encoding("gzip;q=0, *;q=0.5") is None
+            assert negotiate_encoding("*") == "gzip"
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding(None) is None
+
+    def test_brotli_preferred_when_installed(self):
+        pytest.importorskip("brotli")
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+
+class TestCompressionMiddleware:
+    """Test thresholds, streaming and pass-through."""
+
+    def test_large_body_is_compressed_with_weak_etag(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json() == LARGE
+
+    def test_small_and_identity_responses_are_untouched(self, client):
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+    def test_streaming_body_is_compressed_incrementally(self, client):
+        with patch.object(compression, "brotli", None):
+            response = client.get("/stream", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text.count("regulation excerpt") == 50
+
+    def test_already_encoded_response_passes_through(self, client):
+        response = client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+        assert response.json() == {"done": True}
+
+
+class TestPrecompressedReports:
+    """Test that report cache fills store compressed copies."""
+
+    async def test_cache_fill_stores_gzip_copy(self, sqlite_session_factory):
+        from src.services.enhanced_compliance_service import EnhancedComplianceService
+
+        with patch.object(settings, "cache_enabled", True), patch.object(settings, "compression_minimum_size", 0), \
+             patch.object(compression, "brotli", None), patch.object(cache_service, "_is_connected", False):
+            async with sqlite_session_factory() as session:
+                service = EnhancedComplianceService(session)
+                body = await service.check_compliance_json("E175", "USA")
+                compressed = await service.precompressed_report("E175", "USA", "gzip")
+        cache_service.clear_local("report:")
+
+        assert gzip.decompress(compressed) == body
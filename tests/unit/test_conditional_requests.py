@@ -0,0 +1,104 @@
+"""
+Unit tests for ETag / If-None-Match handling.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from src.middleware.conditional import ConditionalRequestMiddleware
+from src.services.content_version import ContentVersion, etag_matches
+
+
+@pytest.fixture
+def versioned_app():
+    version = ContentVersion()
+    calls = []
+    app = FastAPI()
+    app.add_middleware(ConditionalRequestMiddleware)
+
+    @app.get("/compliance/models")
+    async def models():
+        calls.append("models")
+        return {"models": ["E175"]}
+
+    @app.get("/compliance/check/{model}/{country}")
+    async def check(model: str, country: str, request: Request):
+        calls.append("check")
+        body = f'{{"aircraft_model":"{model}","country":"{country}"}}'.encode()
+        return Response(body, media_type="application/json", headers={"ETag": version.report_etag(request.url.path, body)})
+
+    with patch("src.middleware.conditional.content_version", version):
+        yield TestClient(app), version, calls
+
+
+class TestConditionalRequests:
+    """Test 304 handling for catalog and report endpoints."""
+
+    def test_catalog_revalidation_skips_handler_until_a_write(self, versioned_app):
+        client, version, calls = versioned_app
+
+        first = client.get("/compliance/models")
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and first.headers["cache-control"] == "no-cache"
+
+        cached = client.get("/compliance/models", headers={"If-None-Match": etag})
+        assert cached.status_code == 304 and cached.content == b""
+        assert cached.headers["etag"] == etag
+        assert calls == ["models"]
+
+        version.bump()
+        changed = client.get("/compliance/models", headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+        assert calls == ["models", "models"]
+
+    def test_report_etag_is_a_body_hash_remembered_per_path(self, versioned_app):
+        client, version, calls = versioned_app
+
+        # Unknown report: nothing to compare against yet, so the handler runs
+        first = client.get("/compliance/check/E175/USA", headers={"If-None-Match": '"stale"'})
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+
+        assert client.get("/compliance/check/E175/USA", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/compliance/check/E190/USA", headers={"If-None-Match": etag}).status_code == 200
+        assert calls == ["check", "check"]
+
+        version.bump()
+        again = client.get("/compliance/check/E175/USA", headers={"If-None-Match": etag})
+        assert again.status_code == 200 and again.headers["etag"] == etag
+
+    def test_if_none_match_parsing(self):
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"a"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"a"')
+
+
+class TestDatasetSignature:
+    """Test that the dataset version follows writes made outside this process."""
+
+    async def test_write_from_another_process_changes_the_etag(self, sqlite_session_factory, tmp_path):
+        version = ContentVersion(session_factory=sqlite_session_factory, ttl_seconds=60)
+        await version.refresh()
+        etag = version.dataset_etag("/compliance/authorities")
+
+        # A separate interpreter writing straight to the file, as the import scripts do
+        script = (
+            "import sqlite3, sys; db = sqlite3.connect(sys.argv[1]); "
+            "db.execute(\"INSERT INTO authorities (id, code, name, created_at, updated_at) "
+            "VALUES ('a-1', 'FAA', 'Federal Aviation Administration', '2025-01-01', '2025-01-01')\"); "
+            "db.commit()"
+        )
+        subprocess.run([sys.executable, "-c", script, str(tmp_path / "test.db")], check=True)
+
+        # Within the TTL the signature is reused; once it lapses the write shows
+        await version.refresh()
+        assert version.dataset_etag("/compliance/authorities") == etag
+        version.ttl_seconds = 0
+        await version.refresh()
+        assert version.dataset_etag("/compliance/authorities") != etag
@@ -0,0 +1,69 @@
+"""
+Unit tests for precomputed reference embeddings.
+"""
+
+import numpy as np
+import pytest
+
+from src.services.embedding_index import EmbeddingIndex, content_hash
+
+
+VOCABULARY = ("faa", "easa", "anac", "jet", "military")
+
+
+class CountingEncoder:
+    """Bag-of-words encoder that records how many texts it encoded."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([
+            [text.lower().split().count(word) for word in VOCABULARY] for text in texts
+        ], dtype=np.float32)
+
+
+TEXTS = ["faa jet", "easa jet", "anac military", "faa easa"]
+
+
+class TestEmbeddingIndex:
+    """Test batch encoding, top-k search and disk persistence."""
+
+    def test_build_encodes_all_texts_in_one_batch(self):
+        encoder = CountingEncoder()
+        index = EmbeddingIndex.build(encoder, TEXTS, model_name="bow")
+        assert encoder.calls == [TEXTS]
+        assert np.allclose(np.linalg.norm(index.embeddings, axis=1), 1.0)
+
+    def test_search_encodes_only_the_query(self):
+        encoder = CountingEncoder()
+        index = EmbeddingIndex.build(encoder, TEXTS, model_name="bow")
+
+        matches = index.search(encoder, "faa jet", k=2)
+
+        assert encoder.calls[-1] == ["faa jet"]
+        assert len(encoder.calls) == 2
+        assert matches[0] == (0, pytest.approx(1.0))
+        assert matches[1] in [(1, pytest.approx(0.5)), (3, pytest.approx(0.5))]
+
+    def test_top_k_larger_than_index_returns_everything_sorted(self):
+        index = EmbeddingIndex(TEXTS, CountingEncoder().encode(TEXTS))
+        matches = index.top_k(CountingEncoder().encode(["anac military"]), k=10)
+        assert len(matches) == len(TEXTS)
+        assert matches[0][0] == 2
+        assert [score for _, score in matches] == sorted((score for _, score in matches), reverse=True)
+
+    def test_persisted_matrix_is_reused(self, tmp_path):
+        EmbeddingIndex.build(CountingEncoder(), TEXTS, model_name="org/bow", cache_dir=str(tmp_path))
+        assert len(list(tmp_path.glob("org_bow-*.npy"))) == 1
+
+        encoder = CountingEncoder()
+        index = EmbeddingIndex.build(encoder, TEXTS, model_name="org/bow", cache_dir=str(tmp_path))
+        assert encoder.calls == []
+        assert index.texts == TEXTS
+
+    def test_content_hash_changes_with_texts_and_model(self):
+        assert content_hash("bow", TEXTS) != content_hash("bow", TEXTS[:-1])
+        assert content_hash("bow", TEXTS) != content_hash("other", TEXTS)
+        assert content_hash("bow", ["a b"]) != content_hash("bow", ["a", "b"])
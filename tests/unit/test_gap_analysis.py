@@ -0,0 +1,155 @@
+"""
+Unit tests for the regulatory gap analysis path.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.compliance import AircraftModel, Country, _gap_matrices, regulatory_gap_analysis
+from src.error_messages import unsupported_country
+from src.services.enhanced_compliance_service import EnhancedComplianceService
+from src.services.gap_rules import DEFAULT_RULES_PATH, MATRIX_COLUMNS, GapRuleBook, gap_rules
+
+
+class TestRegulatoryGapAnalysis:
+    """Test the single-pair gap analysis endpoint."""
+
+    async def test_validates_inputs_without_running_checks(self, sqlite_session_factory):
+        validated = []
+
+        async def fake_validate(self, model, country):
+            validated.append((model, country))
+
+        async def fail_check(self, model, country):
+            raise AssertionError("gap analysis must not run compliance checks")
+
+        async with sqlite_session_factory() as session:
+            with patch.object(EnhancedComplianceService, "validate_input", fake_validate), \
+                 patch.object(EnhancedComplianceService, "check_compliance", fail_check):
+                result = await regulatory_gap_analysis(
+                    AircraftModel.E175, Country.BRAZIL, Country.USA, EnhancedComplianceService(session)
+                )
+
+        assert validated == [("E175", "BRAZIL"), ("E175", "USA")]
+        assert result["summary"]["totalGaps"] == 3
+
+    async def test_invalid_input_is_a_bad_request(self, sqlite_session_factory):
+        async def reject(self, model, country):
+            raise unsupported_country(country)
+
+        async with sqlite_session_factory() as session:
+            with patch.object(EnhancedComplianceService, "validate_input", reject), \
+                 pytest.raises(HTTPException) as excinfo:
+                await regulatory_gap_analysis(
+                    AircraftModel.E175, Country.BRAZIL, Country.USA, EnhancedComplianceService(session)
+                )
+
+        assert excinfo.value.status_code == 400
+
+
+class TestGapRuleBook:
+    """Test the compiled gap rule table."""
+
+    def test_country_aliases_select_target_rules(self):
+        result = gap_rules.analyze("E175", "BRAZIL", "USA")
+
+        assert result["analysis"]["targetCountry"] == "Estados Unidos (FAA)"
+        assert [gap["requirement"] for gap in result["gaps"]] == [
+            "FAA Type Certificate or Validation", "FAR Part 36 Noise Certificate", "EPA Emission Compliance"
+        ]
+        assert result["summary"]["estimatedCostRange"] == "$325,000 - $1,225,000"
+        assert result["regulatoryContext"]["bilateralAgreements"]["hasBilateralAgreement"] is True
+
+    def test_model_family_rule_escalates_risk(self):
+        summary = gap_rules.analyze("KC-390", "BR", "US")["summary"]
+
+        assert summary["criticalGaps"] == 1
+        assert summary["overallRisk"] == "critical"
+        assert summary["estimatedTimeline"] == "12-24 months"
+
+    def test_origin_dependent_status_and_overrides(self):
+        from_us = gap_rules.analyze("E190", "US", "CA")
+        from_ar = gap_rules.analyze("E190", "AR", "CA")
+
+        assert from_us["gaps"][1]["current_status"] == "Available"
+        assert from_us["summary"]["overallRisk"] == "low"
+        assert from_us["recommendations"] == ["Leverage BASA agreement for expedited certification"]
+        assert from_ar["gaps"][1]["current_status"] == "Not Available"
+        assert from_ar["summary"]["overallRisk"] == "medium"
+
+    def test_unknown_target_has_no_gaps(self):
+        result = gap_rules.analyze("E175", "BR", "XX")
+
+        assert result["gaps"] == [] and result["summary"]["estimatedCostRange"] == "$0 - $0"
+        assert result["analysis"]["targetCountry"] == "XX (Unknown)"
+        assert result["regulatoryContext"]["targetFramework"]["authority"] == "Unknown"
+
+    def test_new_country_is_a_data_change(self):
+        data = json.loads(DEFAULT_RULES_PATH.read_text(encoding="utf-8"))
+        data["countries"]["JP"] = {"name": "Japão", "authority": "JCAB", "aliases": ["JAPAN"]}
+        data["bilateral_agreements"]["pairs"].append(["JP", "US"])
+        data["targets"]["JP"] = {"gaps": [{
+            "category": "Type Certification", "requirement": "JCAB Type Certificate", "status": "Required",
+            "gap_description": "JCAB validation", "impact": "high", "estimated_effort": "6-9 months",
+            "cost": [100000, 400000]
+        }]}
+        book = GapRuleBook(data)
+
+        result = book.analyze("E195", "USA", "JAPAN")
+        assert result["analysis"]["targetCountry"] == "Japão (JCAB)"
+        assert result["summary"]["estimatedCostRange"] == "$100,000 - $400,000"
+        assert result["regulatoryContext"]["bilateralAgreements"]["hasBilateralAgreement"] is True
+
+    def test_responses_do_not_share_mutable_state(self):
+        first = gap_rules.analyze("E175", "BR", "EU")
+        first["gaps"][0]["current_status"] = "changed"
+        first["regulatoryContext"]["targetFramework"]["strengths"].append("changed")
+
+        second = gap_rules.analyze("E175", "BR", "EU")
+        assert second["gaps"][0]["current_status"] == "Missing"
+        assert "changed" not in second["regulatoryContext"]["targetFramework"]["strengths"]
+
+
+class TestGapMatrix:
+    """Test the all-pairs gap matrix."""
+
+    def test_cells_follow_columns_and_skip_diagonal(self):
+        matrix = gap_rules.matrix("E175", ["BRAZIL", "USA"], ["USA", "CANADA"], unavailable={"CANADA"})
+        cell = dict(zip(MATRIX_COLUMNS, matrix["cells"][0][0]))
+
+        assert cell == {
+            "totalGaps": 3, "criticalGaps": 0, "highImpactGaps": 1, "overallRisk": "medium",
+            "estimatedTimeline": "6-12 months", "costMin": 325000, "costMax": 1225000,
+            "hasBilateralAgreement": True,
+        }
+        assert matrix["cells"][1][0] is None
+        assert matrix["cells"][0][1] is None and matrix["cells"][1][1] is None
+
+    async def test_each_model_and_country_is_validated_once(self, sqlite_session_factory):
+        calls = []
+
+        async def fake_validate(self, model, country):
+            calls.append((model, country))
+            if country == "UK":
+                raise unsupported_country(country)
+
+        async def fail_check(self, model, country):
+            raise AssertionError("gap matrices must not run compliance checks")
+
+        async with sqlite_session_factory() as session:
+            service = EnhancedComplianceService(session)
+            with patch.object(EnhancedComplianceService, "validate_input", fake_validate), \
+                 patch.object(EnhancedComplianceService, "check_compliance", fail_check):
+                result = await _gap_matrices(
+                    service, [AircraftModel.E175, AircraftModel.E190], None, [Country.USA, Country.UK]
+                )
+
+        assert sorted(calls) == sorted((model, country) for model in ("E175", "E190") for country in [c.value for c in Country])
+        e175 = result["matrices"][0]
+        assert e175["origins"] == [c.value for c in Country] and e175["targets"] == ["USA", "UK"]
+        assert set(e175["errors"]) == {"UK"}
+        assert e175["cells"][1][0] is not None
+        assert all(row[1] is None for row in e175["cells"])
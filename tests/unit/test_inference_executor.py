@@ -0,0 +1,57 @@
+"""
+Unit tests for the bounded AI inference executor.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.exceptions import InferenceUnavailableError
+from src.services.inference_executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(max_workers=1, max_queue=1, timeout_seconds=5)
+    yield executor
+    executor.shutdown()
+
+
+class TestInferenceExecutor:
+    """Test off-loop execution, backpressure and timeouts."""
+
+    async def test_runs_off_the_event_loop(self, executor):
+        loop_thread = threading.get_ident()
+        worker_thread = await executor.run("test", threading.get_ident)
+        assert worker_thread != loop_thread
+        assert executor.in_flight == 0
+
+    async def test_rejects_when_saturated(self, executor):
+        release = threading.Event()
+        running = asyncio.ensure_future(executor.run("test", release.wait, 5))
+        queued = asyncio.ensure_future(executor.run("test", lambda: "queued"))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(InferenceUnavailableError) as error:
+            await executor.run("test", lambda: "rejected")
+        assert error.value.status_code == 503
+        assert error.value.context["reason"] == "saturated"
+
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+
+    async def test_timeout_keeps_slot_until_worker_finishes(self, executor):
+        release = threading.Event()
+        with pytest.raises(InferenceUnavailableError) as error:
+            await executor.run("test", release.wait, 5, timeout=0.05)
+        assert error.value.context["reason"] == "timeout"
+        assert executor.in_flight == 1
+
+        release.set()
+        for _ in range(50):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
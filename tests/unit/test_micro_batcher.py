@@ -0,0 +1,61 @@
+"""
+Unit tests for micro-batching of AI inference requests.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.inference_executor import InferenceExecutor
+from src.services.micro_batcher import MicroBatcher
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(max_workers=1, max_queue=4, timeout_seconds=5)
+    yield executor
+    executor.shutdown()
+
+
+class TestMicroBatcher:
+    """Test batching windows and result scattering."""
+
+    async def test_concurrent_requests_share_one_batch(self, executor):
+        batches = []
+
+        def upper(items):
+            batches.append(list(items))
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher("upper", upper, max_batch_size=8, max_wait_ms=50, executor=executor)
+        results = await asyncio.gather(*(batcher.submit(word) for word in ["a", "b", "c"]))
+
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b", "c"]]
+
+    async def test_batch_size_limit_splits_batches(self, executor):
+        batches = []
+
+        def identity(items):
+            batches.append(len(items))
+            return items
+
+        batcher = MicroBatcher("identity", identity, max_batch_size=2, max_wait_ms=50, executor=executor)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == list(range(5))
+        assert batches == [2, 2, 1]
+
+    async def test_errors_reach_every_caller(self, executor):
+        def broken(items):
+            raise RuntimeError("forward pass failed")
+
+        batcher = MicroBatcher("broken", broken, max_batch_size=4, max_wait_ms=10, executor=executor)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_result_count_mismatch_is_an_error(self, executor):
+        batcher = MicroBatcher("short", lambda items: items[:-1], max_wait_ms=10, executor=executor)
+        with pytest.raises(RuntimeError):
+            await batcher.submit("lost")
@@ -0,0 +1,58 @@
+"""
+Unit tests for versioned model snapshots and checksum verification.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.model_artifacts import (
+    CURRENT_FILENAME, ModelArtifactError, artifact_root, pretrained_kwargs,
+    resolve_model_path, verify_artifact, write_manifest,
+)
+
+
+MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = artifact_root(MODEL_ID, tmp_path) / "abc123"
+    (path / "1_Pooling").mkdir(parents=True)
+    (path / "config.json").write_text('{"hidden_size": 384}')
+    (path / "model.safetensors").write_bytes(b"\x00" * 64)
+    (path / "1_Pooling" / "config.json").write_text('{"pooling_mode_mean_tokens": true}')
+    write_manifest(path, MODEL_ID, "abc123")
+    (path.parent / CURRENT_FILENAME).write_text("abc123")
+    return path
+
+
+class TestModelArtifacts:
+    """Test manifests, verification and path resolution."""
+
+    def test_manifest_covers_nested_files(self, snapshot):
+        manifest = verify_artifact(snapshot)
+        assert sorted(manifest["files"]) == ["1_Pooling/config.json", "config.json", "model.safetensors"]
+
+    def test_tampered_weights_fail_verification(self, snapshot):
+        (snapshot / "model.safetensors").write_bytes(b"\x01" * 64)
+        with pytest.raises(ModelArtifactError, match="checksum mismatch"):
+            verify_artifact(snapshot)
+
+    def test_resolves_current_snapshot(self, snapshot, tmp_path):
+        with patch("src.services.model_artifacts.settings.ai_model_artifacts_dir", str(tmp_path)):
+            path = resolve_model_path(MODEL_ID)
+        assert path == str(snapshot)
+        assert pretrained_kwargs(path) == {"use_safetensors": True, "local_files_only": True}
+
+    def test_missing_snapshot_is_an_error_only_offline(self, tmp_path):
+        with patch("src.services.model_artifacts.settings.ai_model_artifacts_dir", str(tmp_path)):
+            assert resolve_model_path("google/flan-t5-small") == "google/flan-t5-small"
+            with patch("src.services.model_artifacts.settings.ai_models_offline", True):
+                with pytest.raises(ModelArtifactError, match="offline"):
+                    resolve_model_path("google/flan-t5-small")
+
+    def test_without_artifacts_dir_hub_id_is_used(self):
+        with patch("src.services.model_artifacts.settings.ai_model_artifacts_dir", None):
+            assert resolve_model_path(MODEL_ID) == MODEL_ID
+        assert pretrained_kwargs(MODEL_ID) == {}
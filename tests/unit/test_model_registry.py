@@ -0,0 +1,70 @@
+"""
+Unit tests for background AI model loading.
+"""
+
+import threading
+
+from src.services.aviation_ai_service import AviationAIAnalyzer
+from src.services.model_registry import ModelRegistry, ModelState
+
+
+class TestModelRegistry:
+    """Test background loading, readiness and failure reporting."""
+
+    def test_models_are_unavailable_until_loaded(self):
+        release = threading.Event()
+        registry = ModelRegistry()
+        registry.register("slow", "fake/slow", lambda: release.wait(5) and "slow-model")
+
+        assert registry.status()["status"] == "not_started"
+        assert registry.start()
+        assert not registry.start()
+        assert registry.get("slow") is None
+        assert registry.status()["status"] == "loading"
+
+        release.set()
+        assert registry.wait(5)
+        assert registry.get("slow") == "slow-model"
+        assert registry.all_ready
+        assert registry.status()["status"] == "ready"
+
+    def test_failed_model_is_reported_with_load_time(self):
+        def broken():
+            raise RuntimeError("weights missing")
+
+        registry = ModelRegistry()
+        registry.register("ok", "fake/ok", lambda: "ok-model")
+        registry.register("broken", "fake/broken", broken)
+        registry.start()
+        assert registry.wait(5)
+
+        status = registry.status()
+        assert status["status"] == "degraded"
+        assert status["models"]["ok"]["state"] == ModelState.READY.value
+        assert status["models"]["ok"]["load_seconds"] is not None
+        assert status["models"]["broken"]["state"] == ModelState.FAILED.value
+        assert status["models"]["broken"]["error"] == "weights missing"
+        assert registry.any_failed and not registry.all_ready
+
+
+class TestAnalyzerReadiness:
+    """Test that the analyzer never blocks on model loading."""
+
+    def test_construction_does_not_load_models(self):
+        analyzer = AviationAIAnalyzer()
+        assert not analyzer.registry.started
+        assert not analyzer.models_loaded
+        assert analyzer.model_status()["serving"] == "rule_based_fallback"
+
+    async def test_serves_fallback_while_models_load(self):
+        release = threading.Event()
+        analyzer = AviationAIAnalyzer()
+        analyzer.registry = ModelRegistry()
+        analyzer.registry.register("compliance_classifier", "fake/slow", lambda: release.wait(5))
+        analyzer.registry.start()
+
+        result = await analyzer.analyze_compliance_with_ai("e190", "US")
+
+        release.set()
+        assert result["aiAnalysis"]["fallback_used"]
+        assert result["aiAnalysis"]["model_info"]["compliance_classifier"] == "rule_based"
@@ -0,0 +1,94 @@
+"""
+Unit tests for the aircraft designation resolver.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.compliance import AircraftModel
+from src.models.designations import STATIC_DESIGNATIONS
+from src.repositories import AircraftModelRepository
+from src.services.model_resolver import ModelResolver, model_resolver, normalize_designation
+
+
+ROWS = [
+    ("id-e1", "E175", "E175-E1"),
+    ("id-e2", "E175", "E175-E2"),
+    ("id-190", "E190-E2", "E2"),
+    ("id-737", "737", "800"),
+]
+
+
+@pytest.fixture
+def resolver():
+    resolver = ModelResolver(ttl_seconds=0)
+    resolver.build(ROWS)
+    return resolver
+
+
+class TestModelResolver:
+    """Test trie lookups, aliases and family resolution."""
+
+    def test_normalize_ignores_case_and_separators(self):
+        assert normalize_designation(" e175_e2 ") == normalize_designation("E175-E2") == "E175E2"
+
+    def test_family_resolves_to_all_variants(self, resolver):
+        resolution = resolver.lookup("E175")
+        assert resolution.level == "family"
+        assert resolution.model_ids == {"id-e1", "id-e2"}
+
+    def test_variant_resolves_to_single_row(self, resolver):
+        assert resolver.lookup("e175 e2").model_ids == {"id-e2"}
+        assert resolver.lookup("E190-E2").model_ids == {"id-190"}
+
+    def test_partial_prefix_is_not_a_match(self, resolver):
+        assert resolver.lookup("E17") is None
+        assert resolver.lookup("E175-E") is None
+
+    def test_aliases(self, resolver):
+        assert resolver.lookup("B737").code == "737"
+        assert resolver.lookup("Boeing 737").model_ids == {"id-737"}
+        assert resolver.lookup("B737-800").model_ids == {"id-737"}
+        assert resolver.lookup("C-390").code == "KC-390"
+        assert resolver.lookup("Phenom 300").code == "PHENOM-300E"
+
+    def test_static_designations_are_known_without_rows(self):
+        resolver = ModelResolver(ttl_seconds=0)
+        resolver.build([])
+        assert not resolver.has_aircraft
+        assert resolver.lookup("A320neo").model_ids == set()
+
+    def test_api_models_are_static_designations(self):
+        assert {member.value for member in AircraftModel} <= set(STATIC_DESIGNATIONS)
+
+    def test_lock_is_created_per_event_loop(self):
+        resolver = ModelResolver(ttl_seconds=0)
+        assert resolver._lock is None
+
+        async def load_lock():
+            return resolver._loop_lock()
+
+        first, second = asyncio.run(load_lock()), asyncio.run(load_lock())
+        assert first is not second
+
+    def test_suggest(self, resolver):
+        assert resolver.suggest("E175") == ["E175", "E175-E1", "E175-E2"]
+
+
+class TestResolverInvalidation:
+    """Test that aircraft writes invalidate the global resolver."""
+
+    async def test_create_invalidates(self, sqlite_session_factory):
+        model_resolver.invalidate()
+        async with sqlite_session_factory() as session:
+            assert await model_resolver.resolve(session, "E195-E2") is not None
+            assert not (await model_resolver.resolve(session, "E195-E2")).model_ids
+
+            created = await AircraftModelRepository(session).create(
+                manufacturer="Embraer", model="E195", variant="E195-E2"
+            )
+            resolution = await model_resolver.resolve(session, "E195-E2")
+
+        assert resolution.model_ids == {created.id}
+        model_resolver.invalidate()
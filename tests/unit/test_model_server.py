@@ -0,0 +1,117 @@
+"""
+Unit tests for the model server sidecar and its client proxies.
+"""
+
+import asyncio
+import socket
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.exceptions import InferenceUnavailableError
+from src.services.inference_executor import InferenceExecutor
+from src.services.model_registry import ModelRegistry
+from src.services.model_server import ModelServer, ModelServerClient, RemoteModel
+
+
+class FakeEncoder:
+    def encode(self, texts):
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+def fake_classifier(texts, **kwargs):
+    return [[{"label": text.upper(), "score": 0.5}] for text in texts]
+
+
+@pytest.fixture
+async def server(tmp_path):
+    registry = ModelRegistry()
+    registry.register("compliance_classifier", "fake/classifier", lambda: fake_classifier)
+    registry.register("similarity_model", "fake/encoder", FakeEncoder)
+    registry.register("broken", "fake/broken", lambda: 1 / 0)
+    executor = InferenceExecutor(max_workers=1, max_queue=4, timeout_seconds=5)
+
+    server = ModelServer(str(tmp_path / "m.sock"), registry=registry, executor=executor)
+    await server.start()
+    registry.wait(5)
+    yield server
+    await server.close()
+    executor.shutdown()
+
+
+class TestModelServer:
+    """Test inference round trips over the Unix socket."""
+
+    async def test_proxies_match_local_call_shapes(self, server):
+        client = ModelServerClient(server.socket_path)
+        classifier = RemoteModel(client, "compliance_classifier")
+        encoder = RemoteModel(client, "similarity_model")
+
+        labels = await asyncio.to_thread(classifier, ["e190", "kc390"])
+        embeddings = await asyncio.to_thread(encoder.encode, ["ab", "abcd"])
+
+        assert labels == [[{"label": "E190", "score": 0.5}], [{"label": "KC390", "score": 0.5}]]
+        assert embeddings.dtype == np.float32
+        assert embeddings.tolist() == [[2.0, 1.0], [4.0, 1.0]]
+
+    async def test_unavailable_model_raises_inference_error(self, server):
+        client = ModelServerClient(server.socket_path)
+        with pytest.raises(InferenceUnavailableError):
+            await asyncio.to_thread(client.call, "broken", ["x"])
+
+    async def test_wait_until_ready(self, server):
+        client = ModelServerClient(server.socket_path)
+        await asyncio.to_thread(client.wait_until_ready, "similarity_model", 1)
+        with pytest.raises(RuntimeError):
+            await asyncio.to_thread(client.wait_until_ready, "broken", 1)
+
+
+class _DeadSocket:
+    """Connection whose send or receive fails like a broken or stalled sidecar."""
+
+    def __init__(self, send_error=None, recv_error=None):
+        self.send_error, self.recv_error = send_error, recv_error
+        self.sent = 0
+
+    def sendall(self, frame):
+        self.sent += 1
+        if self.send_error:
+            raise self.send_error
+
+    def recv_into(self, view, length):
+        raise self.recv_error
+
+    def close(self):
+        pass
+
+
+class TestModelServerClientRetry:
+    """Test that only requests the sidecar never read are retried."""
+
+    async def test_stale_connection_is_retried(self, server):
+        client = ModelServerClient(server.socket_path)
+        client._local.sock = _DeadSocket(send_error=BrokenPipeError())
+
+        labels = await asyncio.to_thread(client.call, "compliance_classifier", ["e175"])
+
+        assert labels == [[{"label": "E175", "score": 0.5}]]
+
+    def test_timeout_after_send_is_not_retried(self, tmp_path):
+        client = ModelServerClient(str(tmp_path / "missing.sock"))
+        stalled = _DeadSocket(recv_error=socket.timeout("timed out"))
+        client._local.sock = stalled
+
+        with pytest.raises(TimeoutError):
+            client.call("compliance_classifier", ["e175"])
+
+        assert stalled.sent == 1 and client._local.sock is None
+
+    def test_refused_connection_fails_after_one_retry(self, tmp_path):
+        client = ModelServerClient(str(tmp_path / "missing.sock"))
+
+        with patch.object(client, "_connection", wraps=client._connection) as connect, \
+             pytest.raises(FileNotFoundError):
+            client.status()
+
+        assert connect.call_count == 2
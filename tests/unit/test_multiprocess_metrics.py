@@ -0,0 +1,105 @@
+"""
+Unit tests for merging metrics across worker processes.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from src.middleware import performance
+from src.middleware.performance import MultiprocessMetricsStore, PerformanceMetrics, get_metrics
+
+
+def _worker_snapshot(requests):
+    worker = PerformanceMetrics()
+    for endpoint, seconds, status in requests:
+        worker.record_request(endpoint, "GET", seconds, status)
+    return worker.snapshot()
+
+
+class TestMergedPerformanceMetrics:
+    """Test the JSON metrics aggregator."""
+
+    def test_counters_sum_and_samples_pool(self):
+        merged = PerformanceMetrics.merged([
+            _worker_snapshot([("/a", 0.1, 200), ("/a", 0.3, 500)]),
+            _worker_snapshot([("/a", 0.2, 200), ("/b", 0.4, 200)]),
+        ])
+
+        endpoint = merged.get_endpoint_metrics("/a", "GET")
+        assert endpoint["request_count"] == 3 and endpoint["error_count"] == 1
+        assert endpoint["status_codes"] == {200: 2, 500: 1}
+        assert endpoint["max_response_time"] == 0.3
+        system = merged.get_system_metrics()
+        assert system["total_requests"] == 4 and system["workers"] == 2
+
+    def test_store_publishes_per_worker_and_merges_on_read(self, tmp_path):
+        store = MultiprocessMetricsStore(str(tmp_path), interval=60)
+        (tmp_path / "performance_1.json").write_text(
+            json.dumps(_worker_snapshot([("/a", 0.1, 200)])), encoding="utf-8"
+        )
+        local = PerformanceMetrics()
+        local.record_request("/a", "GET", 0.2, 200)
+
+        with patch.object(performance, "metrics_store", store), patch.object(performance, "metrics", local):
+            result = get_metrics()
+
+        assert result["system"]["total_requests"] == 2 and result["system"]["workers"] == 2
+        assert (tmp_path / f"performance_{os.getpid()}.json").exists()
+
+        # Throttled: a second publish within the interval is skipped
+        local.record_request("/a", "GET", 0.3, 200)
+        store.publish(local)
+        assert len(store.load_all()) == 2
+        assert sum(s["request_count"]["GET /a"] for s in store.load_all()) == 2
+
+    def test_retired_worker_is_folded_into_totals(self, tmp_path):
+        store = MultiprocessMetricsStore(str(tmp_path))
+        (tmp_path / "performance_1.json").write_text(
+            json.dumps(_worker_snapshot([("/a", 0.1, 200), ("/a", 0.2, 500)])), encoding="utf-8"
+        )
+        store.retire(1)
+        (tmp_path / "performance_1.json").write_text(
+            json.dumps(_worker_snapshot([("/a", 0.3, 200)])), encoding="utf-8"
+        )
+        store.retire(1)
+
+        assert not (tmp_path / "performance_1.json").exists()
+        merged = PerformanceMetrics.merged(store.load_all())
+        endpoint = merged.get_endpoint_metrics("/a", "GET")
+        assert endpoint["request_count"] == 3 and endpoint["error_count"] == 1
+        assert merged.workers == 0
+
+    def test_snapshots_of_dead_processes_are_ignored(self, tmp_path):
+        store = MultiprocessMetricsStore(str(tmp_path))
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        (tmp_path / f"performance_{dead.pid}.json").write_text(
+            json.dumps(_worker_snapshot([("/a", 0.1, 200)])), encoding="utf-8"
+        )
+        local = PerformanceMetrics()
+        local.record_request("/b", "GET", 0.2, 200)
+        store.publish(local)
+
+        merged = PerformanceMetrics.merged(store.load_all())
+        assert merged.workers == 1
+        assert dict(merged.request_count) == {"GET /b": 1}
+
+
+def test_prometheus_exposition_merges_worker_processes(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    record = (
+        "from src.middleware.prometheus_metrics import record_compliance_check; "
+        "record_compliance_check('E175', 'USA', 'compliant')"
+    )
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", record], env=env, check=True, capture_output=True)
+
+    exposition = subprocess.run(
+        [sys.executable, "-c", "from src.middleware.prometheus_metrics import get_prometheus_metrics; print(get_prometheus_metrics())"],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+
+    assert 'compliance_checks_total{aircraft_model="E175",country="USA",result="compliant"} 2.0' in exposition
@@ -0,0 +1,78 @@
+"""
+Unit tests for the ONNX Runtime inference backend.
+
+The parity tests export the real checkpoints and compare against the torch
+pipelines; they are skipped unless torch, transformers, sentence-transformers
+and onnxruntime are installed.
+"""
+
+import numpy as np
+import pytest
+
+from src.services.onnx_backend import mean_pool, model_dir, softmax
+
+
+class TestOnnxHelpers:
+    """Test the numpy post-processing shared by both ONNX wrappers."""
+
+    def test_softmax_rows_sum_to_one(self):
+        probabilities = softmax(np.array([[1000.0, 1000.0], [0.0, np.log(3.0)]]))
+        assert np.allclose(probabilities.sum(axis=1), 1.0)
+        assert np.allclose(probabilities, [[0.5, 0.5], [0.25, 0.75]])
+
+    def test_mean_pool_ignores_padding(self):
+        hidden = np.array([[[1.0, 1.0], [3.0, 3.0], [100.0, 100.0]]])
+        mask = np.array([[1, 1, 0]])
+        assert np.allclose(mean_pool(hidden, mask), [[2.0, 2.0]])
+
+    def test_model_dir_is_filesystem_safe(self, tmp_path):
+        assert model_dir("sentence-transformers/all-MiniLM-L6-v2", tmp_path).name == (
+            "sentence-transformers__all-MiniLM-L6-v2"
+        )
+
+
+PARITY_TEXTS = [
+    "Aircraft: Embraer E190 seeking certification with FAA",
+    "Military aircraft for civilian operations",
+]
+
+
+@pytest.fixture(scope="module")
+def onnx_dir(tmp_path_factory):
+    for module in ("torch", "transformers", "sentence_transformers", "onnxruntime"):
+        pytest.importorskip(module)
+    from src.services.aviation_ai_service import CLASSIFIER_MODEL_ID, SIMILARITY_MODEL_ID
+    from src.services.onnx_backend import export_model
+
+    base_dir = tmp_path_factory.mktemp("onnx")
+    export_model(CLASSIFIER_MODEL_ID, "classifier", base_dir)
+    export_model(SIMILARITY_MODEL_ID, "encoder", base_dir)
+    return base_dir
+
+
+class TestOnnxParity:
+    """Quantized ONNX outputs must agree with the torch pipelines."""
+
+    def test_classifier_matches_torch(self, onnx_dir):
+        from transformers import pipeline
+        from src.services.aviation_ai_service import CLASSIFIER_MODEL_ID
+        from src.services.onnx_backend import OnnxTextClassifier
+
+        reference = pipeline("text-classification", model=CLASSIFIER_MODEL_ID, return_all_scores=True)(PARITY_TEXTS)
+        quantized = OnnxTextClassifier(model_dir(CLASSIFIER_MODEL_ID, onnx_dir))(PARITY_TEXTS)
+
+        for expected, actual in zip(reference, quantized):
+            assert max(expected, key=lambda s: s["score"])["label"] == max(actual, key=lambda s: s["score"])["label"]
+            for expected_score, actual_score in zip(expected, actual):
+                assert actual_score["score"] == pytest.approx(expected_score["score"], abs=0.05)
+
+    def test_encoder_matches_torch(self, onnx_dir):
+        from sentence_transformers import SentenceTransformer
+        from src.services.aviation_ai_service import SIMILARITY_MODEL_ID
+        from src.services.onnx_backend import OnnxSentenceEncoder
+
+        reference = SentenceTransformer(SIMILARITY_MODEL_ID).encode(PARITY_TEXTS, normalize_embeddings=True)
+        quantized = OnnxSentenceEncoder(model_dir(SIMILARITY_MODEL_ID, onnx_dir)).encode(PARITY_TEXTS)
+
+        cosine = (reference * quantized).sum(axis=1)
+        assert np.all(cosine > 0.98)
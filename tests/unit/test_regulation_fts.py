@@ -0,0 +1,142 @@
+"""
+Unit tests for the SQLite FTS5 regulation index.
+"""
+
+from sqlalchemy import text
+
+from src.models.db_models_sqlite import Authority, Regulation
+from src.repositories.regulation import RegulationRepository
+from src.models.regulation_fts import build_match_query
+from src.services.regulation_fts import ensure_fts_index
+
+
+async def _seed(session, count=0):
+    faa = Authority(code="FAA", name="Federal Aviation Administration")
+    easa = Authority(code="EASA", name="European Union Aviation Safety Agency")
+    session.add_all([faa, easa])
+    await session.flush()
+    session.add_all([
+        Regulation(authority_id=faa.id, reference="14 CFR 25.981", title="Fuel tank ignition prevention",
+                   description="Prevention of ignition sources inside fuel tanks", category="safety"),
+        Regulation(authority_id=faa.id, reference="14 CFR 25.807", title="Emergency exits",
+                   description="Number and location of emergency exits; fuel jettison is covered elsewhere",
+                   category="safety"),
+        Regulation(authority_id=easa.id, reference="CS 25.981", title="Fuel tank ignition prevention",
+                   description="Ignition sources in fuel tank systems", category="safety"),
+    ])
+    for index in range(count):
+        session.add(Regulation(authority_id=easa.id, reference=f"CS 25.{index}", title=f"Noise {index}",
+                               description="Noise certification standard", category="environmental"))
+    await session.commit()
+
+
+class TestBuildMatchQuery:
+    """Test sanitization of user input into MATCH expressions."""
+
+    def test_operators_are_quoted_and_last_term_is_prefix(self):
+        assert build_match_query('fuel OR "tank" NEAR(ign') == '"fuel" "OR" "tank" "NEAR" "ign"*'
+
+    def test_query_without_words_is_empty(self):
+        assert build_match_query("* - ()") == ""
+
+
+class TestRegulationFullTextSearch:
+    """Test ranking, highlighting, pagination and trigger sync."""
+
+    async def test_ranks_title_matches_above_description_mentions(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await ensure_fts_index(session)
+            await _seed(session)
+            hits, total = await RegulationRepository(session).full_text_search("fuel")
+
+        assert total == 3
+        assert hits[-1]["reference"] == "14 CFR 25.807"
+        assert hits[0]["rank"] >= hits[1]["rank"] >= hits[2]["rank"]
+        assert "<mark>Fuel</mark>" in hits[0]["title_highlight"]
+        assert "<mark>fuel</mark>" in hits[-1]["snippet"]
+
+    async def test_filters_and_pagination(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await ensure_fts_index(session)
+            await _seed(session, count=25)
+            repo = RegulationRepository(session)
+
+            faa_hits, faa_total = await repo.full_text_search("ignition", authority_code="faa")
+            page, total = await repo.full_text_search("noise", limit=10, offset=20)
+            prefix_hits, _ = await repo.full_text_search("ignit")
+
+        assert faa_total == 1 and faa_hits[0]["authority"] == "FAA"
+        assert total == 25 and len(page) == 5
+        assert len(prefix_hits) == 2
+
+    async def test_triggers_follow_updates_and_deletes(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await ensure_fts_index(session)
+            await _seed(session)
+            repo = RegulationRepository(session)
+            exits = await repo.get_by_reference("14 CFR 25.807")
+            await repo.update(exits.id, title="Evacuation slides")
+            fuel = await repo.get_by_reference("14 CFR 25.981")
+            await repo.delete(fuel.id)
+
+            slides = await repo.search_regulations("evacuation")
+            _, fuel_total = await repo.full_text_search("fuel tank ignition")
+
+        assert [regulation.id for regulation in slides] == [exits.id]
+        assert fuel_total == 1
+
+    async def test_backfills_rows_written_before_the_index(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await _seed(session)
+            assert await ensure_fts_index(session) is True
+            assert await ensure_fts_index(session) is False
+            indexed = await session.scalar(text("SELECT count(*) FROM regulations_fts"))
+
+        assert indexed == 3
+
+    async def test_rows_follow_regulation_ids_when_rowids_are_renumbered(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await ensure_fts_index(session)
+            await _seed(session)
+            # VACUUM may renumber the implicit rowid of a table with a string primary key
+            for trigger in ("regulations_fts_insert", "regulations_fts_delete", "regulations_fts_update"):
+                await session.execute(text(f"DROP TRIGGER {trigger}"))
+            await session.execute(text("UPDATE regulations SET rowid = 1000 - rowid"))
+            assert await ensure_fts_index(session) is False
+
+            repo = RegulationRepository(session)
+            exits = await repo.get_by_reference("14 CFR 25.807")
+            await repo.update(exits.id, title="Evacuation slides")
+            hits, _ = await repo.full_text_search("evacuation")
+            _, fuel_total = await repo.full_text_search("fuel tank ignition")
+            indexed = await session.scalar(text("SELECT count(*) FROM regulations_fts"))
+
+        assert [hit["id"] for hit in hits] == [exits.id]
+        assert fuel_total == 2 and indexed == 3
+
+    async def test_rebuilds_when_ids_drift_at_the_same_count(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await _seed(session)
+            await ensure_fts_index(session)
+            await session.execute(text("DROP TRIGGER regulations_fts_insert"))
+            await session.execute(text("DROP TRIGGER regulations_fts_delete"))
+            await session.execute(text("DELETE FROM regulations WHERE reference = '14 CFR 25.807'"))
+            authority_id = await session.scalar(text("SELECT id FROM authorities WHERE code = 'EASA'"))
+            session.add(Regulation(id="new-regulation", authority_id=authority_id, reference="CS 25.807",
+                                   title="Emergency exits", description="Exit sizes"))
+            await session.flush()
+
+            assert await ensure_fts_index(session) is True
+            hits, _ = await RegulationRepository(session).full_text_search("exits")
+
+        assert [hit["id"] for hit in hits] == ["new-regulation"]
+
+    async def test_replaces_rowid_keyed_index(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            await session.execute(text("CREATE VIRTUAL TABLE regulations_fts USING fts5(reference, title, description, content_text)"))
+            await _seed(session)
+
+            assert await ensure_fts_index(session) is True
+            hits, total = await RegulationRepository(session).full_text_search("fuel")
+
+        assert total == 3 and all(hit["id"] for hit in hits)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the streaming regulation importer.
+"""
+
+import io
+import json
+
+import pytest
+from sqlalchemy import select
+
+from src.models.db_models_sqlite import Authority, Regulation
+from src.services.regulation_importer import (
+    MAX_BATCH_SIZE,
+    RegulationImporter,
+    _RecentKeys,
+    iter_csv_records,
+    iter_json_array,
+    iter_json_lines,
+)
+
+
+RECORDS = [
+    {"authority": "FAA", "reference": "14 CFR 25.562", "description": "Emergency landing", "applicability": ["E175"]},
+    {"authority": "ANAC", "description": "RBAC 21 - Certificação", "applicability": ["E190", "E195"]},
+    {"authority": "FAA", "reference": "14 CFR 25.562", "description": "Duplicate entry", "applicability": ["E175"]},
+    {"authority": "XYZ", "reference": "X-1", "description": "Unknown authority", "applicability": []},
+    {"authority": "FAA", "reference": "broken"},
+]
+
+
+class TestParsers:
+    """Test the incremental record parsers."""
+
+    def test_json_array_small_chunks(self):
+        """Records split across chunk boundaries are reassembled."""
+        stream = io.StringIO(json.dumps(RECORDS, ensure_ascii=False))
+        parsed = list(iter_json_array(stream, chunk_size=7))
+        assert parsed == RECORDS
+
+    def test_json_array_empty(self):
+        assert list(iter_json_array(io.StringIO("  [ ] "))) == []
+
+    def test_json_array_rejects_object(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('{"authority": "FAA"}')))
+
+    def test_json_lines_skips_blank_lines(self):
+        stream = io.StringIO("\n".join(json.dumps(r) for r in RECORDS[:2]) + "\n\n")
+        assert len(list(iter_json_lines(stream))) == 2
+
+    def test_csv_splits_applicability(self):
+        stream = io.StringIO(
+            "authority,reference,description,applicability\n"
+            'FAA,AD 2025-15-E2,Wing inspection,"E175-E2;E190-E2|E195-E2"\n'
+        )
+        (record,) = list(iter_csv_records(stream))
+        assert record["applicability"] == ["E175-E2", "E190-E2", "E195-E2"]
+
+
+class TestRegulationImporter:
+    """Test importing into a real SQLite database."""
+
+    @pytest.fixture
+    async def session_factory(self, sqlite_session_factory):
+        async with sqlite_session_factory() as session:
+            session.add_all([
+                Authority(code="FAA", name="Federal Aviation Administration"),
+                Authority(code="ANAC", name="Agência Nacional de Aviação Civil"),
+            ])
+            await session.commit()
+        return sqlite_session_factory
+
+    async def test_import_dedupes_and_validates(self, session_factory):
+        importer = RegulationImporter(session_factory=session_factory, batch_size=2)
+        stats = await importer.import_stream(io.StringIO(json.dumps(RECORDS)), "json")
+
+        assert stats.read == 5
+        assert stats.invalid == 1
+        assert stats.unknown_authority == 1
+        assert stats.duplicates == 1
+        assert stats.written == 2
+
+        async with session_factory() as session:
+            rows = (await session.execute(select(Regulation).order_by(Regulation.reference))).scalars().all()
+        assert [r.reference for r in rows] == ["14 CFR 25.562", "RBAC 21 - Certificação"]
+        assert rows[0].content["applicable_models"] == ["E175"]
+
+    async def test_reimport_upserts(self, session_factory):
+        importer = RegulationImporter(session_factory=session_factory)
+        await importer.import_stream(io.StringIO(json.dumps(RECORDS[0])), "jsonl")
+        updated = dict(RECORDS[0], description="Emergency landing (amended)")
+        stats = await importer.import_stream(io.StringIO(json.dumps(updated)), "jsonl")
+
+        assert stats.written == 1
+        async with session_factory() as session:
+            rows = (await session.execute(select(Regulation))).scalars().all()
+        assert len(rows) == 1
+        assert rows[0].description == "Emergency landing (amended)"
+
+    async def test_reference_is_the_key_across_authorities(self, session_factory):
+        records = [
+            {"authority": "FAA", "reference": "AD 1", "description": "FAA directive", "applicability": []},
+            {"authority": "ANAC", "reference": "AD 1", "description": "ANAC directive", "applicability": []},
+        ]
+        stats = await RegulationImporter(session_factory=session_factory).import_stream(
+            io.StringIO("\n".join(json.dumps(record) for record in records)), "jsonl"
+        )
+
+        assert stats.written == 1 and stats.duplicates == 1
+        async with session_factory() as session:
+            rows = (await session.execute(select(Regulation))).scalars().all()
+        assert [row.description for row in rows] == ["FAA directive"]
+
+    async def test_malformed_json_line_is_skipped(self, session_factory):
+        lines = [json.dumps(RECORDS[0]), '{"authority": "FAA", "reference"', json.dumps(RECORDS[1])]
+        stats = await RegulationImporter(session_factory=session_factory).import_stream(
+            io.StringIO("\n".join(lines)), "jsonl"
+        )
+
+        assert stats.read == 3 and stats.malformed == 1 and stats.written == 2
+
+    def test_batch_size_is_capped_by_bind_parameters(self):
+        assert RegulationImporter(batch_size=5000).batch_size == MAX_BATCH_SIZE
+        assert MAX_BATCH_SIZE * len(Regulation.__table__.columns) <= 32766
+
+    def test_dedupe_window_is_bounded(self):
+        keys = _RecentKeys(4)
+        for key in (b"a", b"b", b"c", b"d", b"e"):
+            keys.add(key)
+        assert b"a" not in keys and b"e" in keys and b"c" in keys
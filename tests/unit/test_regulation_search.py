@@ -0,0 +1,123 @@
+"""
+Unit tests for the semantic regulation search index.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import numpy as np
+
+from src.models.db_models_sqlite import Authority, Regulation
+from src.repositories.regulation import RegulationRepository
+from src.services.regulation_search import (
+    HASHING_ENCODER_ID, HashingEncoder, RegulationSearchIndex, regulation_search_index,
+)
+
+
+REGULATIONS = [
+    ("14 CFR 25.1309", "Equipment, systems and installations", "System safety assessment of aircraft equipment failures"),
+    ("14 CFR 25.807", "Emergency exits", "Number and location of passenger emergency exits"),
+    ("14 CFR 25.981", "Fuel tank ignition prevention", "Prevention of ignition sources inside fuel tanks"),
+]
+
+
+async def _seed(session_factory):
+    async with session_factory() as session:
+        authority = Authority(code="FAA", name="Federal Aviation Administration")
+        session.add(authority)
+        await session.flush()
+        for reference, title, description in REGULATIONS:
+            session.add(Regulation(authority_id=authority.id, reference=reference, title=title, description=description))
+        await session.commit()
+
+
+class TestHashingEncoder:
+    """Test the dependency-free fallback encoder."""
+
+    def test_rows_are_normalized_and_deterministic(self):
+        encoder = HashingEncoder(dim=64)
+        first = encoder.encode(["fuel tank ignition", "emergency exits"])
+        assert first.shape == (2, 64)
+        assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+        assert np.array_equal(first, encoder.encode(["fuel tank ignition", "emergency exits"]))
+
+
+class TestRegulationSearchIndex:
+    """Test ranking, persistence and incremental updates."""
+
+    async def test_search_ranks_matching_regulation_first(self, sqlite_session_factory, tmp_path):
+        await _seed(sqlite_session_factory)
+        index = RegulationSearchIndex(str(tmp_path / "index"))
+        async with sqlite_session_factory() as session:
+            results = await index.search(session, "ignition sources in fuel tanks", k=2)
+            regulations = await RegulationRepository(session).get_by_ids([results[0][0]])
+
+        assert index.encoder_id == HASHING_ENCODER_ID
+        assert len(results) == 2
+        assert regulations[0].reference == "14 CFR 25.981"
+        assert regulations[0].authority.code == "FAA"
+
+    async def test_persisted_index_is_reused(self, sqlite_session_factory, tmp_path):
+        await _seed(sqlite_session_factory)
+        async with sqlite_session_factory() as session:
+            assert (await RegulationSearchIndex(str(tmp_path)).sync(session))["encoded"] == 3
+
+            reloaded = RegulationSearchIndex(str(tmp_path))
+            assert reloaded.load() and len(reloaded) == 3
+            assert (await reloaded.sync(session))["encoded"] == 0
+
+    async def test_sync_encodes_only_changed_and_drops_removed(self, sqlite_session_factory, tmp_path):
+        await _seed(sqlite_session_factory)
+        index = RegulationSearchIndex(str(tmp_path))
+        async with sqlite_session_factory() as session:
+            await index.sync(session)
+            repo = RegulationRepository(session)
+            exits = await repo.get_by_reference("14 CFR 25.807")
+            fuel = await repo.get_by_reference("14 CFR 25.981")
+            await repo.update(exits.id, description="Evacuation slides and exit signs")
+            await repo.delete(fuel.id)
+
+            stats = await index.sync(session)
+            results = await index.search(session, "evacuation slides", k=1)
+
+        assert stats == {"encoded": 1, "removed": 1, "total": 2}
+        assert results[0][0] == exits.id
+
+    async def test_query_uses_the_encoder_the_vectors_were_built_with(self, sqlite_session_factory, tmp_path):
+        await _seed(sqlite_session_factory)
+        index = RegulationSearchIndex(str(tmp_path))
+        hashing = (HASHING_ENCODER_ID, index._hashing_encoder)
+        # The sentence model finishes loading right after ensure_fresh released the lock
+        loaded = ("fake/sentence-model", HashingEncoder(dim=8))
+
+        async with sqlite_session_factory() as session:
+            with patch.object(index, "current_encoder", side_effect=[hashing, loaded, loaded]):
+                first = await index.search(session, "ignition sources in fuel tanks", k=1)
+                second = await index.search(session, "ignition sources in fuel tanks", k=1)
+
+        assert first[0][0] == second[0][0]
+        assert index.encoder_id == "fake/sentence-model"
+
+
+class TestRepositoryNotifications:
+    """Test that regulation writes reach the index without the repository importing it."""
+
+    async def test_write_marks_global_index_stale(self, sqlite_session_factory):
+        regulation_search_index._stale = False
+        async with sqlite_session_factory() as session:
+            authority = Authority(code="ANAC", name="Agência Nacional de Aviação Civil")
+            session.add(authority)
+            await session.flush()
+            await RegulationRepository(session).create(authority_id=authority.id, reference="RBAC 25", title="Airworthiness", description="Transport category airplanes")
+
+        assert regulation_search_index._stale
+
+    def test_repository_layer_does_not_import_search_or_ai(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, src.repositories; "
+             "print(sorted(m for m in ('src.services.regulation_search', 'src.services.aviation_ai_service') if m in sys.modules))"],
+            capture_output=True, text=True, check=True,
+        )
+
+        assert completed.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,76 @@
+"""
+Unit tests for the pre-serialized compliance report cache.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from src.config import settings
+from src.models.compliance import ComplianceCheck, ComplianceReport
+from src.services.cache_service import cache_service
+from src.services.enhanced_compliance_service import (
+    EnhancedComplianceService, report_cache_key, report_status, serialize_report
+)
+
+
+@pytest.fixture
+def report():
+    return ComplianceReport(
+        aircraft_model="E175",
+        country="USA",
+        overall_status="PARTIAL_COMPLIANCE",
+        total_checks=1,
+        compliant_checks=0,
+        non_compliant_checks=1,
+        critical_issues=0,
+        checks=[ComplianceCheck(
+            regulation_reference="14 CFR 25.571",
+            regulation_title="Damage tolerance – fatigue evaluation",
+            status="PARTIAL_COMPLIANCE",
+            severity="MAJOR",
+            findings=["Inspection interval under review"],
+        )],
+        recommendations=["Schedule FAA validation meeting"],
+    )
+
+
+@pytest.fixture
+def cache_enabled():
+    with patch.object(settings, "cache_enabled", True), patch.object(cache_service, "_is_connected", False):
+        yield
+    cache_service.clear_local("report:")
+
+
+class TestReportSerialization:
+    """Test the serialized body and its cache tier."""
+
+    def test_body_matches_fastapi_rendering(self, report):
+        body = serialize_report(report)
+
+        assert json.loads(body) == jsonable_encoder(report)
+        assert report_status(body) == "PARTIAL_COMPLIANCE"
+        assert report_status(b"{}") == "unknown"
+
+    async def test_bytes_round_trip_through_local_tier(self, cache_enabled):
+        assert await cache_service.set_bytes("report:E175:USA", b'{"a":1}', 60) is False
+        assert await cache_service.get_bytes("report:E175:USA") == b'{"a":1}'
+        assert await cache_service.get_bytes("report:E190:USA") is None
+
+    async def test_hit_skips_validation_and_returns_stored_bytes(self, report, cache_enabled, sqlite_session_factory):
+        body = serialize_report(report)
+        await cache_service.set_bytes(report_cache_key("E175", "USA"), body, 60)
+
+        async with sqlite_session_factory() as session:
+            service = EnhancedComplianceService(session)
+            with patch.object(service, "validate_input", AsyncMock(side_effect=AssertionError("validated"))):
+                assert await service.check_compliance_json("E175", "USA") is body
+                assert await service.check_compliance("E175", "USA") == report
+
+    async def test_invalidation_drops_serialized_report(self, report, cache_enabled):
+        await cache_service.set_bytes(report_cache_key("E175", "USA"), serialize_report(report), 60)
+
+        assert await cache_service.invalidate_compliance_result("e175", "usa") is True
+        assert await cache_service.get_bytes(report_cache_key("E175", "USA")) is None
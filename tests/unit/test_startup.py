@@ -0,0 +1,41 @@
+"""
+Unit tests for the application's import-time footprint.
+"""
+
+import json
+import subprocess
+import sys
+
+
+def test_importing_the_app_skips_heavy_optional_packages():
+    completed = subprocess.run(
+        [sys.executable, "-m", "scripts.benchmark_startup", "--child"],
+        capture_output=True, text=True, check=True,
+    )
+    sample = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert sample["heavy_modules"] == [], f"imported at startup: {sample['heavy_modules']}"
+
+
+def test_startup_and_health_check_leave_the_ai_service_unloaded():
+    script = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from src.main import app\n"
+        "with TestClient(app) as client:\n"
+        "    status = client.get('/health').json()['ai_models']['status']\n"
+        "print(status, 'src.services.aviation_ai_service' in sys.modules)\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert completed.stdout.strip().splitlines()[-1] == "not_started False"
+
+
+def test_importing_the_ai_service_skips_numpy():
+    # The optional startup warm-up imports it; numpy is only needed once the similarity model loads
+    completed = subprocess.run(
+        [sys.executable, "-c", "import sys, src.services.aviation_ai_service; print('numpy' in sys.modules)"],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert completed.stdout.strip().splitlines()[-1] == "False"